@@ -0,0 +1,28 @@
+"""Add composite index for website ICP listings.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_icps_website_active_sequence",
+        "icps",
+        ["website_id", "is_active", "sequence_number"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_icps_website_active_sequence", table_name="icps")
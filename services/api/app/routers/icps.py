@@ -13,6 +13,7 @@ from shared.models import ICP
 from shared.queue.celery_app import celery_app
 
 from services.api.app.dependencies import CurrentWebsite, DBSession
+from services.icp_generator.cache import invalidate_icp_lists
 
 router = APIRouter()
 
@@ -142,6 +143,10 @@ async def update_icp(
     if request.is_active is not None:
         icp.is_active = request.is_active
 
+    # Commit before dropping the ICP service's cached lists for this website
+    await db.commit()
+    await invalidate_icp_lists(website.id)
+
     return ICPResponse.model_validate(icp)
 
 
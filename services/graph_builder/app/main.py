@@ -9,6 +9,7 @@ from typing import Any
 
 from fastapi import FastAPI, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from shared.utils.logging import get_logger
 from shared.db.neo4j_client import Neo4jClient
@@ -51,16 +52,25 @@ async def lifespan(app: FastAPI):
 
     settings = get_settings()
     _neo4j_client = Neo4jClient(
-        uri=settings.NEO4J_URI,
-        username=settings.NEO4J_USER,
-        password=settings.NEO4J_PASSWORD,
+        uri=settings.neo4j_uri,
+        user=settings.neo4j_user,
+        password=settings.neo4j_password,
+        database=settings.neo4j_database,
     )
+    await _neo4j_client.connect()
 
     _graph_builder = GraphBuilder(_neo4j_client)
-    _query_builder = QueryBuilder(_neo4j_client)
+    _query_builder = QueryBuilder(
+        _neo4j_client,
+        parallel_runtime=settings.neo4j_parallel_runtime,
+    )
 
     # Initialize graph constraints and base nodes
     await _graph_builder.initialize_graph()
+    await _query_builder.ensure_indexes()
+    await _query_builder.detect_apoc()
+    if settings.app_debug:
+        await _query_builder.check_query_plans()
 
     logger.info("Knowledge Graph Builder service started")
 
@@ -69,7 +79,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Knowledge Graph Builder service...")
     if _neo4j_client:
-        await _neo4j_client.close()
+        await _neo4j_client.disconnect()
     logger.info("Knowledge Graph Builder service stopped")
 
 
@@ -78,6 +88,7 @@ app = FastAPI(
     description="Builds and queries the Neo4j knowledge graph for brand relationships, ICP concerns, and belief formations.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
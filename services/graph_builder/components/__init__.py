@@ -5,6 +5,7 @@ Knowledge Graph Builder Components.
 - NodeManager: Node creation and management
 - EdgeManager: Edge/relationship management
 - QueryBuilder: Graph query utilities
+- QueryCache: TTL + LRU cache for query results
 - BeliefClassifier: Belief type classification engine
 """
 
@@ -12,6 +13,7 @@ from services.graph_builder.components.builder import GraphBuilder
 from services.graph_builder.components.nodes import NodeManager
 from services.graph_builder.components.edges import EdgeManager
 from services.graph_builder.components.queries import QueryBuilder
+from services.graph_builder.components.cache import QueryCache
 from services.graph_builder.components.belief_classifier import BeliefClassifier
 
 __all__ = [
@@ -19,5 +21,6 @@ __all__ = [
     "NodeManager",
     "EdgeManager",
     "QueryBuilder",
+    "QueryCache",
     "BeliefClassifier",
 ]
@@ -14,6 +14,7 @@ from uuid import UUID
 from shared.utils.logging import get_logger
 from shared.db.neo4j_client import Neo4jClient
 
+from services.graph_builder.components.cache import bump_graph_version
 from services.graph_builder.components.nodes import NodeManager
 from services.graph_builder.components.edges import EdgeManager
 from services.graph_builder.components.belief_classifier import (
@@ -191,6 +192,7 @@ class GraphBuilder:
             errors.append(str(e))
             logger.error(f"Batch node creation error: {e}")
 
+        bump_graph_version()
         return BatchOperationResult(
             success=len(errors) == 0,
             created=total_created,
@@ -255,6 +257,7 @@ class GraphBuilder:
             errors.append(str(e))
             logger.error(f"Batch edge creation error: {e}")
 
+        bump_graph_version()
         return BatchOperationResult(
             success=len(errors) == 0,
             created=total_created,
@@ -329,6 +332,8 @@ class GraphBuilder:
                 errors=stats.errors,
                 build_duration_ms=stats.duration_ms,
             )
+        finally:
+            bump_graph_version()
 
     async def _build_icps(self, icps_data: list[dict], stats: BuildStats) -> None:
         """Build ICP nodes and their concerns."""
@@ -601,11 +606,12 @@ class GraphBuilder:
             count = await self.edge_manager.create_ignores_batch(ignores_edges)
             stats.edges_created += count
 
-        # Create co-mention edges
+        # Create co-mention edges. Every field is derived from the pair counts
+        # above, so skip validation on this hot path.
         if co_mention_pairs:
             co_mention_edges = []
             for (brand1, brand2, provider), count in co_mention_pairs.items():
-                co_mention_edges.append(CoMentionedEdge(
+                co_mention_edges.append(CoMentionedEdge.model_construct(
                     source_brand_id=brand1,
                     target_brand_id=brand2,
                     count=count,
@@ -648,6 +654,7 @@ class GraphBuilder:
             count=1,
         )
         result = await self.edge_manager.create_ranks_for(edge)
+        bump_graph_version()
         return result is not None
 
     async def add_belief_installation(
@@ -680,6 +687,7 @@ class GraphBuilder:
             confidence=confidence,
         )
         result = await self.edge_manager.create_installs_belief(edge)
+        bump_graph_version()
         return result is not None
 
     # =========================================================================
@@ -837,6 +845,7 @@ class GraphBuilder:
                 # Store in graph
                 await self.edge_manager.create_installs_belief(edge)
 
+        bump_graph_version()
         return edges
 
     # =========================================================================
@@ -864,6 +873,7 @@ class GraphBuilder:
         result = await self.client.execute_query(query, {"website_id": website_id})
         deleted = result[0]["deleted"] if result else 0
         logger.info(f"Cleared {deleted} nodes for website {website_id}")
+        bump_graph_version()
         return deleted
 
     async def clear_all(self) -> int:
@@ -881,4 +891,5 @@ class GraphBuilder:
         result = await self.client.execute_query(query, {})
         deleted = result[0]["deleted"] if result else 0
         logger.warning(f"Cleared all {deleted} nodes from graph")
+        bump_graph_version()
         return deleted
@@ -0,0 +1,135 @@
+"""
+Query Result Cache for Knowledge Graph Builder.
+
+The knowledge graph is read far more often than it is written, so the
+read-heavy QueryBuilder methods keep their results in an in-process
+TTL + LRU cache. Cache keys embed a graph version that GraphBuilder bumps
+after every write, so results computed before an ingest are never served
+after it. Writes made by other processes are picked up once the TTL expires.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from enum import Enum
+from functools import wraps
+from typing import Any
+
+_graph_version = 0
+_MISSING = object()
+
+
+def get_graph_version() -> int:
+    """Get the current in-process graph version."""
+    return _graph_version
+
+
+def bump_graph_version() -> int:
+    """
+    Mark the graph as changed, invalidating all cached query results.
+
+    Returns:
+        The new graph version.
+    """
+    global _graph_version
+    _graph_version += 1
+    return _graph_version
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert query arguments into a hashable cache key component."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+class QueryCache:
+    """
+    TTL + LRU cache for query results.
+
+    Entries expire after ``ttl_seconds`` and the least recently used entry
+    is evicted once ``maxsize`` entries are stored.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, maxsize: int = 1024):
+        """
+        Initialize QueryCache.
+
+        Args:
+            ttl_seconds: Seconds a cached result stays valid.
+            maxsize: Maximum number of cached results.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value, dropping it if it has expired.
+
+        Args:
+            key: Cache key.
+            default: Value returned on a miss.
+
+        Returns:
+            Cached value, or default on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
+
+
+def cached_query(
+    method: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """
+    Cache an async query method's results in its instance's ``_cache``.
+
+    The key is the method name, the current graph version and the call
+    arguments, so any write through GraphBuilder makes older entries miss.
+    """
+
+    @wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        key = (method.__name__, _graph_version, _freeze(args), _freeze(kwargs))
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = await method(self, *args, **kwargs)
+            self._cache.set(key, value)
+        return value
+
+    return wrapper
@@ -6,6 +6,8 @@ Handles creation, update, and retrieval of all relationship types in Neo4j.
 
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from shared.utils.logging import get_logger
 from shared.db.neo4j_client import Neo4jClient
 
@@ -24,6 +26,18 @@ from services.graph_builder.schemas import (
 
 logger = get_logger(__name__)
 
+# Batch payloads are serialized with one pydantic-core call per list; JSON
+# mode emits enum values, which is what the Cypher parameters expect.
+_CO_MENTIONED_EDGES = TypeAdapter(list[CoMentionedEdge])
+_HAS_CONCERN_EDGES = TypeAdapter(list[HasConcernEdge])
+_INITIATES_EDGES = TypeAdapter(list[InitiatesEdge])
+_TRIGGERS_EDGES = TypeAdapter(list[TriggersEdge])
+_CONTAINS_EDGES = TypeAdapter(list[ContainsEdge])
+_RANKS_FOR_EDGES = TypeAdapter(list[RanksForEdge])
+_INSTALLS_BELIEF_EDGES = TypeAdapter(list[InstallsBeliefEdge])
+_RECOMMENDS_EDGES = TypeAdapter(list[RecommendsEdge])
+_IGNORES_EDGES = TypeAdapter(list[IgnoresEdge])
+
 
 class EdgeManager:
     """
@@ -106,7 +120,7 @@ class EdgeManager:
             query,
             {"brand_id": brand_id, "llm_provider": llm_provider, "limit": limit}
         )
-        return [dict(r) for r in result] if result else []
+        return result or []
 
     async def create_co_mentions_batch(self, edges: list[CoMentionedEdge]) -> int:
         """Create multiple CO_MENTIONED relationships in batch."""
@@ -124,7 +138,7 @@ class EdgeManager:
             r.updated_at = datetime()
         RETURN count(r) as count
         """
-        edges_data = [e.model_dump() for e in edges]
+        edges_data = _CO_MENTIONED_EDGES.dump_python(edges, mode="json")
         result = await self.client.execute_query(query, {"edges": edges_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created/updated {count} CO_MENTIONED edges")
@@ -160,7 +174,7 @@ class EdgeManager:
                r.relationship_type as relationship_type
         """
         result = await self.client.execute_query(query, {"brand_id": brand_id})
-        return [dict(r) for r in result] if result else []
+        return result or []
 
     # =========================================================================
     # HAS_CONCERN EDGES (ICP -> Concern)
@@ -192,7 +206,7 @@ class EdgeManager:
         ORDER BY r.priority
         """
         result = await self.client.execute_query(query, {"icp_id": icp_id})
-        return [dict(r) for r in result] if result else []
+        return result or []
 
     async def create_has_concerns_batch(self, edges: list[HasConcernEdge]) -> int:
         """Create multiple HAS_CONCERN relationships in batch."""
@@ -205,7 +219,7 @@ class EdgeManager:
             r.updated_at = datetime()
         RETURN count(r) as count
         """
-        edges_data = [e.model_dump() for e in edges]
+        edges_data = _HAS_CONCERN_EDGES.dump_python(edges, mode="json")
         result = await self.client.execute_query(query, {"edges": edges_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created/updated {count} HAS_CONCERN edges")
@@ -241,7 +255,7 @@ class EdgeManager:
         SET r.updated_at = datetime()
         RETURN count(r) as count
         """
-        edges_data = [e.model_dump() for e in edges]
+        edges_data = _INITIATES_EDGES.dump_python(edges, mode="json")
         result = await self.client.execute_query(query, {"edges": edges_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created {count} INITIATES edges")
@@ -277,7 +291,7 @@ class EdgeManager:
         SET r.updated_at = datetime()
         RETURN count(r) as count
         """
-        edges_data = [e.model_dump() for e in edges]
+        edges_data = _TRIGGERS_EDGES.dump_python(edges, mode="json")
         result = await self.client.execute_query(query, {"edges": edges_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created {count} TRIGGERS edges")
@@ -313,7 +327,7 @@ class EdgeManager:
         SET r.updated_at = datetime()
         RETURN count(r) as count
         """
-        edges_data = [e.model_dump() for e in edges]
+        edges_data = _CONTAINS_EDGES.dump_python(edges, mode="json")
         result = await self.client.execute_query(query, {"edges": edges_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created {count} CONTAINS edges")
@@ -370,7 +384,7 @@ class EdgeManager:
             query,
             {"intent_id": intent_id, "llm_provider": llm_provider}
         )
-        return [dict(r) for r in result] if result else []
+        return result or []
 
     async def create_ranks_for_batch(self, edges: list[RanksForEdge]) -> int:
         """Create multiple RANKS_FOR relationships in batch."""
@@ -389,11 +403,7 @@ class EdgeManager:
             r.updated_at = datetime()
         RETURN count(r) as count
         """
-        edges_data = []
-        for e in edges:
-            data = e.model_dump()
-            data["presence"] = e.presence.value
-            edges_data.append(data)
+        edges_data = _RANKS_FOR_EDGES.dump_python(edges, mode="json")
         result = await self.client.execute_query(query, {"edges": edges_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created/updated {count} RANKS_FOR edges")
@@ -452,7 +462,7 @@ class EdgeManager:
             query,
             {"brand_id": brand_id, "llm_provider": llm_provider}
         )
-        return [dict(r) for r in result] if result else []
+        return result or []
 
     async def create_installs_beliefs_batch(self, edges: list[InstallsBeliefEdge]) -> int:
         """Create multiple INSTALLS_BELIEF relationships in batch."""
@@ -473,11 +483,7 @@ class EdgeManager:
             r.updated_at = datetime()
         RETURN count(r) as count
         """
-        edges_data = []
-        for e in edges:
-            data = e.model_dump()
-            data["belief_type"] = e.belief_type.value
-            edges_data.append(data)
+        edges_data = _INSTALLS_BELIEF_EDGES.dump_python(edges, mode="json")
         result = await self.client.execute_query(query, {"edges": edges_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created/updated {count} INSTALLS_BELIEF edges")
@@ -524,7 +530,7 @@ class EdgeManager:
             query,
             {"llm_provider": llm_provider, "llm_model": llm_model, "intent_id": intent_id}
         )
-        return [dict(r) for r in result] if result else []
+        return result or []
 
     async def create_recommends_batch(self, edges: list[RecommendsEdge]) -> int:
         """Create multiple RECOMMENDS relationships in batch."""
@@ -538,11 +544,7 @@ class EdgeManager:
             r.updated_at = datetime()
         RETURN count(r) as count
         """
-        edges_data = []
-        for e in edges:
-            data = e.model_dump()
-            data["belief_type"] = e.belief_type.value if e.belief_type else None
-            edges_data.append(data)
+        edges_data = _RECOMMENDS_EDGES.dump_python(edges, mode="json")
         result = await self.client.execute_query(query, {"edges": edges_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created {count} RECOMMENDS edges")
@@ -585,7 +587,7 @@ class EdgeManager:
             query,
             {"brand_id": brand_id, "llm_provider": llm_provider}
         )
-        return [dict(r) for r in result] if result else []
+        return result or []
 
     async def create_ignores_batch(self, edges: list[IgnoresEdge]) -> int:
         """Create multiple IGNORES relationships in batch."""
@@ -598,7 +600,7 @@ class EdgeManager:
             r.updated_at = datetime()
         RETURN count(r) as count
         """
-        edges_data = [e.model_dump() for e in edges]
+        edges_data = _IGNORES_EDGES.dump_python(edges, mode="json")
         result = await self.client.execute_query(query, {"edges": edges_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created {count} IGNORES edges")
@@ -6,6 +6,8 @@ Handles creation, update, and retrieval of all node types in Neo4j.
 
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from shared.utils.logging import get_logger
 from shared.db.neo4j_client import Neo4jClient
 
@@ -22,6 +24,15 @@ from services.graph_builder.schemas import (
 
 logger = get_logger(__name__)
 
+# Batch payloads are serialized with one pydantic-core call per list; JSON
+# mode emits enum values, which is what the Cypher parameters expect.
+_BRAND_NODES = TypeAdapter(list[BrandNode])
+_ICP_NODES = TypeAdapter(list[ICPNode])
+_INTENT_NODES = TypeAdapter(list[IntentNode])
+_CONCERN_NODES = TypeAdapter(list[ConcernNode])
+_LLM_PROVIDER_NODES = TypeAdapter(list[LLMProviderNode])
+_CONVERSATION_NODES = TypeAdapter(list[ConversationNode])
+
 
 class NodeManager:
     """
@@ -120,7 +131,7 @@ class NodeManager:
             b.updated_at = datetime()
         RETURN count(b) as count
         """
-        brands_data = [b.model_dump() for b in brands]
+        brands_data = _BRAND_NODES.dump_python(brands, mode="json")
         result = await self.client.execute_query(query, {"brands": brands_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created/updated {count} Brand nodes")
@@ -183,7 +194,7 @@ class NodeManager:
             i.updated_at = datetime()
         RETURN count(i) as count
         """
-        icps_data = [i.model_dump() for i in icps]
+        icps_data = _ICP_NODES.dump_python(icps, mode="json")
         result = await self.client.execute_query(query, {"icps": icps_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created/updated {count} ICP nodes")
@@ -240,12 +251,7 @@ class NodeManager:
             i.updated_at = datetime()
         RETURN count(i) as count
         """
-        intents_data = []
-        for intent in intents:
-            data = intent.model_dump()
-            data["intent_type"] = intent.intent_type.value
-            data["funnel_stage"] = intent.funnel_stage.value
-            intents_data.append(data)
+        intents_data = _INTENT_NODES.dump_python(intents, mode="json")
         result = await self.client.execute_query(query, {"intents": intents_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created/updated {count} Intent nodes")
@@ -292,7 +298,7 @@ class NodeManager:
             c.updated_at = datetime()
         RETURN count(c) as count
         """
-        concerns_data = [c.model_dump() for c in concerns]
+        concerns_data = _CONCERN_NODES.dump_python(concerns, mode="json")
         result = await self.client.execute_query(query, {"concerns": concerns_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created/updated {count} Concern nodes")
@@ -370,7 +376,7 @@ class NodeManager:
         SET l.updated_at = datetime()
         RETURN count(l) as count
         """
-        providers_data = [p.model_dump() for p in providers]
+        providers_data = _LLM_PROVIDER_NODES.dump_python(providers, mode="json")
         result = await self.client.execute_query(query, {"providers": providers_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created/updated {count} LLMProvider nodes")
@@ -417,7 +423,7 @@ class NodeManager:
             c.updated_at = datetime()
         RETURN count(c) as count
         """
-        conversations_data = [c.model_dump() for c in conversations]
+        conversations_data = _CONVERSATION_NODES.dump_python(conversations, mode="json")
         result = await self.client.execute_query(query, {"conversations": conversations_data})
         count = result[0]["count"] if result else 0
         logger.info(f"Batch created/updated {count} Conversation nodes")
@@ -9,11 +9,15 @@ Provides high-level graph query utilities for:
 - Competitive analysis
 """
 
+from functools import lru_cache
 from typing import Any
 
+from neo4j import READ_ACCESS
+
 from shared.utils.logging import get_logger
 from shared.db.neo4j_client import Neo4jClient
 
+from services.graph_builder.components.cache import QueryCache, cached_query
 from services.graph_builder.schemas import (
     BeliefMapResponse,
     CoMentionResponse,
@@ -25,6 +29,577 @@ from services.graph_builder.schemas import (
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _normalize(name: str) -> str:
+    """Normalize a brand name for Brand.normalized_name lookups."""
+    return name.lower().strip()
+
+
+# Cypher parameter value for each optional intent type filter
+_INTENT_TYPE_VALUES: dict[IntentTypeEnum | None, str | None] = {
+    None: None,
+    **{intent_type: intent_type.value for intent_type in IntentTypeEnum},
+}
+
+
+# =========================================================================
+# CYPHER QUERIES
+# =========================================================================
+# Query text is kept constant so Neo4j can reuse cached execution plans;
+# optional filters are passed as nullable parameters instead of being
+# concatenated into the query. Intent lookups go through Intent.id so the
+# planner can use the intent_id constraint index (see
+# GraphBuilder.initialize_graph and shared.db.neo4j_schema.INDEXES).
+
+# Prepended to whole-graph aggregations when the parallel runtime is enabled
+# (Neo4j Enterprise 5.13+). Point lookups stay on the default runtime.
+_PARALLEL_RUNTIME_PREFIX = "CYPHER runtime=parallel"
+
+_BELIEF_MAP_CYPHER = """
+    MATCH (b:Brand {normalized_name: $normalized_name})-[r:INSTALLS_BELIEF]->(bt:BeliefType)
+    WHERE ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
+    AND ($intent_type IS NULL OR EXISTS {
+        MATCH (i:Intent {id: r.intent_id})
+        WHERE i.intent_type = $intent_type
+    })
+    RETURN bt.type as belief_type,
+           sum(r.count) as total_count,
+           coalesce(round(avg(r.confidence), 3), 0) as avg_confidence
+    ORDER BY total_count DESC
+"""
+
+_BELIEF_COMPARISON_CYPHER = """
+    MATCH (b:Brand)-[r:INSTALLS_BELIEF]->(bt:BeliefType)
+    WHERE b.normalized_name IN $normalized_names
+    AND ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
+    WITH b.name as brand_name,
+         bt.type as belief_type,
+         sum(r.count) as count,
+         coalesce(round(avg(r.confidence), 3), 0) as confidence
+    ORDER BY brand_name, count DESC
+    RETURN brand_name,
+           collect({belief_type: belief_type, count: count, confidence: confidence}) as beliefs
+"""
+
+_BELIEF_BY_FUNNEL_STAGE_CYPHER = """
+    MATCH (b:Brand)-[r:INSTALLS_BELIEF]->(bt:BeliefType)
+    MATCH (i:Intent {id: r.intent_id})
+    WHERE ($normalized_name IS NULL OR b.normalized_name = $normalized_name)
+    AND ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
+    WITH i.funnel_stage as funnel_stage,
+         bt.type as belief_type,
+         sum(r.count) as total_count,
+         coalesce(round(avg(r.confidence), 3), 0) as avg_confidence,
+         count(DISTINCT b) as brand_count
+    RETURN funnel_stage,
+           collect({
+               belief_type: belief_type,
+               count: total_count,
+               confidence: avg_confidence,
+               brand_count: brand_count
+           }) as beliefs,
+           sum(total_count) as stage_total
+    ORDER BY CASE funnel_stage
+        WHEN 'awareness' THEN 1
+        WHEN 'consideration' THEN 2
+        WHEN 'decision' THEN 3
+        WHEN 'retention' THEN 4
+        ELSE 5
+    END
+"""
+
+# Belief map, recommendation effectiveness and provider consistency for a
+# single brand, computed from one expansion of its INSTALLS_BELIEF edges.
+# Consistency spans all providers; the other two honour $llm_provider.
+_BRAND_BELIEF_PROFILE_CYPHER = """
+    MATCH (b:Brand {normalized_name: $normalized_name})-[r:INSTALLS_BELIEF]->(bt:BeliefType)
+    OPTIONAL MATCH (:LLMProvider)-[rec:RECOMMENDS]->(b)
+    WHERE rec.intent_id = r.intent_id
+    WITH bt.type as belief_type,
+         r,
+         count(rec) as rec_count,
+         ($llm_provider IS NULL OR r.llm_provider = $llm_provider) as in_filter
+
+    WITH belief_type,
+         r.llm_provider as provider,
+         sum(r.count) as count,
+         avg(r.confidence) as confidence,
+         sum(CASE WHEN in_filter THEN r.count ELSE 0 END) as filtered_count,
+         sum(CASE WHEN in_filter THEN 1 ELSE 0 END) as filtered_edges,
+         sum(CASE WHEN in_filter THEN r.confidence ELSE 0 END) as filtered_confidence,
+         sum(CASE WHEN in_filter THEN rec_count ELSE 0 END) as recommendations,
+         sum(CASE WHEN in_filter THEN r.confidence * rec_count ELSE 0 END) as recommended_confidence
+
+    WITH belief_type,
+         collect({
+             provider: provider,
+             count: count,
+             confidence: coalesce(round(confidence, 3), 0)
+         }) as by_provider,
+         count(DISTINCT provider) as provider_count,
+         sum(filtered_count) as total_count,
+         sum(filtered_edges) as filtered_edges,
+         sum(filtered_confidence) as filtered_confidence,
+         sum(recommendations) as recommendations,
+         sum(recommended_confidence) as recommended_confidence
+
+    RETURN belief_type,
+           by_provider,
+           provider_count,
+           total_count,
+           filtered_edges,
+           recommendations,
+           CASE WHEN filtered_edges > 0
+                THEN round(filtered_confidence / filtered_edges, 3)
+                ELSE 0 END as avg_confidence,
+           CASE WHEN recommendations > 0
+                THEN round(recommended_confidence / recommendations, 3)
+                ELSE 0 END as recommended_confidence
+    ORDER BY total_count DESC
+"""
+
+_BELIEF_TRENDS_CYPHER = """
+    MATCH (b:Brand)-[r:INSTALLS_BELIEF]->(bt:BeliefType)
+    WHERE ($brand_names IS NULL OR b.normalized_name IN $brand_names)
+    AND ($llm_providers IS NULL OR r.llm_provider IN $llm_providers)
+    WITH bt.type as belief_type,
+         sum(r.count) as total_installations,
+         coalesce(round(avg(r.confidence), 3), 0) as avg_confidence,
+         count(DISTINCT b) as brand_count,
+         count(DISTINCT r.llm_provider) as provider_count,
+         collect(DISTINCT b.name)[0..5] as sample_brands
+    ORDER BY total_installations DESC
+    WITH collect({
+             belief_type: belief_type,
+             total_installations: total_installations,
+             avg_confidence: avg_confidence,
+             brand_count: brand_count,
+             provider_count: provider_count,
+             sample_brands: sample_brands
+         }) as rows,
+         sum(total_installations) as total
+    RETURN [row IN rows | row {
+               .*,
+               percentage: CASE WHEN total > 0
+                                THEN round(100.0 * row.total_installations / total, 1)
+                                ELSE 0 END
+           }] as trends,
+           total as total_installations
+"""
+
+_BELIEF_EFFECTIVENESS_ANALYSIS_CYPHER = """
+    MATCH (b:Brand)-[belief:INSTALLS_BELIEF]->(bt:BeliefType)
+    WHERE ($belief_type IS NULL OR bt.type = $belief_type)
+    AND ($llm_provider IS NULL OR belief.llm_provider = $llm_provider)
+
+    // Get ranking info for same brand/intent
+    OPTIONAL MATCH (b)-[rank:RANKS_FOR]->(:Intent {id: belief.intent_id})
+    WHERE rank.llm_provider = belief.llm_provider
+
+    WITH bt.type as belief_type,
+         b.name as brand_name,
+         belief.confidence as belief_confidence,
+         rank.position as position,
+         rank.presence as presence,
+         belief.count as belief_count
+
+    WITH belief_type,
+         count(DISTINCT brand_name) as brand_count,
+         sum(belief_count) as total_installations,
+         avg(belief_confidence) as avg_belief_confidence,
+         avg(CASE WHEN position IS NOT NULL THEN position END) as avg_position,
+         sum(CASE WHEN presence = 'recommended' THEN 1 ELSE 0 END) as recommendations,
+         sum(CASE WHEN position = 1 THEN 1 ELSE 0 END) as first_positions
+
+    WITH belief_type,
+         brand_count,
+         total_installations,
+         avg_belief_confidence,
+         avg_position,
+         recommendations,
+         first_positions,
+         CASE WHEN total_installations > 0
+              THEN round(toFloat(recommendations) / total_installations * 100, 1)
+              ELSE 0 END as recommendation_rate,
+         CASE WHEN total_installations > 0
+              THEN round(toFloat(first_positions) / total_installations * 100, 1)
+              ELSE 0 END as first_position_rate
+
+    RETURN {
+               belief_type: belief_type,
+               brand_count: brand_count,
+               total_installations: total_installations,
+               avg_confidence: coalesce(round(avg_belief_confidence, 3), 0),
+               avg_position: round(avg_position, 2),
+               recommendations: recommendations,
+               first_positions: first_positions,
+               recommendation_rate: recommendation_rate,
+               first_position_rate: first_position_rate
+           } as item
+    ORDER BY recommendation_rate DESC
+"""
+
+_CO_MENTIONS_CYPHER = """
+    MATCH (:Brand {normalized_name: $normalized_name})-[r:CO_MENTIONED]-(other:Brand)
+    WHERE $llm_provider IS NULL OR r.llm_provider = $llm_provider
+    RETURN {
+               brand_name: other.name,
+               normalized_name: other.normalized_name,
+               count: r.count,
+               avg_position_delta: round(r.avg_position_delta, 2),
+               llm_provider: r.llm_provider
+           } as item
+    ORDER BY r.count DESC
+    LIMIT $limit
+"""
+
+# Variable-length bounds cannot be passed as parameters, so the depth is
+# inlined after clamping. Traversal state grows exponentially with the bound,
+# hence the hard cap; one query text is prebuilt per allowed depth.
+_MAX_CO_MENTION_DEPTH = 3
+
+_CO_MENTION_NETWORK_CYPHER_TEMPLATE = """
+    MATCH (center:Brand {normalized_name: $normalized_name})-[rels:CO_MENTIONED*1..%d]-(other:Brand)
+    WHERE ALL(r IN rels WHERE r.count >= $min_count)
+    // Every prefix of a matched path is matched too, so the path endpoints and
+    // last hops already cover every node and edge in the network
+    WITH center,
+         collect(DISTINCT other) as others,
+         collect(DISTINCT last(rels)) as edge_rels
+    RETURN [n IN [center] + [o IN others WHERE o <> center] | {
+               id: n.id,
+               name: n.name,
+               normalized_name: n.normalized_name
+           }] as nodes,
+           [r IN edge_rels | {
+               source: startNode(r).normalized_name,
+               target: endNode(r).normalized_name,
+               count: r.count
+           }] as edges
+"""
+
+_CO_MENTION_NETWORK_CYPHER = {
+    depth: _CO_MENTION_NETWORK_CYPHER_TEMPLATE % depth
+    for depth in range(1, _MAX_CO_MENTION_DEPTH + 1)
+}
+
+_ICP_CYPHER = """
+    MATCH (i:ICP {id: $icp_id})
+    RETURN i.name as name, i.pain_points as pain_points, i.goals as goals
+"""
+
+_ICP_CONCERNS_CYPHER = """
+    MATCH (i:ICP {id: $icp_id})-[hc:HAS_CONCERN]->(c:Concern)
+    OPTIONAL MATCH (c)-[:TRIGGERS]->(intent:Intent)
+    RETURN c.id as concern_id,
+           c.description as description,
+           c.category as category,
+           hc.priority as priority,
+           collect(DISTINCT {
+               id: intent.id,
+               intent_type: intent.intent_type,
+               funnel_stage: intent.funnel_stage,
+               buying_signal: intent.buying_signal
+           }) as intents
+    ORDER BY hc.priority
+"""
+
+_ICP_BRAND_RECOMMENDATIONS_CYPHER = """
+    MATCH (b:Brand)-[r:RANKS_FOR]->(i:Intent)
+    WHERE i.id IN $intent_ids
+    RETURN b.name as brand_name,
+           b.id as brand_id,
+           i.id as intent_id,
+           i.intent_type as intent_type,
+           r.position as position,
+           r.presence as presence,
+           r.llm_provider as llm_provider
+    ORDER BY r.position
+"""
+
+_SUBSTITUTION_PATTERNS_CYPHER = """
+    // Find (provider, intent) pairs where the brand was ignored
+    MATCH (llm:LLMProvider)-[ignore:IGNORES]->(:Brand {normalized_name: $normalized_name})
+    WHERE $llm_provider IS NULL OR llm.name = $llm_provider
+    WITH collect(DISTINCT {llm: llm, intent_id: ignore.intent_id}) as ignored
+
+    // Find brands recommended for those same intents, one pair at a time
+    UNWIND ignored as pair
+    WITH pair.llm as llm, pair.intent_id as intent_id
+    MATCH (llm)-[rec:RECOMMENDS]->(substitute:Brand)
+    WHERE rec.intent_id = intent_id
+    AND substitute.normalized_name <> $normalized_name
+
+    WITH substitute,
+         count(*) as substitution_count,
+         avg(rec.position) as avg_position,
+         collect(DISTINCT llm.name) as llm_providers
+    RETURN {
+               brand_name: substitute.name,
+               brand_id: substitute.id,
+               substitution_count: substitution_count,
+               avg_position: round(avg_position, 1),
+               llm_providers: llm_providers
+           } as item
+    ORDER BY substitution_count DESC
+    LIMIT $limit
+"""
+
+_SHARE_OF_VOICE_CYPHER = """
+    MATCH (b:Brand)-[r:RANKS_FOR]->(:Intent)
+    WHERE b.normalized_name IN $normalized_names
+    AND ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
+    WITH b.name as brand_name,
+         count(r) as total_mentions,
+         sum(CASE WHEN r.position = 1 THEN 1 ELSE 0 END) as first_positions,
+         sum(CASE WHEN r.presence = 'recommended' THEN 1 ELSE 0 END) as recommendations,
+         avg(r.position) as avg_position
+    WITH collect({
+             brand_name: brand_name,
+             total_mentions: total_mentions,
+             first_positions: first_positions,
+             recommendations: recommendations,
+             avg_position: avg_position
+         }) as rows,
+         sum(total_mentions) as grand_total
+    UNWIND rows as row
+    RETURN row.brand_name as brand_name,
+           {
+               total_mentions: row.total_mentions,
+               first_positions: row.first_positions,
+               recommendations: row.recommendations,
+               avg_position: round(row.avg_position * 10) / 10,
+               first_position_rate: round(toFloat(row.first_positions) / row.total_mentions * 100),
+               recommendation_rate: round(toFloat(row.recommendations) / row.total_mentions * 100),
+               share_of_voice: round(100.0 * row.total_mentions / grand_total, 1)
+           } as item
+    ORDER BY row.total_mentions DESC
+"""
+
+# Competitors, their share of voice and the brand's co-mentions in one
+# round-trip. The subqueries mirror _SHARE_OF_VOICE_CYPHER and
+# _CO_MENTIONS_CYPHER; their aggregations always yield a single row, so an
+# empty section does not drop the whole result.
+_COMPETITIVE_LANDSCAPE_CYPHER = """
+    MATCH (b:Brand {normalized_name: $normalized_name})
+    WITH b, [(b)-[r:COMPETES_WITH]->(c:Brand) | {
+             name: c.name,
+             id: c.id,
+             relationship_type: r.relationship_type,
+             normalized_name: c.normalized_name
+         }] as competitors
+    WITH b, competitors,
+         [b.normalized_name] + [c IN competitors | c.normalized_name] as sov_names
+    CALL {
+        WITH sov_names
+        MATCH (sb:Brand)-[r:RANKS_FOR]->(:Intent)
+        WHERE sb.normalized_name IN sov_names
+        AND ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
+        WITH sb.name as brand_name,
+             count(r) as total_mentions,
+             sum(CASE WHEN r.position = 1 THEN 1 ELSE 0 END) as first_positions,
+             sum(CASE WHEN r.presence = 'recommended' THEN 1 ELSE 0 END) as recommendations,
+             avg(r.position) as avg_position
+        ORDER BY total_mentions DESC
+        WITH collect({
+                 brand_name: brand_name,
+                 total_mentions: total_mentions,
+                 first_positions: first_positions,
+                 recommendations: recommendations,
+                 avg_position: avg_position
+             }) as rows,
+             sum(total_mentions) as grand_total
+        RETURN [row IN rows | {
+                   brand_name: row.brand_name,
+                   item: {
+                       total_mentions: row.total_mentions,
+                       first_positions: row.first_positions,
+                       recommendations: row.recommendations,
+                       avg_position: round(row.avg_position * 10) / 10,
+                       first_position_rate: round(toFloat(row.first_positions) / row.total_mentions * 100),
+                       recommendation_rate: round(toFloat(row.recommendations) / row.total_mentions * 100),
+                       share_of_voice: round(100.0 * row.total_mentions / grand_total, 1)
+                   }
+               }] as share_of_voice
+    }
+    CALL {
+        WITH b
+        MATCH (b)-[r:CO_MENTIONED]-(other:Brand)
+        WHERE $llm_provider IS NULL OR r.llm_provider = $llm_provider
+        WITH r, other
+        ORDER BY r.count DESC
+        LIMIT $co_mention_limit
+        RETURN collect({
+                   brand_name: other.name,
+                   normalized_name: other.normalized_name,
+                   count: r.count,
+                   avg_position_delta: round(r.avg_position_delta, 2),
+                   llm_provider: r.llm_provider
+               }) as co_mentions
+    }
+    RETURN [c IN competitors | c {.name, .id, .relationship_type}] as competitors,
+           share_of_voice,
+           co_mentions
+"""
+
+# Nullable-parameter filters cannot be planned as index seeks, so the intent
+# filters are inlined as property maps and one query text is prebuilt per
+# combination of filters that are set.
+# top_brands is built in a LIMITed subquery so only five rows per intent
+# are ever collected, however many brands rank for it.
+_INTENT_BRAND_COVERAGE_CYPHER_TEMPLATE = """
+    MATCH (i:Intent%s)<-[r:RANKS_FOR]-(b:Brand)
+    WHERE $llm_provider IS NULL OR r.llm_provider = $llm_provider
+    WITH i, count(DISTINCT b) as brand_count
+    CALL {
+        WITH i
+        MATCH (i)<-[r:RANKS_FOR]-(b:Brand)
+        WHERE $llm_provider IS NULL OR r.llm_provider = $llm_provider
+        WITH DISTINCT b.name as name, r.position as position, r.presence as presence
+        ORDER BY position ASC
+        LIMIT 5
+        RETURN collect({name: name, position: position, presence: presence}) as top_brands
+    }
+    RETURN i.id as intent_id,
+           i.intent_type as intent_type,
+           i.funnel_stage as funnel_stage,
+           i.buying_signal as buying_signal,
+           brand_count,
+           top_brands
+    ORDER BY brand_count DESC
+"""
+
+_INTENT_BRAND_COVERAGE_CYPHER = {
+    (False, False): _INTENT_BRAND_COVERAGE_CYPHER_TEMPLATE % "",
+    (True, False): _INTENT_BRAND_COVERAGE_CYPHER_TEMPLATE % " {intent_type: $intent_type}",
+    (False, True): _INTENT_BRAND_COVERAGE_CYPHER_TEMPLATE % " {funnel_stage: $funnel_stage}",
+    (True, True): _INTENT_BRAND_COVERAGE_CYPHER_TEMPLATE
+    % " {intent_type: $intent_type, funnel_stage: $funnel_stage}",
+}
+
+# Node and edge counts in one round-trip. Each branch is a bare label or
+# relationship-type count, which Neo4j answers from its count store.
+_GRAPH_STATS_CYPHER = """
+    CALL {
+        MATCH (n:Brand) RETURN 'node' as kind, 'Brand' as name, count(n) as count
+        UNION ALL
+        MATCH (n:ICP) RETURN 'node' as kind, 'ICP' as name, count(n) as count
+        UNION ALL
+        MATCH (n:Intent) RETURN 'node' as kind, 'Intent' as name, count(n) as count
+        UNION ALL
+        MATCH (n:Concern) RETURN 'node' as kind, 'Concern' as name, count(n) as count
+        UNION ALL
+        MATCH (n:BeliefType) RETURN 'node' as kind, 'BeliefType' as name, count(n) as count
+        UNION ALL
+        MATCH (n:LLMProvider) RETURN 'node' as kind, 'LLMProvider' as name, count(n) as count
+        UNION ALL
+        MATCH (n:Conversation) RETURN 'node' as kind, 'Conversation' as name, count(n) as count
+        UNION ALL
+        MATCH ()-[r:CO_MENTIONED]->() RETURN 'edge' as kind, 'CO_MENTIONED' as name, count(r) as count
+        UNION ALL
+        MATCH ()-[r:COMPETES_WITH]->() RETURN 'edge' as kind, 'COMPETES_WITH' as name, count(r) as count
+        UNION ALL
+        MATCH ()-[r:HAS_CONCERN]->() RETURN 'edge' as kind, 'HAS_CONCERN' as name, count(r) as count
+        UNION ALL
+        MATCH ()-[r:TRIGGERS]->() RETURN 'edge' as kind, 'TRIGGERS' as name, count(r) as count
+        UNION ALL
+        MATCH ()-[r:RANKS_FOR]->() RETURN 'edge' as kind, 'RANKS_FOR' as name, count(r) as count
+        UNION ALL
+        MATCH ()-[r:INSTALLS_BELIEF]->() RETURN 'edge' as kind, 'INSTALLS_BELIEF' as name, count(r) as count
+        UNION ALL
+        MATCH ()-[r:RECOMMENDS]->() RETURN 'edge' as kind, 'RECOMMENDS' as name, count(r) as count
+        UNION ALL
+        MATCH ()-[r:IGNORES]->() RETURN 'edge' as kind, 'IGNORES' as name, count(r) as count
+    }
+    RETURN kind, name, count
+"""
+
+_GRAPH_STATS_NODE_LABELS = (
+    "Brand", "ICP", "Intent", "Concern", "BeliefType", "LLMProvider", "Conversation",
+)
+_GRAPH_STATS_EDGE_TYPES = (
+    "CO_MENTIONED", "COMPETES_WITH", "HAS_CONCERN", "TRIGGERS",
+    "RANKS_FOR", "INSTALLS_BELIEF", "RECOMMENDS", "IGNORES",
+)
+
+# When APOC is installed, all label and relationship-type counts come back
+# from a single procedure call as two maps.
+_APOC_META_STATS_CYPHER = """
+    CALL apoc.meta.stats() YIELD labels, relTypesCount
+    RETURN labels, relTypesCount
+"""
+
+_SHOW_APOC_META_STATS_CYPHER = """
+    SHOW PROCEDURES YIELD name
+    WHERE name = 'apoc.meta.stats'
+    RETURN name
+"""
+
+# Lookup indexes every query above anchors on, keyed by (label, properties).
+# Uniqueness constraints created by GraphBuilder.initialize_graph also
+# provide a backing index, so only indexes with no exact match are created.
+_REQUIRED_INDEXES = {
+    ("Brand", ("normalized_name",)): "brand_normalized_name_index",
+    ("Intent", ("id",)): "intent_id_index",
+    ("Intent", ("intent_type",)): "intent_intent_type_index",
+    ("Intent", ("funnel_stage",)): "intent_funnel_stage_index",
+    ("Intent", ("intent_type", "funnel_stage")): "intent_type_funnel_stage_index",
+    ("BeliefType", ("type",)): "belieftype_type_index",
+    ("ICP", ("id",)): "icp_id_index",
+}
+
+_SHOW_INDEXES_CYPHER = """
+    SHOW INDEXES YIELD labelsOrTypes, properties
+"""
+
+_AWAIT_INDEXES_CYPHER = """
+    CALL db.awaitIndexes($timeout_seconds)
+"""
+
+# Point-lookup queries that must be planned as index seeks, with the
+# parameters used to plan them
+_INDEXED_LOOKUP_QUERIES = {
+    "belief_map": (
+        _BELIEF_MAP_CYPHER,
+        {"normalized_name": "", "llm_provider": None, "intent_type": None},
+    ),
+    "brand_belief_profile": (
+        _BRAND_BELIEF_PROFILE_CYPHER,
+        {"normalized_name": "", "llm_provider": None},
+    ),
+    "co_mentions": (
+        _CO_MENTIONS_CYPHER,
+        {"normalized_name": "", "llm_provider": None, "limit": 1},
+    ),
+    "substitution_patterns": (
+        _SUBSTITUTION_PATTERNS_CYPHER,
+        {"normalized_name": "", "llm_provider": None, "limit": 1},
+    ),
+    "competitive_landscape": (
+        _COMPETITIVE_LANDSCAPE_CYPHER,
+        {"normalized_name": "", "llm_provider": None, "co_mention_limit": 1},
+    ),
+    "icp": (_ICP_CYPHER, {"icp_id": ""}),
+    "intent_brand_coverage": (
+        _INTENT_BRAND_COVERAGE_CYPHER[(True, True)],
+        {"intent_type": "", "funnel_stage": "", "llm_provider": None},
+    ),
+}
+
+
+def _find_label_scans(plan: dict[str, Any] | None) -> list[str]:
+    """Return the NodeByLabelScan operators found in a query plan tree."""
+    if not plan:
+        return []
+    scans = []
+    operator = plan.get("operatorType", "")
+    if operator.startswith("NodeByLabelScan"):
+        scans.append(operator)
+    for child in plan.get("children", []):
+        scans.extend(_find_label_scans(child))
+    return scans
+
+
 class QueryBuilder:
     """
     Builds and executes complex graph queries.
@@ -36,14 +611,36 @@ class QueryBuilder:
     - Substitution patterns: Who replaces whom when ignored
     """
 
-    def __init__(self, neo4j_client: Neo4jClient):
+    def __init__(
+        self,
+        neo4j_client: Neo4jClient,
+        parallel_runtime: bool = False,
+        cache_ttl_seconds: float = 60.0,
+        cache_maxsize: int = 1024,
+    ):
         """
         Initialize QueryBuilder.
 
         Args:
             neo4j_client: Neo4j client instance.
+            parallel_runtime: Run heavy aggregation queries on Neo4j's
+                parallel runtime (requires Enterprise 5.13+).
+            cache_ttl_seconds: Seconds cached query results stay valid.
+            cache_maxsize: Maximum number of cached query results.
         """
         self.client = neo4j_client
+        self._cache = QueryCache(ttl_seconds=cache_ttl_seconds, maxsize=cache_maxsize)
+        self._apoc_meta_stats = False
+
+        def heavy(query: str) -> str:
+            return f"{_PARALLEL_RUNTIME_PREFIX}{query}" if parallel_runtime else query
+
+        self._belief_by_funnel_stage_cypher = heavy(_BELIEF_BY_FUNNEL_STAGE_CYPHER)
+        self._belief_trends_cypher = heavy(_BELIEF_TRENDS_CYPHER)
+        self._belief_effectiveness_analysis_cypher = heavy(
+            _BELIEF_EFFECTIVENESS_ANALYSIS_CYPHER
+        )
+        self._share_of_voice_cypher = heavy(_SHARE_OF_VOICE_CYPHER)
 
     # =========================================================================
     # BELIEF MAP QUERIES
@@ -68,46 +665,29 @@ class QueryBuilder:
         Returns:
             BeliefMapResponse with belief distribution.
         """
-        query = """
-        MATCH (b:Brand {normalized_name: $normalized_name})-[r:INSTALLS_BELIEF]->(bt:BeliefType)
-        WHERE ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
-        """
-
-        # Add intent type filter if specified
-        if intent_type:
-            query += """
-            AND EXISTS {
-                MATCH (i:Intent {intent_type: $intent_type})
-                WHERE r.intent_id = i.id
-            }
-            """
-
-        query += """
-        RETURN bt.type as belief_type,
-               sum(r.count) as total_count,
-               avg(r.confidence) as avg_confidence
-        ORDER BY total_count DESC
-        """
-
         params = {
-            "normalized_name": brand_name.lower().strip(),
+            "normalized_name": _normalize(brand_name),
             "llm_provider": llm_provider,
-            "intent_type": intent_type.value if intent_type else None,
+            "intent_type": _INTENT_TYPE_VALUES[intent_type],
         }
 
-        result = await self.client.execute_query(query, params)
+        result = await self.client.execute_query(
+            _BELIEF_MAP_CYPHER,
+            params,
+            access_mode=READ_ACCESS,
+        )
 
         beliefs = []
         total = 0
         if result:
             for row in result:
-                belief_data = {
+                count = row["total_count"]
+                beliefs.append({
                     "belief_type": row["belief_type"],
-                    "count": row["total_count"],
-                    "confidence": round(row["avg_confidence"], 3) if row["avg_confidence"] else 0,
-                }
-                beliefs.append(belief_data)
-                total += row["total_count"]
+                    "count": count,
+                    "confidence": row["avg_confidence"],
+                })
+                total += count
 
         return BeliefMapResponse(
             brand_name=brand_name,
@@ -130,36 +710,14 @@ class QueryBuilder:
         Returns:
             Comparison data with belief distributions per brand.
         """
-        query = """
-        MATCH (b:Brand)-[r:INSTALLS_BELIEF]->(bt:BeliefType)
-        WHERE b.normalized_name IN $normalized_names
-        AND ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
-        RETURN b.name as brand_name,
-               bt.type as belief_type,
-               sum(r.count) as count,
-               avg(r.confidence) as confidence
-        ORDER BY b.name, count DESC
-        """
-
-        normalized_names = [name.lower().strip() for name in brand_names]
+        normalized_names = [_normalize(name) for name in brand_names]
         result = await self.client.execute_query(
-            query,
-            {"normalized_names": normalized_names, "llm_provider": llm_provider}
+            _BELIEF_COMPARISON_CYPHER,
+            {"normalized_names": normalized_names, "llm_provider": llm_provider},
+            access_mode=READ_ACCESS,
         )
 
-        comparison = {}
-        if result:
-            for row in result:
-                brand = row["brand_name"]
-                if brand not in comparison:
-                    comparison[brand] = []
-                comparison[brand].append({
-                    "belief_type": row["belief_type"],
-                    "count": row["count"],
-                    "confidence": round(row["confidence"], 3) if row["confidence"] else 0,
-                })
-
-        return comparison
+        return {row["brand_name"]: row["beliefs"] for row in result} if result else {}
 
     async def get_belief_by_funnel_stage(
         self,
@@ -178,38 +736,13 @@ class QueryBuilder:
         Returns:
             Belief distribution per funnel stage.
         """
-        query = """
-        MATCH (b:Brand)-[r:INSTALLS_BELIEF]->(bt:BeliefType)
-        MATCH (i:Intent {id: r.intent_id})
-        WHERE ($normalized_name IS NULL OR b.normalized_name = $normalized_name)
-        AND ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
-        WITH i.funnel_stage as funnel_stage,
-             bt.type as belief_type,
-             sum(r.count) as total_count,
-             avg(r.confidence) as avg_confidence,
-             count(DISTINCT b) as brand_count
-        RETURN funnel_stage,
-               collect({
-                   belief_type: belief_type,
-                   count: total_count,
-                   confidence: avg_confidence,
-                   brand_count: brand_count
-               }) as beliefs
-        ORDER BY CASE funnel_stage
-            WHEN 'awareness' THEN 1
-            WHEN 'consideration' THEN 2
-            WHEN 'decision' THEN 3
-            WHEN 'retention' THEN 4
-            ELSE 5
-        END
-        """
-
         result = await self.client.execute_query(
-            query,
+            self._belief_by_funnel_stage_cypher,
             {
-                "normalized_name": brand_name.lower().strip() if brand_name else None,
+                "normalized_name": _normalize(brand_name) if brand_name else None,
                 "llm_provider": llm_provider,
-            }
+            },
+            access_mode=READ_ACCESS,
         )
 
         funnel_data = {}
@@ -217,16 +750,8 @@ class QueryBuilder:
             for row in result:
                 stage = row["funnel_stage"] or "unknown"
                 funnel_data[stage] = {
-                    "beliefs": [
-                        {
-                            "belief_type": b["belief_type"],
-                            "count": b["count"],
-                            "confidence": round(b["confidence"], 3) if b["confidence"] else 0,
-                            "brand_count": b["brand_count"],
-                        }
-                        for b in row["beliefs"]
-                    ],
-                    "total_count": sum(b["count"] for b in row["beliefs"]),
+                    "beliefs": row["beliefs"],
+                    "total_count": row["stage_total"],
                 }
 
         return funnel_data
@@ -240,6 +765,7 @@ class QueryBuilder:
         Get comprehensive belief profile for a brand.
 
         Combines belief map with funnel stage breakdown and effectiveness metrics.
+        Everything except the funnel breakdown comes from a single query.
 
         Args:
             brand_name: Brand name to analyze.
@@ -248,81 +774,55 @@ class QueryBuilder:
         Returns:
             Complete belief profile with multiple dimensions.
         """
-        normalized = brand_name.lower().strip()
-
-        # Get overall belief distribution
-        belief_map = await self.get_belief_map(brand_name, llm_provider)
-
-        # Get belief by funnel stage
-        funnel_beliefs = await self.get_belief_by_funnel_stage(brand_name, llm_provider)
+        overall_beliefs = []
+        total = 0
+        effectiveness = []
+        consistency = []
 
-        # Get belief effectiveness (correlation with recommendations)
-        effectiveness_query = """
-        MATCH (b:Brand {normalized_name: $normalized_name})-[r:INSTALLS_BELIEF]->(bt:BeliefType)
-        MATCH (llm:LLMProvider)-[rec:RECOMMENDS]->(b)
-        WHERE r.intent_id = rec.intent_id
-        AND ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
-        WITH bt.type as belief_type,
-             count(*) as recommendation_with_belief,
-             avg(r.confidence) as avg_confidence
-        RETURN belief_type,
-               recommendation_with_belief,
-               avg_confidence
-        ORDER BY recommendation_with_belief DESC
-        """
-
-        effectiveness_result = await self.client.execute_query(
-            effectiveness_query,
-            {"normalized_name": normalized, "llm_provider": llm_provider}
-        )
+        # Get belief map, effectiveness and consistency in one streamed pass
+        async for row in self.client.stream_query(
+            _BRAND_BELIEF_PROFILE_CYPHER,
+            {"normalized_name": _normalize(brand_name), "llm_provider": llm_provider},
+            access_mode=READ_ACCESS,
+        ):
+            belief_type = row["belief_type"]
+
+            # Belief map (rows arrive ordered by total_count)
+            if row["filtered_edges"]:
+                count = row["total_count"]
+                overall_beliefs.append({
+                    "belief_type": belief_type,
+                    "count": count,
+                    "confidence": row["avg_confidence"],
+                })
+                total += count
 
-        effectiveness = []
-        if effectiveness_result:
-            for row in effectiveness_result:
+            # Belief effectiveness (correlation with recommendations)
+            recommendations = row["recommendations"]
+            if recommendations:
                 effectiveness.append({
-                    "belief_type": row["belief_type"],
-                    "recommendations_with_belief": row["recommendation_with_belief"],
-                    "avg_confidence": round(row["avg_confidence"], 3) if row["avg_confidence"] else 0,
+                    "belief_type": belief_type,
+                    "recommendations_with_belief": recommendations,
+                    "avg_confidence": row["recommended_confidence"],
                 })
 
-        # Get belief consistency across providers
-        consistency_query = """
-        MATCH (b:Brand {normalized_name: $normalized_name})-[r:INSTALLS_BELIEF]->(bt:BeliefType)
-        WITH bt.type as belief_type,
-             r.llm_provider as provider,
-             sum(r.count) as count,
-             avg(r.confidence) as confidence
-        RETURN belief_type,
-               collect({provider: provider, count: count, confidence: confidence}) as by_provider,
-               count(DISTINCT provider) as provider_count
-        ORDER BY provider_count DESC
-        """
-
-        consistency_result = await self.client.execute_query(
-            consistency_query,
-            {"normalized_name": normalized}
-        )
+            # Belief consistency across providers
+            consistency.append({
+                "belief_type": belief_type,
+                "provider_count": row["provider_count"],
+                "by_provider": row["by_provider"],
+            })
 
-        consistency = []
-        if consistency_result:
-            for row in consistency_result:
-                consistency.append({
-                    "belief_type": row["belief_type"],
-                    "provider_count": row["provider_count"],
-                    "by_provider": [
-                        {
-                            "provider": p["provider"],
-                            "count": p["count"],
-                            "confidence": round(p["confidence"], 3) if p["confidence"] else 0,
-                        }
-                        for p in row["by_provider"]
-                    ],
-                })
+        effectiveness.sort(key=lambda e: e["recommendations_with_belief"], reverse=True)
+        consistency.sort(key=lambda c: c["provider_count"], reverse=True)
+
+        # Get belief by funnel stage
+        funnel_beliefs = await self.get_belief_by_funnel_stage(brand_name, llm_provider)
 
         return {
             "brand_name": brand_name,
-            "overall_beliefs": belief_map.beliefs,
-            "total_occurrences": belief_map.total_occurrences,
+            "overall_beliefs": overall_beliefs,
+            "total_occurrences": total,
             "by_funnel_stage": funnel_beliefs,
             "effectiveness": effectiveness,
             "consistency_across_providers": consistency,
@@ -345,52 +845,20 @@ class QueryBuilder:
         Returns:
             Trend data showing belief patterns.
         """
-        query = """
-        MATCH (b:Brand)-[r:INSTALLS_BELIEF]->(bt:BeliefType)
-        WHERE ($brand_names IS NULL OR b.normalized_name IN $brand_names)
-        AND ($llm_providers IS NULL OR r.llm_provider IN $llm_providers)
-        WITH bt.type as belief_type,
-             sum(r.count) as total_installations,
-             avg(r.confidence) as avg_confidence,
-             count(DISTINCT b) as brand_count,
-             count(DISTINCT r.llm_provider) as provider_count,
-             collect(DISTINCT b.name)[0..5] as sample_brands
-        RETURN belief_type,
-               total_installations,
-               avg_confidence,
-               brand_count,
-               provider_count,
-               sample_brands
-        ORDER BY total_installations DESC
-        """
-
-        normalized_names = [n.lower().strip() for n in brand_names] if brand_names else None
+        normalized_names = [_normalize(n) for n in brand_names] if brand_names else None
 
         result = await self.client.execute_query(
-            query,
+            self._belief_trends_cypher,
             {
                 "brand_names": normalized_names,
                 "llm_providers": llm_providers,
-            }
+            },
+            access_mode=READ_ACCESS,
         )
 
-        trends = []
-        total = 0
-        if result:
-            for row in result:
-                trends.append({
-                    "belief_type": row["belief_type"],
-                    "total_installations": row["total_installations"],
-                    "avg_confidence": round(row["avg_confidence"], 3) if row["avg_confidence"] else 0,
-                    "brand_count": row["brand_count"],
-                    "provider_count": row["provider_count"],
-                    "sample_brands": row["sample_brands"],
-                })
-                total += row["total_installations"]
-
-        # Calculate percentages
-        for trend in trends:
-            trend["percentage"] = round(trend["total_installations"] / total * 100, 1) if total > 0 else 0
+        # Percentages are computed in Cypher against the grand total
+        trends = result[0]["trends"] if result else []
+        total = result[0]["total_installations"] if result else 0
 
         return {
             "trends": trends,
@@ -418,68 +886,16 @@ class QueryBuilder:
         Returns:
             Effectiveness metrics for each belief type.
         """
-        query = """
-        MATCH (b:Brand)-[belief:INSTALLS_BELIEF]->(bt:BeliefType)
-        WHERE ($belief_type IS NULL OR bt.type = $belief_type)
-        AND ($llm_provider IS NULL OR belief.llm_provider = $llm_provider)
-
-        // Get ranking info for same brand/intent
-        OPTIONAL MATCH (b)-[rank:RANKS_FOR]->(i:Intent {id: belief.intent_id})
-        WHERE rank.llm_provider = belief.llm_provider
-
-        WITH bt.type as belief_type,
-             b.name as brand_name,
-             belief.confidence as belief_confidence,
-             rank.position as position,
-             rank.presence as presence,
-             belief.count as belief_count
-
-        WITH belief_type,
-             count(DISTINCT brand_name) as brand_count,
-             sum(belief_count) as total_installations,
-             avg(belief_confidence) as avg_belief_confidence,
-             avg(CASE WHEN position IS NOT NULL THEN position END) as avg_position,
-             sum(CASE WHEN presence = 'recommended' THEN 1 ELSE 0 END) as recommendations,
-             sum(CASE WHEN position = 1 THEN 1 ELSE 0 END) as first_positions
-
-        RETURN belief_type,
-               brand_count,
-               total_installations,
-               avg_belief_confidence,
-               avg_position,
-               recommendations,
-               first_positions,
-               CASE WHEN total_installations > 0
-                    THEN toFloat(recommendations) / total_installations * 100
-                    ELSE 0 END as recommendation_rate,
-               CASE WHEN total_installations > 0
-                    THEN toFloat(first_positions) / total_installations * 100
-                    ELSE 0 END as first_position_rate
-        ORDER BY recommendation_rate DESC
-        """
-
         result = await self.client.execute_query(
-            query,
+            self._belief_effectiveness_analysis_cypher,
             {
                 "belief_type": belief_type,
                 "llm_provider": llm_provider,
-            }
+            },
+            access_mode=READ_ACCESS,
         )
 
-        effectiveness = []
-        if result:
-            for row in result:
-                effectiveness.append({
-                    "belief_type": row["belief_type"],
-                    "brand_count": row["brand_count"],
-                    "total_installations": row["total_installations"],
-                    "avg_confidence": round(row["avg_belief_confidence"], 3) if row["avg_belief_confidence"] else 0,
-                    "avg_position": round(row["avg_position"], 2) if row["avg_position"] else None,
-                    "recommendations": row["recommendations"],
-                    "first_positions": row["first_positions"],
-                    "recommendation_rate": round(row["recommendation_rate"], 1) if row["recommendation_rate"] else 0,
-                    "first_position_rate": round(row["first_position_rate"], 1) if row["first_position_rate"] else 0,
-                })
+        effectiveness = [row["item"] for row in result] if result else []
 
         return {
             "effectiveness": effectiveness,
@@ -493,6 +909,7 @@ class QueryBuilder:
     # CO-MENTION QUERIES
     # =========================================================================
 
+    @cached_query
     async def get_co_mentions(
         self,
         brand_name: str,
@@ -510,37 +927,17 @@ class QueryBuilder:
         Returns:
             CoMentionResponse with co-mentioned brands.
         """
-        query = """
-        MATCH (target:Brand {normalized_name: $normalized_name})-[r:CO_MENTIONED]-(other:Brand)
-        WHERE $llm_provider IS NULL OR r.llm_provider = $llm_provider
-        RETURN other.name as brand_name,
-               other.normalized_name as normalized_name,
-               r.count as co_mention_count,
-               r.avg_position_delta as avg_position_delta,
-               r.llm_provider as llm_provider
-        ORDER BY r.count DESC
-        LIMIT $limit
-        """
-
         result = await self.client.execute_query(
-            query,
+            _CO_MENTIONS_CYPHER,
             {
-                "normalized_name": brand_name.lower().strip(),
+                "normalized_name": _normalize(brand_name),
                 "llm_provider": llm_provider,
                 "limit": limit,
-            }
+            },
+            access_mode=READ_ACCESS,
         )
 
-        co_mentions = []
-        if result:
-            for row in result:
-                co_mentions.append({
-                    "brand_name": row["brand_name"],
-                    "normalized_name": row["normalized_name"],
-                    "count": row["co_mention_count"],
-                    "avg_position_delta": round(row["avg_position_delta"], 2) if row["avg_position_delta"] else None,
-                    "llm_provider": row["llm_provider"],
-                })
+        co_mentions = [row["item"] for row in result] if result else []
 
         return CoMentionResponse(
             brand_name=brand_name,
@@ -558,39 +955,26 @@ class QueryBuilder:
 
         Args:
             brand_name: Central brand name.
-            depth: Relationship depth to traverse.
+            depth: Relationship depth to traverse (clamped to 1-3).
             min_count: Minimum co-mention count to include.
 
         Returns:
             Network data with nodes and edges.
         """
-        query = """
-        MATCH path = (center:Brand {normalized_name: $normalized_name})-[:CO_MENTIONED*1..$depth]-(other:Brand)
-        WHERE ALL(r IN relationships(path) WHERE r.count >= $min_count)
-        WITH nodes(path) as nodes, relationships(path) as rels
-        UNWIND nodes as n
-        WITH DISTINCT n, rels
-        UNWIND rels as r
-        WITH DISTINCT n, r
-        RETURN collect(DISTINCT {
-            id: n.id,
-            name: n.name,
-            normalized_name: n.normalized_name
-        }) as nodes,
-        collect(DISTINCT {
-            source: startNode(r).normalized_name,
-            target: endNode(r).normalized_name,
-            count: r.count
-        }) as edges
-        """
+        if depth > _MAX_CO_MENTION_DEPTH:
+            logger.warning(
+                f"Co-mention network depth {depth} exceeds maximum, "
+                f"clamping to {_MAX_CO_MENTION_DEPTH}"
+            )
+        depth = max(1, min(int(depth), _MAX_CO_MENTION_DEPTH))
 
         result = await self.client.execute_query(
-            query,
+            _CO_MENTION_NETWORK_CYPHER[depth],
             {
-                "normalized_name": brand_name.lower().strip(),
-                "depth": depth,
+                "normalized_name": _normalize(brand_name),
                 "min_count": min_count,
-            }
+            },
+            access_mode=READ_ACCESS,
         )
 
         if result and len(result) > 0:
@@ -622,11 +1006,11 @@ class QueryBuilder:
             ICPJourneyResponse with journey data.
         """
         # Get ICP info
-        icp_query = """
-        MATCH (i:ICP {id: $icp_id})
-        RETURN i.name as name, i.pain_points as pain_points, i.goals as goals
-        """
-        icp_result = await self.client.execute_query(icp_query, {"icp_id": icp_id})
+        icp_result = await self.client.execute_query(
+            _ICP_CYPHER,
+            {"icp_id": icp_id},
+            access_mode=READ_ACCESS,
+        )
 
         if not icp_result:
             return ICPJourneyResponse(
@@ -640,22 +1024,11 @@ class QueryBuilder:
         icp_name = icp_result[0]["name"]
 
         # Get concerns and triggered intents
-        concerns_query = """
-        MATCH (i:ICP {id: $icp_id})-[hc:HAS_CONCERN]->(c:Concern)
-        OPTIONAL MATCH (c)-[:TRIGGERS]->(intent:Intent)
-        RETURN c.id as concern_id,
-               c.description as description,
-               c.category as category,
-               hc.priority as priority,
-               collect(DISTINCT {
-                   id: intent.id,
-                   intent_type: intent.intent_type,
-                   funnel_stage: intent.funnel_stage,
-                   buying_signal: intent.buying_signal
-               }) as intents
-        ORDER BY hc.priority
-        """
-        concerns_result = await self.client.execute_query(concerns_query, {"icp_id": icp_id})
+        concerns_result = await self.client.execute_query(
+            _ICP_CONCERNS_CYPHER,
+            {"icp_id": icp_id},
+            access_mode=READ_ACCESS,
+        )
 
         concerns = []
         all_intents = []
@@ -677,21 +1050,10 @@ class QueryBuilder:
         # Get brand recommendations if requested
         brand_recommendations = []
         if include_brands and intent_ids:
-            brands_query = """
-            MATCH (b:Brand)-[r:RANKS_FOR]->(i:Intent)
-            WHERE i.id IN $intent_ids
-            RETURN b.name as brand_name,
-                   b.id as brand_id,
-                   i.id as intent_id,
-                   i.intent_type as intent_type,
-                   r.position as position,
-                   r.presence as presence,
-                   r.llm_provider as llm_provider
-            ORDER BY r.position
-            """
             brands_result = await self.client.execute_query(
-                brands_query,
-                {"intent_ids": list(intent_ids)}
+                _ICP_BRAND_RECOMMENDATIONS_CYPHER,
+                {"intent_ids": list(intent_ids)},
+                access_mode=READ_ACCESS,
             )
 
             if brands_result:
@@ -735,44 +1097,17 @@ class QueryBuilder:
         Returns:
             SubstitutionPatternResponse with substitute brands.
         """
-        query = """
-        // Find intents where the brand was ignored
-        MATCH (llm:LLMProvider)-[ignore:IGNORES]->(missing:Brand {normalized_name: $normalized_name})
-        WHERE $llm_provider IS NULL OR llm.name = $llm_provider
-
-        // Find brands recommended for those same intents
-        MATCH (llm)-[rec:RECOMMENDS]->(substitute:Brand)
-        WHERE rec.intent_id = ignore.intent_id
-        AND substitute.normalized_name <> $normalized_name
-
-        RETURN substitute.name as brand_name,
-               substitute.id as brand_id,
-               count(*) as substitution_count,
-               avg(rec.position) as avg_position,
-               collect(DISTINCT llm.name) as llm_providers
-        ORDER BY substitution_count DESC
-        LIMIT $limit
-        """
-
         result = await self.client.execute_query(
-            query,
+            _SUBSTITUTION_PATTERNS_CYPHER,
             {
-                "normalized_name": brand_name.lower().strip(),
+                "normalized_name": _normalize(brand_name),
                 "llm_provider": llm_provider,
                 "limit": limit,
-            }
+            },
+            access_mode=READ_ACCESS,
         )
 
-        substitutes = []
-        if result:
-            for row in result:
-                substitutes.append({
-                    "brand_name": row["brand_name"],
-                    "brand_id": row["brand_id"],
-                    "substitution_count": row["substitution_count"],
-                    "avg_position": round(row["avg_position"], 1) if row["avg_position"] else None,
-                    "llm_providers": row["llm_providers"],
-                })
+        substitutes = [row["item"] for row in result] if result else []
 
         return SubstitutionPatternResponse(
             missing_brand=brand_name,
@@ -783,6 +1118,7 @@ class QueryBuilder:
     # COMPETITIVE ANALYSIS QUERIES
     # =========================================================================
 
+    @cached_query
     async def get_share_of_voice(
         self,
         brand_names: list[str],
@@ -798,54 +1134,17 @@ class QueryBuilder:
         Returns:
             Share of voice metrics per brand.
         """
-        query = """
-        MATCH (b:Brand)-[r:RANKS_FOR]->(i:Intent)
-        WHERE b.normalized_name IN $normalized_names
-        AND ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
-        WITH b.name as brand_name,
-             count(r) as total_mentions,
-             sum(CASE WHEN r.position = 1 THEN 1 ELSE 0 END) as first_positions,
-             sum(CASE WHEN r.presence = 'recommended' THEN 1 ELSE 0 END) as recommendations,
-             avg(r.position) as avg_position
-        RETURN brand_name,
-               total_mentions,
-               first_positions,
-               recommendations,
-               round(avg_position * 10) / 10 as avg_position,
-               round(toFloat(first_positions) / total_mentions * 100) as first_position_rate,
-               round(toFloat(recommendations) / total_mentions * 100) as recommendation_rate
-        ORDER BY total_mentions DESC
-        """
-
-        normalized_names = [name.lower().strip() for name in brand_names]
+        normalized_names = [_normalize(name) for name in brand_names]
         result = await self.client.execute_query(
-            query,
-            {"normalized_names": normalized_names, "llm_provider": llm_provider}
+            self._share_of_voice_cypher,
+            {"normalized_names": normalized_names, "llm_provider": llm_provider},
+            access_mode=READ_ACCESS,
         )
 
-        metrics = {}
-        total_mentions = 0
-
-        if result:
-            for row in result:
-                metrics[row["brand_name"]] = {
-                    "total_mentions": row["total_mentions"],
-                    "first_positions": row["first_positions"],
-                    "recommendations": row["recommendations"],
-                    "avg_position": row["avg_position"],
-                    "first_position_rate": row["first_position_rate"],
-                    "recommendation_rate": row["recommendation_rate"],
-                }
-                total_mentions += row["total_mentions"]
-
-            # Calculate share of voice percentages
-            for brand in metrics:
-                metrics[brand]["share_of_voice"] = round(
-                    metrics[brand]["total_mentions"] / total_mentions * 100, 1
-                ) if total_mentions > 0 else 0
-
-        return metrics
+        # Share of voice is computed in Cypher against the combined mentions
+        return {row["brand_name"]: row["item"] for row in result} if result else {}
 
+    @cached_query
     async def get_competitive_landscape(
         self,
         brand_name: str,
@@ -861,48 +1160,35 @@ class QueryBuilder:
         Returns:
             Competitive landscape data.
         """
-        # Get direct competitors
-        competitors_query = """
-        MATCH (b:Brand {normalized_name: $normalized_name})-[r:COMPETES_WITH]->(c:Brand)
-        RETURN c.name as competitor_name,
-               c.id as competitor_id,
-               r.relationship_type as relationship_type
-        """
-
-        competitors_result = await self.client.execute_query(
-            competitors_query,
-            {"normalized_name": brand_name.lower().strip()}
+        result = await self.client.execute_query(
+            _COMPETITIVE_LANDSCAPE_CYPHER,
+            {
+                "normalized_name": _normalize(brand_name),
+                "llm_provider": llm_provider,
+                "co_mention_limit": 20,
+            },
+            access_mode=READ_ACCESS,
         )
 
-        competitors = []
-        competitor_names = [brand_name]
-
-        if competitors_result:
-            for row in competitors_result:
-                competitors.append({
-                    "name": row["competitor_name"],
-                    "id": row["competitor_id"],
-                    "relationship_type": row["relationship_type"],
-                })
-                competitor_names.append(row["competitor_name"])
-
-        # Get share of voice for brand and competitors
-        sov = await self.get_share_of_voice(competitor_names, llm_provider)
-
-        # Get co-mentions with competitors
-        co_mentions = await self.get_co_mentions(brand_name, limit=20, llm_provider=llm_provider)
+        if not result:
+            return {
+                "brand_name": brand_name,
+                "competitors": [],
+                "share_of_voice": {},
+                "co_mentions": [],
+            }
 
+        row = result[0]
         return {
             "brand_name": brand_name,
-            "competitors": competitors,
-            "share_of_voice": sov,
-            "co_mentions": co_mentions.co_mentions,
+            "competitors": row["competitors"],
+            "share_of_voice": {
+                entry["brand_name"]: entry["item"] for entry in row["share_of_voice"]
+            },
+            "co_mentions": row["co_mentions"],
         }
 
-    # =========================================================================
-    # INTENT ANALYSIS QUERIES
-    # =========================================================================
-
+    @cached_query
     async def get_intent_brand_coverage(
         self,
         intent_type: IntentTypeEnum | None = None,
@@ -920,91 +1206,54 @@ class QueryBuilder:
         Returns:
             List of intents with brand coverage data.
         """
-        query = """
-        MATCH (i:Intent)<-[r:RANKS_FOR]-(b:Brand)
-        WHERE ($intent_type IS NULL OR i.intent_type = $intent_type)
-        AND ($funnel_stage IS NULL OR i.funnel_stage = $funnel_stage)
-        AND ($llm_provider IS NULL OR r.llm_provider = $llm_provider)
-        WITH i, count(DISTINCT b) as brand_count,
-             collect(DISTINCT {name: b.name, position: r.position, presence: r.presence}) as brands
-        RETURN i.id as intent_id,
-               i.intent_type as intent_type,
-               i.funnel_stage as funnel_stage,
-               i.buying_signal as buying_signal,
-               brand_count,
-               brands[0..5] as top_brands
-        ORDER BY brand_count DESC
-        """
-
-        result = await self.client.execute_query(
-            query,
-            {
-                "intent_type": intent_type.value if intent_type else None,
-                "funnel_stage": funnel_stage,
-                "llm_provider": llm_provider,
-            }
-        )
-
-        return [dict(row) for row in result] if result else []
+        return [
+            row
+            async for row in self.client.stream_query(
+                _INTENT_BRAND_COVERAGE_CYPHER[
+                    (intent_type is not None, funnel_stage is not None)
+                ],
+                {
+                    "intent_type": _INTENT_TYPE_VALUES[intent_type],
+                    "funnel_stage": funnel_stage,
+                    "llm_provider": llm_provider,
+                },
+                access_mode=READ_ACCESS,
+            )
+        ]
 
     # =========================================================================
     # UTILITY QUERIES
     # =========================================================================
 
+    @cached_query
     async def get_graph_stats(self) -> dict[str, Any]:
-        """Get overall graph statistics."""
-        query = """
-        CALL {
-            MATCH (n:Brand) RETURN 'Brand' as label, count(n) as count
-            UNION ALL
-            MATCH (n:ICP) RETURN 'ICP' as label, count(n) as count
-            UNION ALL
-            MATCH (n:Intent) RETURN 'Intent' as label, count(n) as count
-            UNION ALL
-            MATCH (n:Concern) RETURN 'Concern' as label, count(n) as count
-            UNION ALL
-            MATCH (n:BeliefType) RETURN 'BeliefType' as label, count(n) as count
-            UNION ALL
-            MATCH (n:LLMProvider) RETURN 'LLMProvider' as label, count(n) as count
-            UNION ALL
-            MATCH (n:Conversation) RETURN 'Conversation' as label, count(n) as count
-        }
-        RETURN label, count
         """
+        Get overall graph statistics.
 
-        node_counts = {}
-        result = await self.client.execute_query(query, {})
-        if result:
-            for row in result:
-                node_counts[row["label"]] = row["count"]
-
-        # Get edge counts
-        edge_query = """
-        CALL {
-            MATCH ()-[r:CO_MENTIONED]->() RETURN 'CO_MENTIONED' as type, count(r) as count
-            UNION ALL
-            MATCH ()-[r:COMPETES_WITH]->() RETURN 'COMPETES_WITH' as type, count(r) as count
-            UNION ALL
-            MATCH ()-[r:HAS_CONCERN]->() RETURN 'HAS_CONCERN' as type, count(r) as count
-            UNION ALL
-            MATCH ()-[r:TRIGGERS]->() RETURN 'TRIGGERS' as type, count(r) as count
-            UNION ALL
-            MATCH ()-[r:RANKS_FOR]->() RETURN 'RANKS_FOR' as type, count(r) as count
-            UNION ALL
-            MATCH ()-[r:INSTALLS_BELIEF]->() RETURN 'INSTALLS_BELIEF' as type, count(r) as count
-            UNION ALL
-            MATCH ()-[r:RECOMMENDS]->() RETURN 'RECOMMENDS' as type, count(r) as count
-            UNION ALL
-            MATCH ()-[r:IGNORES]->() RETURN 'IGNORES' as type, count(r) as count
-        }
-        RETURN type, count
+        Uses apoc.meta.stats() when detect_apoc() found it, otherwise the
+        count-store UNION query.
         """
-
-        edge_counts = {}
-        edge_result = await self.client.execute_query(edge_query, {})
-        if edge_result:
-            for row in edge_result:
-                edge_counts[row["type"]] = row["count"]
+        if self._apoc_meta_stats:
+            result = await self.client.execute_query(
+                _APOC_META_STATS_CYPHER,
+                {},
+                access_mode=READ_ACCESS,
+            )
+            row = result[0] if result else {}
+            labels = row.get("labels") or {}
+            rel_types = row.get("relTypesCount") or {}
+            node_counts = {label: labels.get(label, 0) for label in _GRAPH_STATS_NODE_LABELS}
+            edge_counts = {rel: rel_types.get(rel, 0) for rel in _GRAPH_STATS_EDGE_TYPES}
+        else:
+            counts: dict[str, dict[str, int]] = {"node": {}, "edge": {}}
+            async for row in self.client.stream_query(
+                _GRAPH_STATS_CYPHER,
+                {},
+                access_mode=READ_ACCESS,
+            ):
+                counts[row["kind"]][row["name"]] = row["count"]
+            node_counts = counts["node"]
+            edge_counts = counts["edge"]
 
         return {
             "nodes": node_counts,
@@ -1012,3 +1261,86 @@ class QueryBuilder:
             "total_nodes": sum(node_counts.values()),
             "total_edges": sum(edge_counts.values()),
         }
+
+    async def detect_apoc(self) -> bool:
+        """
+        Check once whether apoc.meta.stats() is available.
+
+        Intended to run at startup; get_graph_stats uses the procedure
+        only if this found it.
+
+        Returns:
+            True if the procedure is installed.
+        """
+        try:
+            result = await self.client.execute_query(
+                _SHOW_APOC_META_STATS_CYPHER,
+                {},
+                access_mode=READ_ACCESS,
+            )
+        except Exception as e:
+            logger.warning(f"Could not list Neo4j procedures: {e}")
+            result = None
+
+        self._apoc_meta_stats = bool(result)
+        if not self._apoc_meta_stats:
+            logger.info("APOC not available, graph stats use count-store queries")
+        return self._apoc_meta_stats
+
+    async def ensure_indexes(self, timeout_seconds: int = 30) -> list[str]:
+        """
+        Create any missing lookup indexes used by the query methods.
+
+        Existing indexes (including constraint-backed ones) are detected
+        with SHOW INDEXES, then the call waits for new indexes to come online.
+
+        Args:
+            timeout_seconds: Maximum time to wait for indexes to come online.
+
+        Returns:
+            Names of the indexes that were created.
+        """
+        existing = set()
+        for row in await self.client.execute_query(_SHOW_INDEXES_CYPHER, {}) or []:
+            properties = tuple(row["properties"] or ())
+            existing.update((label, properties) for label in row["labelsOrTypes"] or [])
+
+        created = []
+        for (label, properties), name in _REQUIRED_INDEXES.items():
+            if (label, properties) in existing:
+                continue
+            columns = ", ".join(f"n.{prop}" for prop in properties)
+            await self.client.execute_query(
+                f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON ({columns})", {}
+            )
+            created.append(name)
+
+        if created:
+            logger.info(f"Created graph indexes: {', '.join(created)}")
+            await self.client.execute_query(
+                _AWAIT_INDEXES_CYPHER, {"timeout_seconds": timeout_seconds}
+            )
+
+        return created
+
+    async def check_query_plans(self) -> dict[str, list[str]]:
+        """
+        Verify that point-lookup queries are planned as index seeks.
+
+        Intended for debug mode: each lookup query is planned once with
+        EXPLAIN (which does not execute it) and any NodeByLabelScan
+        operators are logged.
+
+        Returns:
+            Mapping of query name to label-scan operators found.
+        """
+        problems = {}
+        for name, (query, params) in _INDEXED_LOOKUP_QUERIES.items():
+            async with self.client.session(access_mode=READ_ACCESS) as session:
+                result = await session.run("EXPLAIN " + query, params)
+                summary = await result.consume()
+            scans = _find_label_scans(summary.plan)
+            if scans:
+                logger.warning(f"Query {name} is planned with label scans: {scans}")
+                problems[name] = scans
+        return problems
@@ -9,7 +9,7 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 # =============================================================================
@@ -72,11 +72,25 @@ class BrandNode(BaseModel):
 
     id: str = Field(..., description="UUID from PostgreSQL")
     name: str = Field(..., description="Brand name")
-    normalized_name: str = Field(..., description="Lowercase, trimmed name")
+    normalized_name: str = Field(
+        ..., description="Lowercase, trimmed name. Derived from name when omitted"
+    )
     domain: str | None = Field(None, description="Brand's domain")
     industry: str | None = Field(None, description="Brand's industry")
     is_tracked: bool = Field(False, description="Whether this is the user's brand")
 
+    @model_validator(mode="before")
+    @classmethod
+    def default_normalized_name(cls, data: Any) -> Any:
+        if isinstance(data, dict) and not data.get("normalized_name") and data.get("name"):
+            return {**data, "normalized_name": data["name"]}
+        return data
+
+    @field_validator("normalized_name")
+    @classmethod
+    def normalize_name(cls, v: str) -> str:
+        return v.lower().strip()
+
 
 class ICPNode(BaseModel):
     """Ideal Customer Profile node."""
@@ -10,13 +10,16 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
+import redis.asyncio as redis
+from celery import group
 from pydantic import BaseModel, Field
 
 from shared.config import settings
-from shared.db.postgres_client import get_postgres_client
 from shared.queue.celery_app import celery_app
+from shared.queue.worker_loop import get_worker_postgres, run_async
 from shared.llm import LLMProvider, get_llm_client
 
+from services.icp_generator.cache import ICPResponseCache
 from services.icp_generator.generator import ICPGenerator, ICPGenerationError
 
 import logging
@@ -50,22 +53,97 @@ class ICPJobData(BaseModel):
     model_config = {"use_enum_values": True}
 
 
-# In-memory job tracking (in production, use Redis)
-_job_store: dict[str, ICPJobData] = {}
+# Jobs are kept in Redis so they survive worker restarts and are visible to
+# every API replica and Celery worker; entries expire after a day. The async
+# client keeps job reads and writes from blocking the event loop.
+_JOB_KEY_PREFIX = "icp:job:"
+_JOB_TTL_SECONDS = 86400
 
+_redis: redis.Redis | None = None
 
-def get_job(job_id: str) -> ICPJobData | None:
+
+def _get_redis() -> redis.Redis:
+    """Get the pooled Redis client for job tracking."""
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis.from_url(
+            str(settings.redis_url),
+            max_connections=settings.redis_pool_size,
+            decode_responses=True,
+        )
+    return _redis
+
+
+async def get_job(job_id: str) -> ICPJobData | None:
     """Get job data by ID."""
-    return _job_store.get(job_id)
+    data = await _get_redis().get(f"{_JOB_KEY_PREFIX}{job_id}")
+    return ICPJobData.model_validate_json(data) if data else None
 
 
-def save_job(job: ICPJobData) -> None:
+async def save_job(job: ICPJobData) -> None:
     """Save job data."""
-    _job_store[str(job.job_id)] = job
+    await _get_redis().set(
+        f"{_JOB_KEY_PREFIX}{job.job_id}",
+        job.model_dump_json(),
+        ex=_JOB_TTL_SECONDS,
+    )
+
+
+async def save_jobs(jobs: list[ICPJobData]) -> None:
+    """Save several jobs in one Redis round-trip."""
+    pipe = _get_redis().pipeline(transaction=False)
+    for job in jobs:
+        pipe.set(
+            f"{_JOB_KEY_PREFIX}{job.job_id}",
+            job.model_dump_json(),
+            ex=_JOB_TTL_SECONDS,
+        )
+    await pipe.execute()
+
+
+async def close_job_store() -> None:
+    """Close the job-tracking Redis client."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def _save_job_in_background(job: ICPJobData, pending: list[asyncio.Task]) -> None:
+    """
+    Persist a progress update without making generation wait on it.
+
+    Args:
+        job: Job data to save. A snapshot is written, so later edits don't race.
+        pending: Background writes for this job, flushed before terminal states.
+    """
+    snapshot = job.model_copy()
+    previous = pending[-1] if pending else None
+
+    async def write() -> None:
+        # Keep writes in order so an older progress value never lands last
+        if previous is not None:
+            await asyncio.wait({previous})
+        await save_job(snapshot)
+
+    pending.append(asyncio.create_task(write()))
+
+
+async def _flush_job_writes(pending: list[asyncio.Task]) -> None:
+    """Wait for background progress writes so a terminal state is saved last."""
+    if not pending:
+        return
+    for result in await asyncio.gather(*pending, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.warning("Failed to save ICP job progress: %s", result)
+    pending.clear()
 
 
 # ==================== Async ICP Generation ====================
 
+# Shared across tasks so the in-process tier survives between jobs
+_response_cache = ICPResponseCache()
+
 
 async def _run_icp_generation(
     website_id: uuid.UUID,
@@ -85,29 +163,31 @@ async def _run_icp_generation(
     Returns:
         Result dictionary.
     """
-    # Get database connection
-    pg_client = get_postgres_client()
-    await pg_client.connect()
+    # Reuse the worker's pooled database connection
+    pg_client = await get_worker_postgres()
+    progress_writes: list[asyncio.Task] = []
 
     try:
         async with pg_client.session() as session:
             # Update job status
-            job = get_job(str(job_id))
+            job = await get_job(str(job_id))
             if job:
                 job.status = ICPJobStatus.RUNNING
                 job.started_at = datetime.now(timezone.utc)
                 job.progress = 10.0
-                save_job(job)
+                _save_job_in_background(job, progress_writes)
 
             # Create generator with specified provider
             provider = LLMProvider(llm_provider) if llm_provider else LLMProvider.OPENAI
             llm_client = get_llm_client(provider)
-            generator = ICPGenerator(llm_client=llm_client)
+            generator = ICPGenerator(
+                llm_client=llm_client, response_cache=_response_cache
+            )
 
             # Update progress
             if job:
                 job.progress = 30.0
-                save_job(job)
+                _save_job_in_background(job, progress_writes)
 
             # Generate ICPs
             icps = await generator.generate_icps(
@@ -117,12 +197,13 @@ async def _run_icp_generation(
             )
 
             # Update job status
+            await _flush_job_writes(progress_writes)
             if job:
                 job.status = ICPJobStatus.COMPLETED
                 job.completed_at = datetime.now(timezone.utc)
                 job.progress = 100.0
                 job.icps_generated = len(icps)
-                save_job(job)
+                await save_job(job)
 
             logger.info(
                 "ICP generation completed: website_id=%s, icps=%d",
@@ -141,12 +222,13 @@ async def _run_icp_generation(
         logger.error("ICP generation failed: %s", e)
 
         # Update job status
-        job = get_job(str(job_id))
+        await _flush_job_writes(progress_writes)
+        job = await get_job(str(job_id))
         if job:
             job.status = ICPJobStatus.FAILED
             job.error = str(e)
             job.completed_at = datetime.now(timezone.utc)
-            save_job(job)
+            await save_job(job)
 
         raise
 
@@ -154,18 +236,16 @@ async def _run_icp_generation(
         logger.error("Unexpected error in ICP generation: %s", e)
 
         # Update job status
-        job = get_job(str(job_id))
+        await _flush_job_writes(progress_writes)
+        job = await get_job(str(job_id))
         if job:
             job.status = ICPJobStatus.FAILED
             job.error = str(e)
             job.completed_at = datetime.now(timezone.utc)
-            save_job(job)
+            await save_job(job)
 
         raise
 
-    finally:
-        await pg_client.disconnect()
-
 
 # ==================== Celery Tasks ====================
 
@@ -200,7 +280,7 @@ def generate_icps_task(
     )
 
     try:
-        result = asyncio.run(_run_icp_generation(
+        result = run_async(_run_icp_generation(
             website_id=uuid.UUID(website_id),
             job_id=uuid.UUID(job_id),
             force_regenerate=force_regenerate,
@@ -245,34 +325,35 @@ def regenerate_all_icps_task(website_ids: list[str], llm_provider: str | None =
     """
     logger.info("Starting bulk ICP regeneration for %d websites", len(website_ids))
 
-    results = []
-    for website_id in website_ids:
-        job_id = str(uuid.uuid4())
-
-        # Create job
-        job = ICPJobData(
-            job_id=uuid.UUID(job_id),
+    jobs = [
+        ICPJobData(
+            job_id=uuid.uuid4(),
             website_id=uuid.UUID(website_id),
             status=ICPJobStatus.QUEUED,
             llm_provider=llm_provider,
         )
-        save_job(job)
-
-        # Queue individual task
-        celery_app.send_task(
-            "services.icp_generator.app.tasks.generate_icps_task",
-            args=[website_id, job_id, True, llm_provider],
-            queue="classification",
-        )
-
-        results.append({
-            "website_id": website_id,
-            "job_id": job_id,
+        for website_id in website_ids
+    ]
+    run_async(save_jobs(jobs))
+
+    # Publish all generation tasks through one producer connection
+    group_result = group(
+        generate_icps_task.s(str(job.website_id), str(job.job_id), True, llm_provider)
+        for job in jobs
+    ).apply_async(queue="classification")
+
+    results = [
+        {
+            "website_id": str(job.website_id),
+            "job_id": str(job.job_id),
             "status": "queued",
-        })
+        }
+        for job in jobs
+    ]
 
     return {
         "total": len(website_ids),
         "queued": len(results),
+        "group_id": group_result.id,
         "jobs": results,
     }
@@ -0,0 +1,210 @@
+"""
+Caches for the ICP Generator service.
+
+ICP generation is an ~8000-token LLM call whose input is built entirely
+from stored website data, so identical contexts produce interchangeable
+results. Validated responses are cached under a hash of the exact request
+(prompts, temperature and token limit) in an in-process LRU tier and in
+Redis, so a repeat generation for the same context skips the LLM call.
+
+Each website's ICP list responses are also cached in one Redis hash,
+written right after generation and dropped whenever its ICPs change.
+"""
+
+import hashlib
+import logging
+import uuid
+from collections import OrderedDict
+
+import orjson
+
+from shared.db.redis import RedisCache, get_redis_context
+
+from services.icp_generator.schemas import ICPListResponse
+
+logger = logging.getLogger(__name__)
+
+
+class ICPResponseCache:
+    """
+    Two-tier (memory + Redis) cache of validated ICP generation responses.
+
+    Redis failures are logged and treated as misses so caching never
+    blocks generation.
+    """
+
+    DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+    def __init__(
+        self,
+        redis_cache: RedisCache | None = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        maxsize: int = 256,
+    ):
+        """
+        Initialize ICPResponseCache.
+
+        Args:
+            redis_cache: Redis cache backend. Defaults to the "icp:llm" prefix.
+            ttl_seconds: Seconds a response stays cached in Redis.
+            maxsize: Maximum number of responses kept in process memory.
+        """
+        self._redis = redis_cache or RedisCache(prefix="icp:llm")
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._local: OrderedDict[str, str] = OrderedDict()
+
+    @staticmethod
+    def cache_key(
+        system_prompt: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """
+        Build the cache key for an LLM request.
+
+        Args:
+            system_prompt: System prompt sent to the LLM.
+            prompt: User prompt sent to the LLM.
+            temperature: Sampling temperature.
+            max_tokens: Maximum response tokens.
+
+        Returns:
+            SHA-256 hex digest of the request.
+        """
+        payload = orjson.dumps(
+            {
+                "system_prompt": system_prompt,
+                "prompt": prompt,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    async def get(self, key: str) -> str | None:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key from cache_key().
+
+        Returns:
+            Cached response JSON, or None on a miss.
+        """
+        value = self._local.get(key)
+        if value is not None:
+            self._local.move_to_end(key)
+            return value
+
+        try:
+            value = await self._redis.get(key)
+        except Exception as e:
+            logger.warning("ICP response cache read failed: %s", e)
+            return None
+
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: Cache key from cache_key().
+            value: Validated response JSON.
+        """
+        self._remember(key, value)
+        try:
+            await self._redis.set(key, value, ttl=self.ttl_seconds)
+        except Exception as e:
+            logger.warning("ICP response cache write failed: %s", e)
+
+    def _remember(self, key: str, value: str) -> None:
+        """Store a response in the in-process tier, evicting the LRU entry."""
+        self._local[key] = value
+        self._local.move_to_end(key)
+        while len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+
+# ==================== ICP List Cache ====================
+
+# One hash per website ("icps:<website_id>") with a field per list variant,
+# so a single DEL invalidates every cached view of the website's ICPs.
+ICP_LIST_CACHE_PREFIX = "icps"
+ICP_LIST_TTL_SECONDS = 3600
+
+
+def _icp_list_key(website_id: uuid.UUID) -> str:
+    return f"{ICP_LIST_CACHE_PREFIX}:{website_id}"
+
+
+def _icp_list_field(active_only: bool) -> str:
+    return "active" if active_only else "all"
+
+
+async def get_cached_icp_list(
+    website_id: uuid.UUID,
+    active_only: bool,
+) -> ICPListResponse | None:
+    """
+    Get a cached ICP list response.
+
+    Args:
+        website_id: Website UUID.
+        active_only: Whether the list holds only active ICPs.
+
+    Returns:
+        Cached response, or None on a miss.
+    """
+    try:
+        async with get_redis_context() as client:
+            cached = await client.hget(_icp_list_key(website_id), _icp_list_field(active_only))
+    except Exception as e:
+        logger.warning("ICP list cache read failed: %s", e)
+        return None
+
+    return ICPListResponse.model_validate_json(cached) if cached else None
+
+
+async def cache_icp_lists(
+    website_id: uuid.UUID,
+    responses: dict[bool, ICPListResponse],
+) -> None:
+    """
+    Cache ICP list responses for a website.
+
+    Args:
+        website_id: Website UUID.
+        responses: List responses keyed by their active_only flag.
+    """
+    key = _icp_list_key(website_id)
+    try:
+        async with get_redis_context() as client:
+            pipe = client.pipeline()
+            pipe.hset(key, mapping={
+                _icp_list_field(active_only): response.model_dump_json()
+                for active_only, response in responses.items()
+            })
+            pipe.expire(key, ICP_LIST_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("ICP list cache write failed: %s", e)
+
+
+async def invalidate_icp_lists(website_id: uuid.UUID) -> None:
+    """
+    Drop every cached ICP list for a website.
+
+    Args:
+        website_id: Website UUID.
+    """
+    try:
+        async with get_redis_context() as client:
+            await client.delete(_icp_list_key(website_id))
+    except Exception as e:
+        logger.warning("ICP list cache invalidation failed: %s", e)
@@ -4,38 +4,55 @@ ICP Generator service.
 Generates Ideal Customer Profiles using LLM analysis of website content.
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Any
 
-from pydantic import ValidationError
-from sqlalchemy import select, delete
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import delete, func, select, true
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from shared.config import settings
 from shared.llm import LLMClient, LLMProvider, get_llm_client, ResponseFormat
+from shared.models.conversation import ConversationSequence
 from shared.models.icp import ICP
 from shared.models.website import Website, WebsiteAnalysis, ScrapedPage
+from shared.utils.ids import uuid7
 
+from services.icp_generator.cache import ICPResponseCache, cache_icp_lists
 from services.icp_generator.schemas import (
     ICPGenerationResponse,
+    ICP_RESPONSE_LIST,
+    ICPListResponse,
     GeneratedICP,
     WebsiteContext,
 )
 from services.icp_generator.prompts import (
-    ICP_SYSTEM_PROMPT,
+    ICP_GENERATION_SYSTEM_PROMPT,
     build_icp_generation_prompt,
     build_minimal_context_prompt,
 )
 
 logger = logging.getLogger(__name__)
 
+# Serializes a whole generation in one call to the compiled serializer
+_GENERATED_ICPS = TypeAdapter(list[GeneratedICP])
+
 
 class ICPGenerationError(Exception):
     """Error during ICP generation."""
     pass
 
 
+class ICPResponseTruncatedError(ICPGenerationError):
+    """LLM response was cut off by the max_tokens limit."""
+    pass
+
+
 class ICPGenerator:
     """
     Generates Ideal Customer Profiles for websites using LLM.
@@ -49,11 +66,15 @@ class ICPGenerator:
 
     MAX_RETRIES = 3
     DEFAULT_TEMPERATURE = 0.4  # Lower for more consistent JSON output
+    MAX_TOKENS = 4096  # Five ICPs typically need ~3000 output tokens
+    MAX_TOKENS_LIMIT = 8192  # Budget for attempts started after a truncated response
 
     def __init__(
         self,
         llm_client: LLMClient | None = None,
         llm_provider: LLMProvider | str = LLMProvider.OPENAI,
+        response_cache: ICPResponseCache | None = None,
+        parallel_attempts: int | None = None,
     ):
         """
         Initialize ICP Generator.
@@ -61,11 +82,16 @@ class ICPGenerator:
         Args:
             llm_client: Pre-configured LLM client (optional).
             llm_provider: LLM provider to use if client not provided.
+            response_cache: Cache of validated LLM responses (optional).
+            parallel_attempts: LLM attempts in flight at once. Defaults to
+                settings.icp_parallel_attempts; 1 retries sequentially.
         """
         if llm_client:
             self._client = llm_client
         else:
             self._client = get_llm_client(llm_provider)
+        self._response_cache = response_cache
+        self.parallel_attempts = max(1, parallel_attempts or settings.icp_parallel_attempts)
 
     async def generate_icps(
         self,
@@ -101,15 +127,25 @@ class ICPGenerator:
 
         logger.info("Generating ICPs for website %s (%s)", website_id, context.domain)
 
-        # Generate ICPs with retries
-        generated_icps = await self._generate_with_retries(context)
+        # Generate ICPs with retries. Regeneration asks for fresh ICPs, so
+        # it bypasses cached responses (but still refreshes the cache).
+        generated_icps = await self._generate_with_retries(
+            context, use_cache=not force_regenerate
+        )
 
-        # Delete existing ICPs if regenerating
-        if force_regenerate:
-            await self._delete_existing_icps(website_id, session)
+        # Store in database, replacing existing ICPs in the same transaction
+        stored_icps = await self._store_icps(
+            website_id, generated_icps, session, replace_existing=force_regenerate
+        )
 
-        # Store in database
-        stored_icps = await self._store_icps(website_id, generated_icps, session)
+        # Prefetch the list responses the dashboard polls for next. Every
+        # new ICP is active, so both list variants are the same.
+        icp_list = ICPListResponse(
+            website_id=website_id,
+            icps=ICP_RESPONSE_LIST.validate_python(stored_icps, from_attributes=True),
+            total=len(stored_icps),
+        )
+        await cache_icp_lists(website_id, {True: icp_list, False: icp_list})
 
         logger.info("Successfully generated %d ICPs for website %s", len(stored_icps), website_id)
         return stored_icps
@@ -117,12 +153,20 @@ class ICPGenerator:
     async def _generate_with_retries(
         self,
         context: WebsiteContext,
+        use_cache: bool = True,
     ) -> list[GeneratedICP]:
         """
         Generate ICPs with retry logic.
 
+        Up to parallel_attempts of the MAX_RETRIES attempts are raced
+        against each other, always keeping one in reserve. Racing trades extra billed LLM calls for not
+        adding a full round-trip of latency per failed attempt.
+        Once a response is truncated at MAX_TOKENS, later attempts get
+        MAX_TOKENS_LIMIT instead.
+
         Args:
             context: Website context for generation.
+            use_cache: Whether a cached response may be returned.
 
         Returns:
             List of validated GeneratedICP objects.
@@ -130,65 +174,138 @@ class ICPGenerator:
         Raises:
             ICPGenerationError: If all retries fail.
         """
+        # Build prompt
+        if context.scraped_content_summary or context.primary_offerings:
+            prompt = build_icp_generation_prompt(context)
+        else:
+            prompt = build_minimal_context_prompt(
+                domain=context.domain,
+                name=context.name,
+                industry=context.industry,
+            )
+
+        cache_key = None
+        if self._response_cache:
+            cache_key = ICPResponseCache.cache_key(
+                ICP_GENERATION_SYSTEM_PROMPT, prompt, self.DEFAULT_TEMPERATURE, self.MAX_TOKENS
+            )
+            cached = await self._response_cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                logger.info("Using cached ICP generation response for %s", context.domain)
+                return ICPGenerationResponse.model_validate_json(cached).icps
+
+        # Up to parallel_attempts attempts are in flight at once; a failed
+        # attempt is replaced by the next one and the first that validates
+        # wins, cancelling the rest. At least one attempt is held back so a
+        # truncated response can still be retried with MAX_TOKENS_LIMIT.
+        attempts = iter(range(self.MAX_RETRIES))
+        max_tokens = self.MAX_TOKENS
+        in_flight = max(1, min(self.parallel_attempts, self.MAX_RETRIES - 1))
+        pending = {
+            asyncio.create_task(self._attempt_generation(prompt, attempt, max_tokens))
+            for attempt in islice(attempts, in_flight)
+        }
         last_error = None
 
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                # Build prompt
-                if context.scraped_content_summary or context.primary_offerings:
-                    prompt = build_icp_generation_prompt(context)
-                else:
-                    prompt = build_minimal_context_prompt(
-                        domain=context.domain,
-                        name=context.name,
-                        industry=context.industry,
-                    )
-
-                # Call LLM
-                response = await self._client.complete_json(
-                    prompt=prompt,
-                    system_prompt=ICP_SYSTEM_PROMPT,
-                    temperature=self.DEFAULT_TEMPERATURE,
-                    max_tokens=8000,
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
+                for task in done:
+                    try:
+                        parsed = task.result()
+                    except Exception as e:
+                        last_error = e
+                        if isinstance(e, ICPResponseTruncatedError):
+                            max_tokens = self.MAX_TOKENS_LIMIT
+                        attempt = next(attempts, None)
+                        if attempt is not None:
+                            pending.add(asyncio.create_task(
+                                self._attempt_generation(prompt, attempt, max_tokens)
+                            ))
+                        continue
+
+                    if cache_key:
+                        await self._response_cache.set(cache_key, parsed.model_dump_json())
+
+                    return parsed.icps
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-                if not response.success:
-                    raise ICPGenerationError("LLM returned empty response")
+        raise ICPGenerationError(
+            f"Failed to generate valid ICPs after {self.MAX_RETRIES} attempts: {last_error}"
+        )
 
-                # Parse and validate
-                parsed = response.parse_as(ICPGenerationResponse)
+    async def _attempt_generation(
+        self,
+        prompt: str,
+        attempt: int,
+        max_tokens: int,
+    ) -> ICPGenerationResponse:
+        """
+        Make one LLM generation attempt and validate the result.
 
-                # Validate diversity
-                self._validate_diversity(parsed.icps)
+        Args:
+            prompt: ICP generation prompt.
+            attempt: Zero-based attempt number, for logging.
+            max_tokens: Maximum response tokens.
 
-                logger.info(
-                    "ICP generation succeeded on attempt %d (tokens: %d, latency: %dms)",
-                    attempt + 1,
-                    response.tokens_used,
-                    response.latency_ms,
-                )
+        Returns:
+            Validated ICP generation response.
 
-                return parsed.icps
+        Raises:
+            ICPResponseTruncatedError: If the response hit max_tokens.
+            ValidationError: If the response does not match the schema.
+            Exception: If the LLM call fails or the ICPs lack diversity.
+        """
+        try:
+            # Call LLM
+            response = await self._client.complete_json(
+                prompt=prompt,
+                system_prompt=ICP_GENERATION_SYSTEM_PROMPT,
+                temperature=self.DEFAULT_TEMPERATURE,
+                max_tokens=max_tokens,
+            )
 
-            except ValidationError as e:
-                last_error = e
-                logger.warning(
-                    "ICP validation failed on attempt %d: %s",
-                    attempt + 1,
-                    str(e)[:200],
+            if not response.success:
+                raise ICPGenerationError("LLM returned empty response")
+            if response.truncated:
+                raise ICPResponseTruncatedError(
+                    f"LLM response truncated at {max_tokens} tokens"
                 )
 
-            except Exception as e:
-                last_error = e
-                logger.warning(
-                    "ICP generation failed on attempt %d: %s",
-                    attempt + 1,
-                    str(e)[:200],
-                )
+            # Parse and validate
+            parsed = response.parse_as(ICPGenerationResponse)
 
-        raise ICPGenerationError(
-            f"Failed to generate valid ICPs after {self.MAX_RETRIES} attempts: {last_error}"
+            # Validate diversity
+            self._validate_diversity(parsed.icps)
+
+        except ValidationError as e:
+            logger.warning(
+                "ICP validation failed on attempt %d: %s",
+                attempt + 1,
+                str(e)[:200],
+            )
+            raise
+
+        except Exception as e:
+            logger.warning(
+                "ICP generation failed on attempt %d: %s",
+                attempt + 1,
+                str(e)[:200],
+            )
+            raise
+
+        logger.info(
+            "ICP generation succeeded on attempt %d (tokens: %d, latency: %dms)",
+            attempt + 1,
+            response.tokens_used,
+            response.latency_ms,
         )
+        return parsed
 
     def _validate_diversity(self, icps: list[GeneratedICP]) -> None:
         """
@@ -203,27 +320,27 @@ class ICPGenerator:
         if len(icps) != 5:
             raise ValueError(f"Expected 5 ICPs, got {len(icps)}")
 
-        # Check unique names
-        names = [icp.name.lower().strip() for icp in icps]
-        if len(set(names)) != 5:
+        # Check unique names before looking at anything else
+        names = {icp.name.lower().strip() for icp in icps}
+        if len(names) != len(icps):
             raise ValueError("ICP names must be unique")
 
-        # Check for some diversity in company sizes
-        company_sizes = set(
-            icp.professional_profile.company_size for icp in icps
-        )
+        # Collect the soft diversity signals in a single pass
+        company_sizes = set()
+        seniority_levels = set()
+        stages = set()
+        for icp in icps:
+            profile = icp.professional_profile
+            company_sizes.add(profile.company_size)
+            seniority_levels.add(profile.seniority_level)
+            stages.add(icp.buying_journey_stage)
+
         if len(company_sizes) < 2:
             logger.warning("Limited diversity in company sizes: %s", company_sizes)
 
-        # Check for diversity in seniority
-        seniority_levels = set(
-            icp.professional_profile.seniority_level for icp in icps
-        )
         if len(seniority_levels) < 2:
             logger.warning("Limited diversity in seniority levels: %s", seniority_levels)
 
-        # Check for diversity in buying journey stages
-        stages = set(icp.buying_journey_stage for icp in icps)
         if len(stages) < 2:
             logger.warning("Limited diversity in buying journey stages: %s", stages)
 
@@ -242,43 +359,40 @@ class ICPGenerator:
         Returns:
             WebsiteContext or None if website not found.
         """
-        # Get website
+        # Website, analysis and the five largest pages in one round-trip.
+        # Only the first 500 chars of each page's text are fetched.
+        top_pages = (
+            select(
+                ScrapedPage.title,
+                func.left(ScrapedPage.content_text, 500).label("content_excerpt"),
+                ScrapedPage.word_count,
+            )
+            .where(ScrapedPage.website_id == Website.id)
+            .order_by(ScrapedPage.word_count.desc())
+            .limit(5)
+            .lateral("top_pages")
+        )
         result = await session.execute(
-            select(Website).where(Website.id == website_id)
+            select(Website, WebsiteAnalysis, top_pages.c.title, top_pages.c.content_excerpt)
+            .outerjoin(WebsiteAnalysis, WebsiteAnalysis.website_id == Website.id)
+            .outerjoin(top_pages, true())
+            .where(Website.id == website_id)
+            .order_by(top_pages.c.word_count.desc())
         )
-        website = result.scalar_one_or_none()
+        rows = result.all()
 
-        if not website:
+        if not rows:
             return None
 
-        # Get analysis
-        analysis_result = await session.execute(
-            select(WebsiteAnalysis).where(WebsiteAnalysis.website_id == website_id)
-        )
-        analysis = analysis_result.scalar_one_or_none()
+        website, analysis = rows[0][0], rows[0][1]
 
         # Get content summary from scraped pages
-        pages_result = await session.execute(
-            select(ScrapedPage)
-            .where(ScrapedPage.website_id == website_id)
-            .order_by(ScrapedPage.word_count.desc())
-            .limit(5)
-        )
-        pages = pages_result.scalars().all()
-
-        content_summary = None
-        if pages:
-            summaries = []
-            for page in pages:
-                if page.content_text:
-                    # Take first 500 chars of each page
-                    text = page.content_text[:500]
-                    if page.title:
-                        summaries.append(f"[{page.title}] {text}")
-                    else:
-                        summaries.append(text)
-            if summaries:
-                content_summary = "\n\n".join(summaries)
+        summaries = [
+            f"[{title}] {text}" if title else text
+            for _, _, title, text in rows
+            if text
+        ]
+        content_summary = "\n\n".join(summaries) if summaries else None
 
         return WebsiteContext(
             domain=website.domain,
@@ -309,63 +423,88 @@ class ICPGenerator:
         )
         return list(result.scalars().all())
 
-    async def _delete_existing_icps(
-        self,
-        website_id: uuid.UUID,
-        session: AsyncSession,
-    ) -> int:
-        """Delete existing ICPs for a website."""
-        result = await session.execute(
-            delete(ICP).where(ICP.website_id == website_id)
-        )
-        await session.commit()
-        return result.rowcount
-
     async def _store_icps(
         self,
         website_id: uuid.UUID,
         generated_icps: list[GeneratedICP],
         session: AsyncSession,
+        replace_existing: bool = False,
     ) -> list[ICP]:
         """
         Store generated ICPs in the database.
 
+        ICPs are upserted on (website_id, sequence_number), so regeneration
+        overwrites the existing rows in one transaction and readers never
+        see a website without ICPs.
+
         Args:
             website_id: Website UUID.
             generated_icps: List of generated ICPs.
             session: Database session.
+            replace_existing: Whether existing ICPs are being regenerated.
+                Their conversations, which no longer match the new
+                profiles, and any ICPs beyond the new count are deleted.
 
         Returns:
             List of stored ICP models.
         """
-        stored = []
-
-        for i, gen_icp in enumerate(generated_icps, start=1):
-            icp = ICP(
-                id=uuid.uuid4(),
-                website_id=website_id,
-                name=gen_icp.name,
-                description=gen_icp.description,
-                sequence_number=i,
-                demographics=gen_icp.demographics.model_dump(),
-                professional_profile=gen_icp.professional_profile.model_dump(),
-                pain_points=gen_icp.pain_points,
-                goals=gen_icp.goals,
-                motivations=gen_icp.motivations.model_dump(),
-                objections=gen_icp.objections,
-                decision_factors=gen_icp.decision_factors,
-                information_sources=gen_icp.information_sources,
-                buying_journey_stage=gen_icp.buying_journey_stage.value,
-                is_active=True,
+        # GeneratedICP fields map one-to-one onto ICP columns
+        values = [
+            {
+                "id": uuid7(),
+                "website_id": website_id,
+                "sequence_number": i,
+                "is_active": True,
+                **payload,
+            }
+            for i, payload in enumerate(
+                _GENERATED_ICPS.dump_python(generated_icps, mode="json"), start=1
             )
-            session.add(icp)
-            stored.append(icp)
+        ]
 
-        await session.commit()
+        if replace_existing:
+            website_icp_ids = select(ICP.id).where(ICP.website_id == website_id)
+            await session.execute(
+                delete(ConversationSequence).where(
+                    ConversationSequence.icp_id.in_(website_icp_ids)
+                )
+            )
+            await session.execute(
+                delete(ICP).where(
+                    ICP.website_id == website_id,
+                    ICP.sequence_number > len(values),
+                )
+            )
 
-        # Refresh to get generated timestamps
-        for icp in stored:
-            await session.refresh(icp)
+        # One INSERT ... ON CONFLICT ... RETURNING writes every ICP and
+        # fills in the server-generated timestamps
+        stmt = insert(ICP)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_icps_website_sequence",
+            set_={
+                "name": stmt.excluded.name,
+                "description": stmt.excluded.description,
+                "demographics": stmt.excluded.demographics,
+                "professional_profile": stmt.excluded.professional_profile,
+                "pain_points": stmt.excluded.pain_points,
+                "goals": stmt.excluded.goals,
+                "motivations": stmt.excluded.motivations,
+                "objections": stmt.excluded.objections,
+                "decision_factors": stmt.excluded.decision_factors,
+                "information_sources": stmt.excluded.information_sources,
+                "buying_journey_stage": stmt.excluded.buying_journey_stage,
+                "is_active": stmt.excluded.is_active,
+                "updated_at": func.now(),
+            },
+        ).returning(ICP, sort_by_parameter_order=True)
+
+        result = await session.scalars(
+            stmt,
+            values,
+            execution_options={"populate_existing": True},
+        )
+        stored = list(result)
+        await session.commit()
 
         return stored
 
@@ -395,3 +534,28 @@ async def get_icps_for_website(
 
     result = await session.execute(query)
     return list(result.scalars().all())
+
+
+async def count_icps_for_website(
+    website_id: uuid.UUID,
+    session: AsyncSession,
+    active_only: bool = True,
+) -> int:
+    """
+    Count ICPs for a website without loading them.
+
+    Args:
+        website_id: Website UUID.
+        session: Database session.
+        active_only: Whether to count only active ICPs.
+
+    Returns:
+        Number of ICPs.
+    """
+    query = select(func.count()).select_from(ICP).where(ICP.website_id == website_id)
+
+    if active_only:
+        query = query.where(ICP.is_active == True)
+
+    result = await session.execute(query)
+    return result.scalar_one()
@@ -4,14 +4,19 @@ ICP Generator Service FastAPI Application.
 Endpoints:
 - POST /generate-icps/{website_id} - Generate ICPs for a website
 - GET /icps/{website_id} - Get ICPs for a website
+
+ICP list reads are served from Redis when cached (see cache.py).
 """
 
+import asyncio
+import logging
 import uuid
 from datetime import datetime, timezone
 
-from fastapi import FastAPI, HTTPException, Depends, Path, Query
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Depends, Path, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.config import settings
@@ -23,18 +28,29 @@ from shared.queue.celery_app import celery_app
 from services.icp_generator.schemas import (
     ICPGenerateRequest,
     ICPGenerateResponse,
+    ICP_RESPONSE_LIST,
     ICPResponse,
     ICPListResponse,
     ICPGenerationStatus,
 )
-from services.icp_generator.generator import get_icps_for_website
-from services.icp_generator.app.tasks import get_job, save_job, ICPJobData, ICPJobStatus
+from services.icp_generator.cache import get_cached_icp_list, invalidate_icp_lists
+from services.icp_generator.generator import count_icps_for_website, get_icps_for_website
+from services.icp_generator.app.tasks import (
+    close_job_store,
+    get_job,
+    save_job,
+    ICPJobData,
+    ICPJobStatus,
+)
+
+logger = logging.getLogger(__name__)
 
 # Create FastAPI app
 app = FastAPI(
     title="ICP Generator Service",
     description="Generate Ideal Customer Profiles using LLM analysis",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -50,12 +66,9 @@ app.add_middleware(
 # ==================== Dependencies ====================
 
 
-async def get_db() -> AsyncSession:
-    """Get database session."""
-    client = get_postgres_client()
-    if not client.is_connected:
-        await client.connect()
-    async with client.session() as session:
+async def get_db(request: Request) -> AsyncSession:
+    """Get database session from the pool opened at startup."""
+    async with request.app.state.db_client.session() as session:
         yield session
 
 
@@ -71,12 +84,41 @@ async def health_check():
 # ==================== ICP Endpoints ====================
 
 
+async def _enqueue_generation(job: ICPJobData, force_regenerate: bool) -> None:
+    """
+    Record a queued job and publish its Celery task.
+
+    Runs as a background task after the 202 response is sent. The job is
+    saved before the task is published so the worker always finds it. If
+    either step fails, the job is marked failed so status polling ends.
+    """
+    try:
+        await save_job(job)
+        # The broker publish is blocking, so keep it off the event loop
+        await asyncio.to_thread(
+            celery_app.send_task,
+            "services.icp_generator.app.tasks.generate_icps_task",
+            args=[str(job.website_id), str(job.job_id), force_regenerate, job.llm_provider],
+            queue="classification",
+        )
+    except Exception as e:
+        job.status = ICPJobStatus.FAILED
+        job.error = str(e)
+        job.completed_at = datetime.now(timezone.utc)
+        try:
+            await save_job(job)
+        except Exception as save_error:
+            logger.error("Failed to record ICP job %s failure: %s", job.job_id, save_error)
+        logger.error("Failed to enqueue ICP generation job %s: %s", job.job_id, e)
+
+
 @app.post(
     "/generate-icps/{website_id}",
     response_model=ICPGenerateResponse,
     status_code=202,
 )
 async def generate_icps(
+    background_tasks: BackgroundTasks,
     website_id: uuid.UUID = Path(..., description="Website ID"),
     request: ICPGenerateRequest = None,
     db: AsyncSession = Depends(get_db),
@@ -91,22 +133,22 @@ async def generate_icps(
 
     # Verify website exists
     result = await db.execute(
-        select(Website).where(Website.id == website_id)
+        select(Website.domain).where(Website.id == website_id)
     )
-    website = result.scalar_one_or_none()
+    domain = result.scalar_one_or_none()
 
-    if not website:
+    if domain is None:
         raise HTTPException(status_code=404, detail="Website not found")
 
     # Check for existing ICPs if not forcing regeneration
     if not request.force_regenerate:
-        existing = await get_icps_for_website(website_id, db)
-        if existing and len(existing) == 5:
+        existing_count = await count_icps_for_website(website_id, db)
+        if existing_count == 5:
             return ICPGenerateResponse(
                 job_id=uuid.uuid4(),  # Dummy job ID
                 website_id=website_id,
                 status="completed",
-                message=f"Using existing {len(existing)} ICPs. Set force_regenerate=true to regenerate.",
+                message=f"Using existing {existing_count} ICPs. Set force_regenerate=true to regenerate.",
             )
 
     # Create job
@@ -117,20 +159,15 @@ async def generate_icps(
         status=ICPJobStatus.QUEUED,
         llm_provider=request.llm_provider,
     )
-    save_job(job)
 
-    # Submit Celery task
-    celery_app.send_task(
-        "services.icp_generator.app.tasks.generate_icps_task",
-        args=[str(website_id), str(job_id), request.force_regenerate, request.llm_provider],
-        queue="classification",
-    )
+    # Save the job and submit the Celery task once the response is sent
+    background_tasks.add_task(_enqueue_generation, job, request.force_regenerate)
 
     return ICPGenerateResponse(
         job_id=job_id,
         website_id=website_id,
         status="queued",
-        message=f"ICP generation queued for {website.domain}",
+        message=f"ICP generation queued for {domain}",
     )
 
 
@@ -144,7 +181,7 @@ async def get_generation_status(
     """
     Get the status of an ICP generation job.
     """
-    job = get_job(str(job_id))
+    job = await get_job(str(job_id))
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -174,42 +211,26 @@ async def get_website_icps(
 
     Returns all ICPs (up to 5) for the specified website.
     """
+    cached = await get_cached_icp_list(website_id, active_only)
+    if cached:
+        return cached
+
     # Verify website exists
     result = await db.execute(
-        select(Website).where(Website.id == website_id)
+        select(Website.id).where(Website.id == website_id)
     )
-    website = result.scalar_one_or_none()
-
-    if not website:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Website not found")
 
     # Get ICPs
     icps = await get_icps_for_website(website_id, db, active_only=active_only)
 
+    # Misses are not written back: a toggle committing between this read
+    # and the write would be overwritten by a stale list. Lists are cached
+    # only by the generation path.
     return ICPListResponse(
         website_id=website_id,
-        icps=[
-            ICPResponse(
-                id=icp.id,
-                website_id=icp.website_id,
-                name=icp.name,
-                description=icp.description,
-                sequence_number=icp.sequence_number,
-                demographics=icp.demographics,
-                professional_profile=icp.professional_profile,
-                pain_points=icp.pain_points,
-                goals=icp.goals,
-                motivations=icp.motivations,
-                objections=icp.objections,
-                decision_factors=icp.decision_factors,
-                information_sources=icp.information_sources,
-                buying_journey_stage=icp.buying_journey_stage,
-                is_active=icp.is_active,
-                created_at=icp.created_at,
-                updated_at=icp.updated_at,
-            )
-            for icp in icps
-        ],
+        icps=ICP_RESPONSE_LIST.validate_python(icps, from_attributes=True),
         total=len(icps),
     )
 
@@ -226,6 +247,12 @@ async def get_single_icp(
     """
     Get a single ICP by ID.
     """
+    cached = await get_cached_icp_list(website_id, active_only=False)
+    if cached:
+        for icp in cached.icps:
+            if icp.id == icp_id:
+                return icp
+
     result = await db.execute(
         select(ICP).where(
             ICP.id == icp_id,
@@ -269,22 +296,25 @@ async def toggle_icp_active(
     """
     Toggle the active status of an ICP.
     """
+    # Flip the flag in one UPDATE ... RETURNING instead of load-then-save
     result = await db.execute(
-        select(ICP).where(
+        update(ICP)
+        .where(
             ICP.id == icp_id,
             ICP.website_id == website_id,
         )
+        .values(is_active=~ICP.is_active)
+        .returning(ICP.id, ICP.is_active)
     )
-    icp = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not icp:
+    if row is None:
         raise HTTPException(status_code=404, detail="ICP not found")
 
-    icp.is_active = not icp.is_active
     await db.commit()
-    await db.refresh(icp)
+    await invalidate_icp_lists(website_id)
 
-    return {"id": icp.id, "is_active": icp.is_active}
+    return {"id": row.id, "is_active": row.is_active}
 
 
 # ==================== Startup/Shutdown ====================
@@ -295,13 +325,15 @@ async def startup_event():
     """Initialize database connection on startup."""
     client = get_postgres_client()
     await client.connect()
+    app.state.db_client = client
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Close database connection on shutdown."""
+    """Close database and job store connections on shutdown."""
     client = get_postgres_client()
     await client.disconnect()
+    await close_job_store()
 
 
 # ==================== Run with Uvicorn ====================
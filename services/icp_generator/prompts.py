@@ -33,52 +33,48 @@ Guidelines for each ICP:
 IMPORTANT: Your response must be valid JSON matching the exact schema provided. Do not include any explanatory text outside the JSON structure."""
 
 
-# User prompt template for ICP generation
-ICP_USER_PROMPT_TEMPLATE = """Based on the following business information, generate exactly 5 distinct Ideal Customer Profiles (ICPs).
-
-## Business Context
-
-{context}
-
-## Output Requirements
+# Output schema shared by every generation request. It carries no
+# per-website data, so it is sent in the system prompt where providers with
+# prompt-prefix caching can reuse it across calls.
+ICP_OUTPUT_SCHEMA = """## Output Requirements
 
 Generate a JSON response with exactly 5 ICPs. Each ICP must include all required fields.
 
 The response must match this exact JSON schema:
-{{
+{
   "icps": [
-    {{
+    {
       "name": "string - descriptive name for the ICP",
       "description": "string - 2-3 sentence description",
-      "demographics": {{
+      "demographics": {
         "age_range": "string (e.g., '25-45')",
         "gender": "string ('male', 'female', 'any')",
         "location": ["array of strings - geographic locations"],
         "education_level": "string or null",
         "income_level": "string or null"
-      }},
-      "professional_profile": {{
+      },
+      "professional_profile": {
         "job_titles": ["array of 3-5 common job titles"],
         "seniority_level": "string (entry, mid, senior, executive)",
         "department": "string or null",
         "company_size": "string (e.g., '10-50', '50-200', '200-1000', '1000+')",
         "industry": ["array of 1-3 target industries"],
         "years_experience": "string or null (e.g., '5-10 years')"
-      }},
+      },
       "pain_points": ["array of 3-7 specific pain points"],
       "goals": ["array of 3-7 professional goals"],
-      "motivations": {{
+      "motivations": {
         "primary": ["array of 3-5 primary motivators"],
         "secondary": ["array of secondary motivators"],
         "triggers": ["array of buying triggers"]
-      }},
+      },
       "objections": ["array of common buying objections"],
       "decision_factors": ["array of 3-7 decision factors"],
       "information_sources": ["array of information sources"],
       "buying_journey_stage": "string (awareness, consideration, decision, retention)"
-    }}
+    }
   ]
-}}
+}
 
 Ensure:
 1. All 5 ICPs are distinctly different
@@ -87,6 +83,27 @@ Ensure:
 4. All required fields are present
 5. The JSON is valid and properly formatted"""
 
+# System prompt sent with generation requests: role instructions followed
+# by the static output schema, byte-identical across calls.
+ICP_GENERATION_SYSTEM_PROMPT = f"{ICP_SYSTEM_PROMPT}\n\n{ICP_OUTPUT_SCHEMA}"
+
+
+# User prompt template for ICP generation
+ICP_USER_PROMPT_TEMPLATE = """Based on the following business information, generate exactly 5 distinct Ideal Customer Profiles (ICPs).
+
+## Business Context
+
+{context}
+
+Respond with a JSON object containing exactly 5 ICPs that follows the output requirements."""
+
+
+# The template's only field is {context}, so it is rendered once around a
+# placeholder and split into the text before and after it.
+_USER_PROMPT_PREFIX, _USER_PROMPT_SUFFIX = ICP_USER_PROMPT_TEMPLATE.format(
+    context="\0"
+).split("\0")
+
 
 def build_icp_generation_prompt(context: WebsiteContext) -> str:
     """
@@ -99,7 +116,7 @@ def build_icp_generation_prompt(context: WebsiteContext) -> str:
         Formatted user prompt string.
     """
     context_text = context.to_prompt_context()
-    return ICP_USER_PROMPT_TEMPLATE.format(context=context_text)
+    return "".join((_USER_PROMPT_PREFIX, context_text, _USER_PROMPT_SUFFIX))
 
 
 # Validation prompt to check and fix ICPs
@@ -128,7 +145,7 @@ Industry (if known): {industry}
 
 Since we have limited information, make reasonable assumptions based on the domain name and any industry hints. Create diverse profiles that would typically be interested in a {industry_or_general} business.
 
-{schema_instructions}"""
+Respond with a JSON object containing exactly 5 ICPs that follows the output requirements."""
 
 
 def build_minimal_context_prompt(
@@ -154,7 +171,6 @@ def build_minimal_context_prompt(
         name=name or domain,
         industry=industry or "Unknown",
         industry_or_general=industry_or_general,
-        schema_instructions=ICP_USER_PROMPT_TEMPLATE.split("## Output Requirements")[1],
     )
 
 
@@ -7,9 +7,10 @@ Defines structured output schemas for LLM-generated ICPs.
 import uuid
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
 
 
 class BuyingJourneyStage(str, Enum):
@@ -60,32 +61,21 @@ class GeneratedICP(BaseModel):
     information_sources: list[str] = Field(default_factory=list, description="Where they research solutions")
     buying_journey_stage: BuyingJourneyStage = Field(..., description="Typical entry point in buying journey")
 
-    @field_validator("pain_points", "goals", "decision_factors")
-    @classmethod
-    def validate_list_length(cls, v, info):
-        if len(v) < 3:
-            raise ValueError(f"{info.field_name} must have at least 3 items")
-        return v
-
 
 class ICPGenerationResponse(BaseModel):
     """Response schema for ICP generation from LLM."""
     icps: list[GeneratedICP] = Field(..., min_length=5, max_length=5, description="Exactly 5 ICPs")
 
-    @field_validator("icps")
-    @classmethod
-    def validate_exactly_five(cls, v):
-        if len(v) != 5:
-            raise ValueError(f"Must have exactly 5 ICPs, got {len(v)}")
-        return v
-
-    @field_validator("icps")
-    @classmethod
-    def validate_unique_names(cls, v):
-        names = [icp.name.lower() for icp in v]
-        if len(names) != len(set(names)):
-            raise ValueError("ICP names must be unique")
-        return v
+    @model_validator(mode="after")
+    def validate_unique_names(self) -> "ICPGenerationResponse":
+        """Validate that ICP names are unique, ignoring case."""
+        seen: set[str] = set()
+        for icp in self.icps:
+            name = icp.name.lower()
+            if name in seen:
+                raise ValueError("ICP names must be unique")
+            seen.add(name)
+        return self
 
 
 # ==================== API Request/Response Schemas ====================
@@ -152,9 +142,26 @@ class ICPListResponse(BaseModel):
     total: int
 
 
+# Validates a whole list of ICP rows in one call to the compiled validator
+ICP_RESPONSE_LIST = TypeAdapter(list[ICPResponse])
+
+
 # ==================== Internal Schemas ====================
 
 
+def _detail_lines(items: list[dict[str, Any]]) -> str:
+    """Render up to 5 named items as "- name: description" lines."""
+    lines = []
+    for item in items[:5]:
+        name = item.get("name", "")
+        if name:
+            desc = item.get("description", "")
+            if len(desc) > 100:
+                desc = desc[:100] + "..."
+            lines.append(f"- {name}: {desc}")
+    return "\n".join(lines)
+
+
 class WebsiteContext(BaseModel):
     """Context about a website for ICP generation."""
     domain: str
@@ -171,8 +178,16 @@ class WebsiteContext(BaseModel):
     target_audience: list[dict[str, Any]] | None
     scraped_content_summary: str | None = None
 
+    # Frozen so the rendered prompt context can be cached on the instance
+    model_config = {"frozen": True}
+
     def to_prompt_context(self) -> str:
         """Convert to a text context for LLM prompts."""
+        return self.prompt_context
+
+    @cached_property
+    def prompt_context(self) -> str:
+        """Text context for LLM prompts, rendered once per instance."""
         parts = []
 
         if self.name:
@@ -206,24 +221,14 @@ class WebsiteContext(BaseModel):
                 parts.append(f"Founded: {cp['founding_year']}")
 
         if self.products_detailed:
-            prods = []
-            for p in self.products_detailed[:5]:
-                name = p.get("name", "")
-                desc = p.get("description", "")
-                if name:
-                    prods.append(f"- {name}: {desc[:100]}..." if len(desc) > 100 else f"- {name}: {desc}")
+            prods = _detail_lines(self.products_detailed)
             if prods:
-                parts.append("Detailed Products:\n" + "\n".join(prods))
+                parts.append("Detailed Products:\n" + prods)
 
         if self.services_detailed:
-            servs = []
-            for s in self.services_detailed[:5]:
-                name = s.get("name", "")
-                desc = s.get("description", "")
-                if name:
-                    servs.append(f"- {name}: {desc[:100]}..." if len(desc) > 100 else f"- {name}: {desc}")
+            servs = _detail_lines(self.services_detailed)
             if servs:
-                parts.append("Detailed Services:\n" + "\n".join(servs))
+                parts.append("Detailed Services:\n" + servs)
 
         if self.target_audience:
             audiences = [a.get("segment", str(a)) for a in self.target_audience[:5]]
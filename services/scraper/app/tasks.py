@@ -4,39 +4,118 @@ Celery tasks for website scraping.
 Implements async scraping tasks using the WebsiteScraper and components.
 """
 
-import asyncio
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 
 from celery import shared_task
+from celery.signals import celeryd_after_setup, worker_process_init
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.config import settings
-from shared.db.postgres_client import get_postgres_client
 from shared.models.enums import WebsiteStatus
 from shared.queue.celery_app import celery_app
+from shared.queue.job_store import RedisJobStore
+from shared.queue.worker_loop import get_worker_postgres, run_async
 
 from services.scraper.scraper import WebsiteScraper
 from services.scraper.schemas import ScrapeType, JobStatus, ScrapeJobData
 from services.scraper.components.storage_handler import StorageHandler
+from services.scraper.components.ner_extractor import NERExtractor, warm_spacy_model
 
 import logging
 
 logger = logging.getLogger(__name__)
 
-# In-memory job tracking (in production, use Redis)
-_job_store: dict[str, ScrapeJobData] = {}
+# Jobs live in Redis so the API and every Celery worker see the same state;
+# progress ticks update individual fields instead of rewriting the job.
+_job_store = RedisJobStore("scrape:job", list_fields=("scraped_urls", "failed_urls"))
 
 
-def get_job(job_id: str) -> ScrapeJobData | None:
+async def get_job(job_id: str) -> ScrapeJobData | None:
     """Get job data by ID."""
-    return _job_store.get(job_id)
+    data = await _job_store.get(job_id)
+    return ScrapeJobData.model_validate(data) if data else None
 
 
-def save_job(job: ScrapeJobData) -> None:
+async def save_job(job: ScrapeJobData) -> None:
     """Save job data."""
-    _job_store[str(job.job_id)] = job
+    await _job_store.save(str(job.job_id), job.model_dump(mode="json"))
+
+
+async def close_job_store() -> None:
+    """Close the job-tracking Redis client."""
+    await _job_store.close()
+
+
+# This module is included by every worker, but only workers consuming the
+# scraping queue run NER. The flag is set in the main worker process before
+# the pool forks, so child processes inherit it.
+SCRAPING_QUEUE = "scraping"
+_warm_ner_model = False
+
+
+@celeryd_after_setup.connect
+def _check_scraping_queue(sender: str, instance: Any, **kwargs: Any) -> None:
+    """Enable spaCy warm-up if this worker consumes the scraping queue."""
+    global _warm_ner_model
+    _warm_ner_model = SCRAPING_QUEUE in instance.app.amqp.queues.consume_from
+
+
+@worker_process_init.connect
+def _warm_extractors(**kwargs: Any) -> None:
+    """Load the spaCy NER model at worker start instead of in the first scrape."""
+    if _warm_ner_model:
+        warm_spacy_model(NERExtractor.SPACY_MODEL)
+
+
+class ProgressBuffer:
+    """
+    Coalesces per-page scrape progress into periodic job store updates.
+
+    Pages are buffered and written in one update once FLUSH_PAGES pages
+    have accumulated or FLUSH_SECONDS have passed since the last write.
+    """
+
+    FLUSH_PAGES = 50
+    FLUSH_SECONDS = 0.5
+
+    def __init__(self, store: RedisJobStore, job_id: str):
+        self._store = store
+        self._job_id = job_id
+        self._fields: dict[str, int] = {}
+        self._scraped_urls: list[str] = []
+        self._failed_urls: list[str] = []
+        self._last_flush = time.monotonic()
+
+    async def add(self, completed: int, pending: int, url: str, success: bool) -> None:
+        """Record one finished page, flushing if the buffer is due."""
+        self._fields = {"completed_pages": completed, "total_pages": completed + pending}
+        (self._scraped_urls if success else self._failed_urls).append(url)
+
+        buffered = len(self._scraped_urls) + len(self._failed_urls)
+        if (
+            buffered >= self.FLUSH_PAGES
+            or time.monotonic() - self._last_flush >= self.FLUSH_SECONDS
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write buffered progress to the job store."""
+        if not self._fields:
+            return
+        increments = {"failed_pages": len(self._failed_urls)} if self._failed_urls else {}
+        await self._store.update(
+            self._job_id,
+            fields=self._fields,
+            increments=increments,
+            appends={"scraped_urls": self._scraped_urls, "failed_urls": self._failed_urls},
+        )
+        self._fields = {}
+        self._scraped_urls = []
+        self._failed_urls = []
+        self._last_flush = time.monotonic()
 
 
 async def _run_scrape(
@@ -55,9 +134,8 @@ async def _run_scrape(
     Returns:
         Result dictionary.
     """
-    # Get database session
-    pg_client = get_postgres_client()
-    await pg_client.connect()
+    # Pooled connections stay open on the worker loop across tasks
+    pg_client = await get_worker_postgres()
 
     try:
         async with pg_client.session() as session:
@@ -68,12 +146,14 @@ async def _run_scrape(
             if not website:
                 raise ValueError(f"Website not found: {website_id}")
 
-            # Update job status
-            job = get_job(str(job_id))
-            if job:
-                job.status = JobStatus.RUNNING
-                job.started_at = datetime.now(timezone.utc)
-                save_job(job)
+            # Update job status. Only progress of tracked jobs is recorded,
+            # and the worker never loads the full job model.
+            tracked = await _job_store.exists(str(job_id))
+            if tracked:
+                await _job_store.update(str(job_id), fields={
+                    "status": JobStatus.RUNNING.value,
+                    "started_at": datetime.now(timezone.utc).isoformat(),
+                })
 
             # Update website status
             await storage.update_website_status(website_id, WebsiteStatus.SCRAPING)
@@ -96,32 +176,30 @@ async def _run_scrape(
                         )
 
                 # Progress callback
+                progress = ProgressBuffer(_job_store, str(job_id)) if tracked else None
+
                 async def on_progress(completed: int, pending: int, result: Any) -> None:
-                    job = get_job(str(job_id))
-                    if job:
-                        job.completed_pages = completed
-                        job.total_pages = completed + pending
-                        if not result.success:
-                            job.failed_pages += 1
-                            job.failed_urls.append(result.url)
-                        else:
-                            job.scraped_urls.append(result.url)
-                        save_job(job)
+                    if progress:
+                        await progress.add(completed, pending, result.url, result.success)
 
                 # Run scrape with enhanced business intelligence extraction
-                results, entities, business_intel, named_entities = await scraper.scrape_website(
-                    url=website.url,
-                    scrape_type=scrape_type,
-                    existing_hashes=existing_hashes,
-                    progress_callback=on_progress,
-                    extract_business_intel=True,
-                )
+                try:
+                    results, entities, business_intel, named_entities = await scraper.scrape_website(
+                        url=website.url,
+                        scrape_type=scrape_type,
+                        existing_hashes=existing_hashes,
+                        progress_callback=on_progress,
+                        extract_business_intel=True,
+                    )
+                finally:
+                    if progress:
+                        await progress.flush()
 
                 # Record hard scrape
                 if scrape_type == ScrapeType.HARD:
                     scraper.record_hard_scrape(website.domain)
 
-            # Store results
+            # Store results (one row per successful page)
             pages_to_store = []
             for result in results:
                 if result.success:
@@ -168,13 +246,13 @@ async def _run_scrape(
             )
 
             # Update job status
-            job = get_job(str(job_id))
-            if job:
-                job.status = JobStatus.COMPLETED
-                job.completed_at = datetime.now(timezone.utc)
-                save_job(job)
+            if tracked:
+                await _job_store.update(str(job_id), fields={
+                    "status": JobStatus.COMPLETED.value,
+                    "completed_at": datetime.now(timezone.utc).isoformat(),
+                })
 
-            successful = sum(1 for r in results if r.success)
+            successful = len(pages_to_store)
             return {
                 "status": "completed",
                 "website_id": str(website_id),
@@ -186,13 +264,16 @@ async def _run_scrape(
     except Exception as e:
         logger.error("Scrape failed: %s", e)
 
-        # Update job status
-        job = get_job(str(job_id))
-        if job:
-            job.status = JobStatus.FAILED
-            job.error = str(e)
-            job.completed_at = datetime.now(timezone.utc)
-            save_job(job)
+        # Update job status without masking the scrape error
+        try:
+            if await _job_store.exists(str(job_id)):
+                await _job_store.update(str(job_id), fields={
+                    "status": JobStatus.FAILED.value,
+                    "error": str(e),
+                    "completed_at": datetime.now(timezone.utc).isoformat(),
+                })
+        except Exception as store_error:
+            logger.warning("Failed to record scrape job failure: %s", store_error)
 
         # Update website status
         try:
@@ -204,9 +285,6 @@ async def _run_scrape(
 
         raise
 
-    finally:
-        await pg_client.disconnect()
-
 
 @celery_app.task(
     bind=True,
@@ -233,8 +311,8 @@ def scrape_website(self, website_id: str, scrape_type: str = "incremental", job_
         if not job_id:
             job_id = str(uuid.uuid4())
 
-        # Run async scrape
-        result = asyncio.run(_run_scrape(
+        # Run async scrape on the worker loop that owns the pool
+        result = run_async(_run_scrape(
             website_id=uuid.UUID(website_id),
             scrape_type=ScrapeType(scrape_type),
             job_id=uuid.UUID(job_id),
@@ -285,4 +363,4 @@ def scrape_page(website_id: str, url: str):
                 "error": result.error,
             }
 
-    return asyncio.run(_scrape())
+    return run_async(_scrape())
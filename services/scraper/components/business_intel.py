@@ -16,8 +16,16 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Keywords marking h1-h3 headings as product or service section headings
+_PRODUCT_HEADING_KEYWORDS = ("product", "solution", "platform", "feature")
+_SERVICE_HEADING_KEYWORDS = ("service", "consulting", "support", "training", "implementation")
 
-@dataclass
+# Section headings that name a category rather than a specific offering
+_GENERIC_PRODUCT_HEADINGS = frozenset({"our products", "products", "our solutions", "solutions"})
+_GENERIC_SERVICE_HEADINGS = frozenset({"our services", "services"})
+
+
+@dataclass(slots=True)
 class ProductOffering:
     """Extracted product offering."""
     name: str
@@ -29,7 +37,7 @@ class ProductOffering:
     source: str = "text"
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceOffering:
     """Extracted service offering."""
     name: str
@@ -41,7 +49,7 @@ class ServiceOffering:
     source: str = "text"
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetAudienceSignal:
     """Signal indicating target audience."""
     segment: str
@@ -50,7 +58,7 @@ class TargetAudienceSignal:
     source: str = "text"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValueProposition:
     """Extracted value proposition."""
     statement: str
@@ -59,7 +67,7 @@ class ValueProposition:
     confidence: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyProfile:
     """Extracted company profile."""
     name: str | None = None
@@ -72,7 +80,7 @@ class CompanyProfile:
     industry: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessIntelligence:
     """Aggregated business intelligence from website."""
     company_profile: CompanyProfile = field(default_factory=CompanyProfile)
@@ -195,6 +203,28 @@ class BusinessIntelligenceExtractor:
         (r"(?:B2B|B2C|SaaS|ecommerce|e-commerce|retail|healthcare|fintech)", "industry"),
     ]
 
+    # Technology keywords, matched as whole words in lowercased text
+    TECH_KEYWORDS = [
+        "api", "rest", "graphql", "webhook", "sdk", "oauth", "jwt",
+        "saas", "cloud", "aws", "azure", "gcp", "docker", "kubernetes",
+        "react", "vue", "angular", "next.js", "node", "python", "java",
+        "ai", "machine learning", "nlp", "deep learning",
+        "blockchain", "iot", "mobile", "native app",
+        "postgresql", "mongodb", "redis", "elasticsearch",
+    ]
+
+    # Certification and compliance mentions
+    CERTIFICATION_PATTERNS = [
+        r"SOC\s*2(?:\s+Type\s*[12I]+)?",
+        r"HIPAA(?:\s+compliant)?",
+        r"GDPR(?:\s+compliant)?",
+        r"ISO\s*\d{4,5}",
+        r"PCI[- ]DSS",
+        r"FedRAMP",
+        r"CCPA",
+        r"SOX\s+compliant",
+    ]
+
     # Company profile patterns
     COMPANY_PATTERNS = {
         "tagline": [
@@ -219,6 +249,29 @@ class BusinessIntelligenceExtractor:
         r"<h[1-3][^>]*>(?:Our\s+)?(?:Products?|Solutions?|Platform|Features?)</h[1-3]>",
     ]
 
+    # Industry keywords, matched as substrings of lowercased text
+    INDUSTRY_KEYWORDS = {
+        "healthcare": ["healthcare", "medical", "health", "hospital", "patient", "clinical", "pharma"],
+        "finance": ["finance", "financial", "banking", "fintech", "payment", "investment", "trading"],
+        "ecommerce": ["ecommerce", "e-commerce", "retail", "shopping", "store", "commerce", "marketplace"],
+        "education": ["education", "learning", "edtech", "school", "training", "course", "university"],
+        "technology": ["technology", "tech", "software", "saas", "digital", "it ", "developer"],
+        "marketing": ["marketing", "advertising", "martech", "seo", "social media", "campaign", "brand"],
+        "real_estate": ["real estate", "property", "housing", "rental", "realty", "mortgage"],
+        "logistics": ["logistics", "shipping", "supply chain", "delivery", "freight", "warehouse"],
+        "manufacturing": ["manufacturing", "factory", "production", "industrial", "assembly"],
+        "hospitality": ["hotel", "restaurant", "hospitality", "tourism", "travel", "booking"],
+    }
+
+    # Industry keywords are scored over the start of the combined crawl text,
+    # which begins with the first pages crawled (normally the homepage). A
+    # larger window trades scan time for recall on long multi-page crawls.
+    INDUSTRY_SCAN_CHARS = 32768
+
+    # Literal class names the tagline and product card HTML patterns require
+    TAGLINE_CLASS_KEYWORDS = ("tagline", "slogan", "subtitle", "hero")
+    PRODUCT_CARD_CLASS_KEYWORDS = ("product", "card", "item")
+
     # Service section indicators
     SERVICE_SECTION_PATTERNS = [
         r"<(?:section|div)[^>]*(?:class|id)=[\"'][^\"']*(?:service|offering|solution)[^\"']*[\"']",
@@ -232,15 +285,64 @@ class BusinessIntelligenceExtractor:
 
     def _compile_patterns(self) -> None:
         """Pre-compile regex patterns for efficiency."""
+        # Value proposition and audience patterns stay separate scans: their
+        # matches overlap (e.g. "Save 10 hours" is both a time and a cost
+        # saving, "automate secure workflows" holds a risk term) and a fused
+        # alternation would drop every match overlapping an earlier one.
         for category, patterns in [
             ("value_prop", self.VALUE_PROP_PATTERNS),
             ("audience", self.AUDIENCE_PATTERNS),
         ]:
             self._compiled_patterns[category] = [
-                (re.compile(p[0], re.IGNORECASE), p[1])
-                for p in patterns
+                (re.compile(pattern, re.IGNORECASE), pattern_type)
+                for pattern, pattern_type in patterns
             ]
 
+        # Certification patterns are disjoint, so one fused scan finds them all
+        self._compiled_patterns["certification"] = re.compile(
+            "|".join(self.CERTIFICATION_PATTERNS), re.IGNORECASE
+        )
+
+        # Technologies are found in one pass over the lowercased text.
+        # Longest keywords come first so multi-word names win over prefixes.
+        techs = sorted(self.TECH_KEYWORDS, key=len, reverse=True)
+        self._compiled_patterns["technology"] = re.compile(
+            r"\b(" + "|".join(re.escape(tech) for tech in techs) + r")\b"
+        )
+        self._technology_names = {
+            tech: tech.upper() if len(tech) <= 4 else tech.title()
+            for tech in self.TECH_KEYWORDS
+        }
+
+        # One-off patterns used by the profile, product, service and
+        # partnership extractors
+        self._compiled_patterns["tagline"] = re.compile(
+            r'<(?:h1|p)[^>]*class=["\'][^"\']*(?:tagline|slogan|subtitle|hero)[^"\']*["\'][^>]*>'
+            r'([^<]+)',
+            re.IGNORECASE,
+        )
+        self._compiled_patterns["founding_year"] = re.compile(
+            r"(?:founded|established|since|started)\s+(?:in\s+)?(\d{4})", re.IGNORECASE
+        )
+        self._compiled_patterns["company_size"] = re.compile(
+            r"(\d+[,\d]*\+?)\s*(?:employees?|team\s+members?|people)", re.IGNORECASE
+        )
+        self._compiled_patterns["product_card"] = re.compile(
+            r'<(?:div|article|li)[^>]*class=["\'][^"\']*(?:product|card|item)[^"\']*["\'][^>]*>'
+            r'.*?<(?:h[2-4]|strong|b)[^>]*>([^<]+)</(?:h[2-4]|strong|b)>',
+            re.IGNORECASE | re.DOTALL,
+        )
+        self._compiled_patterns["service"] = re.compile(
+            r"(?:we\s+(?:offer|provide)|our\s+services?\s+include)\s*:?\s*([^.]+)",
+            re.IGNORECASE,
+        )
+        self._compiled_patterns["service_delimiter"] = re.compile(r"[,;•\n]")
+        self._compiled_patterns["partner"] = re.compile(
+            r"(?:partner(?:s|ed|ship)?|integrat(?:es?|ion)|works?\s+with)\s+(?:with\s+)?"
+            r"([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)?)",
+            re.MULTILINE,
+        )
+
     def extract(
         self,
         content_text: str,
@@ -268,14 +370,33 @@ class BusinessIntelligenceExtractor:
         """
         intel = BusinessIntelligence()
 
+        # Lowercased once for every keyword scan and literal prefilter below
+        text_lower = content_text.lower()
+        html_lower = html.lower()
+
+        # Group structured data by schema.org type once for every extractor
+        structured_by_type: dict[str, list[dict[str, Any]]] = {}
+        for data in structured_data:
+            schema_type = data.get("@type")
+            if isinstance(schema_type, str):
+                structured_by_type.setdefault(schema_type, []).append(data)
+
         # Extract company profile
         intel.company_profile = self._extract_company_profile(
-            content_text, html, structured_data, meta_description, title, domain
+            content_text, text_lower, html, html_lower,
+            structured_by_type, meta_description, title, domain,
         )
 
-        # Extract products and services
-        intel.products = self._extract_products(content_text, html, headings, structured_data)
-        intel.services = self._extract_services(content_text, html, headings, structured_data)
+        # Extract products and services from the same lowercased h1-h3 headings
+        section_headings = [
+            (h, h["text"].lower()) for h in headings if h["level"] in ("h1", "h2", "h3")
+        ]
+        intel.products = self._extract_products(
+            content_text, html, html_lower, section_headings, structured_by_type
+        )
+        intel.services = self._extract_services(
+            content_text, html, section_headings, structured_by_type
+        )
 
         # Extract value propositions
         intel.value_propositions = self._extract_value_propositions(content_text, headings)
@@ -284,17 +405,19 @@ class BusinessIntelligenceExtractor:
         intel.target_audience = self._extract_target_audience(content_text, headings)
 
         # Extract additional info
-        intel.technologies_used = self._extract_technologies(content_text)
+        intel.technologies_used = self._extract_technologies(text_lower)
         intel.certifications = self._extract_certifications(content_text)
-        intel.partnerships = self._extract_partnerships(content_text, structured_data)
+        intel.partnerships = self._extract_partnerships(content_text, structured_by_type)
 
         return intel
 
     def _extract_company_profile(
         self,
         content_text: str,
+        text_lower: str,
         html: str,
-        structured_data: list[dict[str, Any]],
+        html_lower: str,
+        structured_by_type: dict[str, list[dict[str, Any]]],
         meta_description: str | None,
         title: str | None,
         domain: str,
@@ -303,62 +426,57 @@ class BusinessIntelligenceExtractor:
         profile = CompanyProfile()
 
         # Extract from structured data (highest priority)
-        for data in structured_data:
-            schema_type = data.get("@type", "")
-            if schema_type in ("Organization", "Corporation", "LocalBusiness"):
-                profile.name = data.get("name") or profile.name
-                profile.description = data.get("description") or profile.description
-
-                address = data.get("address", {})
-                if isinstance(address, dict):
-                    locality = address.get("addressLocality", "")
-                    region = address.get("addressRegion", "")
-                    if locality or region:
-                        profile.headquarters = f"{locality}, {region}".strip(", ")
-
-                if data.get("foundingDate"):
-                    try:
-                        profile.founding_year = int(data["foundingDate"][:4])
-                    except (ValueError, TypeError):
-                        pass
+        organizations = self._of_types(
+            structured_by_type, "Organization", "Corporation", "LocalBusiness"
+        )
+        for data in organizations:
+            profile.name = data.get("name") or profile.name
+            profile.description = data.get("description") or profile.description
+
+            address = data.get("address", {})
+            if isinstance(address, dict):
+                locality = address.get("addressLocality", "")
+                region = address.get("addressRegion", "")
+                if locality or region:
+                    profile.headquarters = f"{locality}, {region}".strip(", ")
+
+            if data.get("foundingDate"):
+                try:
+                    profile.founding_year = int(data["foundingDate"][:4])
+                except (ValueError, TypeError):
+                    pass
 
         # Extract company name from title if not found
         if not profile.name and title:
             # Remove common suffixes
             name = title
-            for suffix in [" - Home", " | Home", " - Official", " | Official", " - ", " | "]:
-                if suffix in name:
-                    name = name.split(suffix)[0].strip()
+            for suffix in (" - Home", " | Home", " - Official", " | Official", " - ", " | "):
+                index = name.find(suffix)
+                if index != -1:
+                    name = name[:index].strip()
                     break
             if len(name) < 50:
                 profile.name = name
 
         # Fall back to domain name
         if not profile.name:
-            domain_parts = domain.replace("www.", "").split(".")
-            if domain_parts:
-                profile.name = domain_parts[0].title()
+            profile.name = domain.removeprefix("www.").partition(".")[0].title()
 
         # Use meta description as company description if suitable
         if not profile.description and meta_description:
             if len(meta_description) > 50:
                 profile.description = meta_description
 
-        # Extract tagline from first prominent heading or hero section
-        if not profile.tagline:
-            tagline_match = re.search(
-                r'<(?:h1|p)[^>]*class=["\'][^"\']*(?:tagline|slogan|subtitle|hero)[^"\']*["\'][^>]*>([^<]+)',
-                html, re.IGNORECASE
-            )
+        # Extract tagline from first prominent heading or hero section,
+        # skipping the HTML scan when no tagline class name appears at all
+        if not profile.tagline and any(kw in html_lower for kw in self.TAGLINE_CLASS_KEYWORDS):
+            tagline_match = self._compiled_patterns["tagline"].search(html)
             if tagline_match:
                 profile.tagline = tagline_match.group(1).strip()
 
         # Extract founding year
         if not profile.founding_year:
-            year_match = re.search(
-                r"(?:founded|established|since|started)\s+(?:in\s+)?(\d{4})",
-                content_text, re.IGNORECASE
-            )
+            year_match = self._compiled_patterns["founding_year"].search(content_text)
             if year_match:
                 try:
                     year = int(year_match.group(1))
@@ -369,16 +487,13 @@ class BusinessIntelligenceExtractor:
 
         # Extract company size
         if not profile.company_size:
-            size_match = re.search(
-                r"(\d+[,\d]*\+?)\s*(?:employees?|team\s+members?|people)",
-                content_text, re.IGNORECASE
-            )
+            size_match = self._compiled_patterns["company_size"].search(content_text)
             if size_match:
                 profile.company_size = size_match.group(0)
 
         # Detect industry from content
         if not profile.industry:
-            profile.industry = self._detect_industry(content_text)
+            profile.industry = self._detect_industry(text_lower[:self.INDUSTRY_SCAN_CHARS])
 
         return profile
 
@@ -386,63 +501,58 @@ class BusinessIntelligenceExtractor:
         self,
         content_text: str,
         html: str,
-        headings: list[dict[str, str]],
-        structured_data: list[dict[str, Any]],
+        html_lower: str,
+        section_headings: list[tuple[dict[str, str], str]],
+        structured_by_type: dict[str, list[dict[str, Any]]],
     ) -> list[ProductOffering]:
         """Extract product offerings."""
         products = []
         seen_names = set()
 
         # Extract from structured data first
-        for data in structured_data:
-            if data.get("@type") in ("Product", "SoftwareApplication"):
-                name = data.get("name", "").strip()
-                if name and name.lower() not in seen_names:
-                    seen_names.add(name.lower())
-                    products.append(ProductOffering(
-                        name=name,
-                        description=data.get("description"),
-                        category=data.get("category") or data.get("applicationCategory"),
-                        pricing=self._extract_price_from_structured(data),
-                        confidence=0.9,
-                        source="structured_data",
-                    ))
+        for data in self._of_types(structured_by_type, "Product", "SoftwareApplication"):
+            name = data.get("name", "").strip()
+            key = name.lower()
+            if name and key not in seen_names:
+                seen_names.add(key)
+                products.append(ProductOffering(
+                    name=name,
+                    description=data.get("description"),
+                    category=data.get("category") or data.get("applicationCategory"),
+                    pricing=self._extract_price_from_structured(data),
+                    confidence=0.9,
+                    source="structured_data",
+                ))
 
         # Extract from headings in product sections
-        product_headings = [
-            h for h in headings
-            if any(kw in h["text"].lower() for kw in ["product", "solution", "platform", "feature"])
-            and h["level"] in ("h1", "h2", "h3")
-        ]
-
-        for heading in product_headings:
+        for heading, heading_lower in section_headings:
+            if not any(kw in heading_lower for kw in _PRODUCT_HEADING_KEYWORDS):
+                continue
             name = heading["text"].strip()
-            if name and name.lower() not in seen_names and len(name) < 100:
+            key = heading_lower.strip()
+            if name and key not in seen_names and len(name) < 100:
                 # Skip generic headings
-                if name.lower() not in ("our products", "products", "our solutions", "solutions"):
-                    seen_names.add(name.lower())
+                if key not in _GENERIC_PRODUCT_HEADINGS:
+                    seen_names.add(key)
                     products.append(ProductOffering(
                         name=name,
                         confidence=0.6,
                         source="heading",
                     ))
 
-        # Look for product cards/items in HTML
-        product_card_pattern = re.compile(
-            r'<(?:div|article|li)[^>]*class=["\'][^"\']*(?:product|card|item)[^"\']*["\'][^>]*>.*?'
-            r'<(?:h[2-4]|strong|b)[^>]*>([^<]+)</(?:h[2-4]|strong|b)>',
-            re.IGNORECASE | re.DOTALL
-        )
-
-        for match in product_card_pattern.finditer(html):
-            name = match.group(1).strip()
-            if name and name.lower() not in seen_names and 3 < len(name) < 80:
-                seen_names.add(name.lower())
-                products.append(ProductOffering(
-                    name=name,
-                    confidence=0.5,
-                    source="html_pattern",
-                ))
+        # Look for product cards/items in HTML, unless no card class name
+        # appears anywhere in the page
+        if any(kw in html_lower for kw in self.PRODUCT_CARD_CLASS_KEYWORDS):
+            for match in self._compiled_patterns["product_card"].finditer(html):
+                name = match.group(1).strip()
+                key = name.lower()
+                if name and key not in seen_names and 3 < len(name) < 80:
+                    seen_names.add(key)
+                    products.append(ProductOffering(
+                        name=name,
+                        confidence=0.5,
+                        source="html_pattern",
+                    ))
 
         return products[:20]  # Limit to top 20
 
@@ -450,39 +560,35 @@ class BusinessIntelligenceExtractor:
         self,
         content_text: str,
         html: str,
-        headings: list[dict[str, str]],
-        structured_data: list[dict[str, Any]],
+        section_headings: list[tuple[dict[str, str], str]],
+        structured_by_type: dict[str, list[dict[str, Any]]],
     ) -> list[ServiceOffering]:
         """Extract service offerings."""
         services = []
         seen_names = set()
 
         # Extract from structured data first
-        for data in structured_data:
-            if data.get("@type") == "Service":
-                name = data.get("name", "").strip()
-                if name and name.lower() not in seen_names:
-                    seen_names.add(name.lower())
-                    services.append(ServiceOffering(
-                        name=name,
-                        description=data.get("description"),
-                        confidence=0.9,
-                        source="structured_data",
-                    ))
+        for data in structured_by_type.get("Service", ()):
+            name = data.get("name", "").strip()
+            key = name.lower()
+            if name and key not in seen_names:
+                seen_names.add(key)
+                services.append(ServiceOffering(
+                    name=name,
+                    description=data.get("description"),
+                    confidence=0.9,
+                    source="structured_data",
+                ))
 
         # Extract from headings in service sections
-        service_keywords = ["service", "consulting", "support", "training", "implementation"]
-        service_headings = [
-            h for h in headings
-            if any(kw in h["text"].lower() for kw in service_keywords)
-            and h["level"] in ("h1", "h2", "h3")
-        ]
-
-        for heading in service_headings:
+        for heading, heading_lower in section_headings:
+            if not any(kw in heading_lower for kw in _SERVICE_HEADING_KEYWORDS):
+                continue
             name = heading["text"].strip()
-            if name and name.lower() not in seen_names and len(name) < 100:
-                if name.lower() not in ("our services", "services"):
-                    seen_names.add(name.lower())
+            key = heading_lower.strip()
+            if name and key not in seen_names and len(name) < 100:
+                if key not in _GENERIC_SERVICE_HEADINGS:
+                    seen_names.add(key)
                     services.append(ServiceOffering(
                         name=name,
                         confidence=0.6,
@@ -490,18 +596,14 @@ class BusinessIntelligenceExtractor:
                     ))
 
         # Look for service patterns in text
-        service_pattern = re.compile(
-            r"(?:we\s+(?:offer|provide)|our\s+services?\s+include)\s*:?\s*([^.]+)",
-            re.IGNORECASE
-        )
-
-        for match in service_pattern.finditer(content_text):
+        for match in self._compiled_patterns["service"].finditer(content_text):
             text = match.group(1).strip()
             # Split by common delimiters
-            for item in re.split(r"[,;•\n]", text):
+            for item in self._compiled_patterns["service_delimiter"].split(text):
                 name = item.strip()
-                if name and name.lower() not in seen_names and 5 < len(name) < 80:
-                    seen_names.add(name.lower())
+                key = name.lower()
+                if name and key not in seen_names and 5 < len(name) < 80:
+                    seen_names.add(key)
                     services.append(ServiceOffering(
                         name=name,
                         confidence=0.5,
@@ -523,8 +625,9 @@ class BusinessIntelligenceExtractor:
         for pattern, benefit_type in self._compiled_patterns["value_prop"]:
             for match in pattern.finditer(content_text):
                 statement = match.group(0).strip()
-                if statement and statement.lower() not in seen:
-                    seen.add(statement.lower())
+                key = statement.lower()
+                if statement and key not in seen:
+                    seen.add(key)
                     value_props.append(ValueProposition(
                         statement=statement,
                         benefit_type=benefit_type,
@@ -552,16 +655,19 @@ class BusinessIntelligenceExtractor:
         content_text: str,
         headings: list[dict[str, str]],
     ) -> list[TargetAudienceSignal]:
-        """Extract target audience signals."""
+        """Extract target audience signals (at most 15, pattern matches first)."""
+        max_signals = 15
         signals = []
         seen = set()
 
-        # Extract from patterns
+        # Extract from patterns. Scanning stops once the limit is reached,
+        # so no evidence is sliced for signals that would be dropped.
         for pattern, signal_type in self._compiled_patterns["audience"]:
             for match in pattern.finditer(content_text):
                 segment = match.group(0).strip()
-                if segment and segment.lower() not in seen:
-                    seen.add(segment.lower())
+                key = segment.lower()
+                if segment and key not in seen:
+                    seen.add(key)
 
                     # Get context around the match
                     start = max(0, match.start() - 50)
@@ -574,6 +680,8 @@ class BusinessIntelligenceExtractor:
                         confidence=0.6 if signal_type == "explicit" else 0.5,
                         source=signal_type,
                     ))
+                    if len(signals) == max_signals:
+                        return signals
 
         # Look for "for" statements in headings
         for heading in headings:
@@ -586,80 +694,57 @@ class BusinessIntelligenceExtractor:
                     source="heading",
                 ))
 
-        return signals[:15]
-
-    def _extract_technologies(self, content_text: str) -> list[str]:
-        """Extract technology mentions."""
-        technologies = []
-        tech_keywords = [
-            "api", "rest", "graphql", "webhook", "sdk", "oauth", "jwt",
-            "saas", "cloud", "aws", "azure", "gcp", "docker", "kubernetes",
-            "react", "vue", "angular", "next.js", "node", "python", "java",
-            "ai", "machine learning", "nlp", "deep learning",
-            "blockchain", "iot", "mobile", "native app",
-            "postgresql", "mongodb", "redis", "elasticsearch",
-        ]
+        return signals[:max_signals]
 
-        text_lower = content_text.lower()
-        for tech in tech_keywords:
-            pattern = r"\b" + re.escape(tech) + r"\b"
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                technologies.append(tech.upper() if len(tech) <= 4 else tech.title())
-
-        return list(set(technologies))
+    def _extract_technologies(self, text_lower: str) -> list[str]:
+        """Extract technology mentions from lowercased text, in order of first mention."""
+        return list(dict.fromkeys(
+            self._technology_names[tech]
+            for tech in self._compiled_patterns["technology"].findall(text_lower)
+        ))
 
     def _extract_certifications(self, content_text: str) -> list[str]:
-        """Extract certifications and compliance mentions."""
-        certifications = []
-        cert_patterns = [
-            r"SOC\s*2(?:\s+Type\s*[12I]+)?",
-            r"HIPAA(?:\s+compliant)?",
-            r"GDPR(?:\s+compliant)?",
-            r"ISO\s*\d{4,5}",
-            r"PCI[- ]DSS",
-            r"FedRAMP",
-            r"CCPA",
-            r"SOX\s+compliant",
-        ]
-
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, content_text, re.IGNORECASE)
-            certifications.extend(matches)
-
-        return list(set(certifications))
+        """Extract certifications and compliance mentions, in order of first mention."""
+        certifications = self._compiled_patterns["certification"].findall(content_text)
+        return list(dict.fromkeys(certifications))
 
     def _extract_partnerships(
         self,
         content_text: str,
-        structured_data: list[dict[str, Any]],
+        structured_by_type: dict[str, list[dict[str, Any]]],
     ) -> list[str]:
-        """Extract partnership/integration mentions."""
+        """Extract partnership/integration mentions, structured data first, without duplicates."""
         partnerships = []
 
         # Check structured data for partners
-        for data in structured_data:
-            if data.get("@type") == "Organization":
-                sponsor = data.get("sponsor")
-                if sponsor:
-                    if isinstance(sponsor, list):
-                        partnerships.extend([s.get("name", "") for s in sponsor if s.get("name")])
-                    elif isinstance(sponsor, dict):
-                        if sponsor.get("name"):
-                            partnerships.append(sponsor["name"])
+        for data in structured_by_type.get("Organization", ()):
+            sponsor = data.get("sponsor")
+            if sponsor:
+                if isinstance(sponsor, list):
+                    partnerships.extend([s.get("name", "") for s in sponsor if s.get("name")])
+                elif isinstance(sponsor, dict):
+                    if sponsor.get("name"):
+                        partnerships.append(sponsor["name"])
 
         # Extract from text patterns
-        partner_pattern = re.compile(
-            r"(?:partner(?:s|ed|ship)?|integrat(?:es?|ion)|works?\s+with)\s+(?:with\s+)?"
-            r"([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)?)",
-            re.MULTILINE
-        )
-
-        for match in partner_pattern.finditer(content_text):
+        for match in self._compiled_patterns["partner"].finditer(content_text):
             partner = match.group(1).strip()
             if partner and 2 < len(partner) < 50:
                 partnerships.append(partner)
 
-        return list(set(partnerships))[:15]
+        return list(dict.fromkeys(partnerships))[:15]
+
+    @staticmethod
+    def _of_types(
+        structured_by_type: dict[str, list[dict[str, Any]]],
+        *schema_types: str,
+    ) -> list[dict[str, Any]]:
+        """Get the structured data items of any of the given schema.org types."""
+        return [
+            data
+            for schema_type in schema_types
+            for data in structured_by_type.get(schema_type, ())
+        ]
 
     def _extract_price_from_structured(self, data: dict[str, Any]) -> str | None:
         """Extract price from structured data."""
@@ -678,26 +763,17 @@ class BusinessIntelligenceExtractor:
 
         return None
 
-    def _detect_industry(self, content_text: str) -> str | None:
-        """Detect primary industry from content."""
-        industry_keywords = {
-            "healthcare": ["healthcare", "medical", "health", "hospital", "patient", "clinical", "pharma"],
-            "finance": ["finance", "financial", "banking", "fintech", "payment", "investment", "trading"],
-            "ecommerce": ["ecommerce", "e-commerce", "retail", "shopping", "store", "commerce", "marketplace"],
-            "education": ["education", "learning", "edtech", "school", "training", "course", "university"],
-            "technology": ["technology", "tech", "software", "saas", "digital", "it ", "developer"],
-            "marketing": ["marketing", "advertising", "martech", "seo", "social media", "campaign", "brand"],
-            "real_estate": ["real estate", "property", "housing", "rental", "realty", "mortgage"],
-            "logistics": ["logistics", "shipping", "supply chain", "delivery", "freight", "warehouse"],
-            "manufacturing": ["manufacturing", "factory", "production", "industrial", "assembly"],
-            "hospitality": ["hotel", "restaurant", "hospitality", "tourism", "travel", "booking"],
-        }
+    def _detect_industry(self, text_lower: str) -> str | None:
+        """
+        Detect primary industry from lowercased content.
 
-        text_lower = content_text.lower()
+        Every keyword occurrence counts, weighted by keyword length so
+        specific phrases ("supply chain") outweigh short generic ones ("it ").
+        """
         industry_scores = {}
 
-        for industry, keywords in industry_keywords.items():
-            score = sum(1 for kw in keywords if kw in text_lower)
+        for industry, keywords in self.INDUSTRY_KEYWORDS.items():
+            score = sum(len(kw) * text_lower.count(kw) for kw in keywords)
             if score > 0:
                 industry_scores[industry] = score
 
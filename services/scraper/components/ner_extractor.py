@@ -7,6 +7,7 @@ Uses spaCy for entity extraction with fallback to regex-based extraction.
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,49 @@ except ImportError:
     logger.warning("spaCy not installed. Using regex-based fallback for NER.")
 
 
+@lru_cache(maxsize=None)
+def load_spacy_model(name: str) -> "Language":
+    """
+    Load a spaCy pipeline once per process.
+
+    Every WebsiteScraper builds its own NERExtractor, so without this each
+    scrape task would reload the model from disk.
+
+    Args:
+        name: spaCy model package name.
+
+    Returns:
+        Loaded spaCy pipeline.
+    """
+    nlp = spacy.load(name)
+    logger.info("Loaded spaCy model: %s", name)
+    return nlp
+
+
+def warm_spacy_model(name: str) -> bool:
+    """
+    Load a spaCy pipeline ahead of its first use, never downloading it.
+
+    Meant for worker start-up hooks, which must finish quickly. If the
+    model is not installed, the first NERExtractor loads or downloads it
+    lazily as before.
+
+    Args:
+        name: spaCy model package name.
+
+    Returns:
+        True if the model is loaded.
+    """
+    if not SPACY_AVAILABLE:
+        return False
+    try:
+        load_spacy_model(name)
+    except Exception as e:
+        logger.warning("Skipping spaCy model warm-up for %s: %s", name, e)
+        return False
+    return True
+
+
 @dataclass
 class NamedEntity:
     """A named entity extracted from text."""
@@ -166,8 +210,7 @@ class NERExtractor:
     def _load_spacy_model(self) -> None:
         """Load spaCy model."""
         try:
-            self._nlp = spacy.load(self.SPACY_MODEL)
-            logger.info("Loaded spaCy model: %s", self.SPACY_MODEL)
+            self._nlp = load_spacy_model(self.SPACY_MODEL)
         except OSError:
             logger.warning(
                 "spaCy model '%s' not found. Attempting to download...",
@@ -176,7 +219,7 @@ class NERExtractor:
             try:
                 from spacy.cli import download
                 download(self.SPACY_MODEL)
-                self._nlp = spacy.load(self.SPACY_MODEL)
+                self._nlp = load_spacy_model(self.SPACY_MODEL)
                 logger.info("Downloaded and loaded spaCy model: %s", self.SPACY_MODEL)
             except Exception as e:
                 logger.error("Failed to download spaCy model: %s", e)
@@ -4,7 +4,6 @@ Storage Handler component.
 Handles storing scraped content to PostgreSQL and S3.
 """
 
-import hashlib
 import json
 import logging
 import uuid
@@ -19,6 +18,8 @@ from shared.config import settings
 from shared.models.website import ScrapedPage, Website, WebsiteAnalysis
 from shared.models.enums import WebsiteStatus
 
+from services.scraper.components.url_queue import compute_url_hash
+
 logger = logging.getLogger(__name__)
 
 
@@ -118,7 +119,7 @@ class StorageHandler:
         Returns:
             Stored ScrapedPage.
         """
-        url_hash = self._compute_url_hash(url)
+        url_hash = compute_url_hash(url)
         now = datetime.now(timezone.utc)
 
         # Store HTML to S3 if provided
@@ -185,7 +186,7 @@ class StorageHandler:
                 "id": uuid.uuid4(),
                 "website_id": page["website_id"],
                 "url": page["url"],
-                "url_hash": self._compute_url_hash(page["url"]),
+                "url_hash": compute_url_hash(page["url"]),
                 "title": page.get("title"),
                 "meta_description": page.get("meta_description"),
                 "content_text": page.get("content_text", ""),
@@ -196,7 +197,10 @@ class StorageHandler:
                 "scraped_at": now,
             })
 
-        stmt = insert(ScrapedPage).values(values)
+        # Parameters are passed separately (executemany) so the statement is
+        # compiled once and cached. Without RETURNING, asyncpg receives all
+        # rows in a single prepared-statement executemany call.
+        stmt = insert(ScrapedPage)
         stmt = stmt.on_conflict_do_update(
             constraint="uq_scraped_pages_website_url",
             set_={
@@ -211,7 +215,7 @@ class StorageHandler:
             },
         )
 
-        await self.session.execute(stmt)
+        await self.session.execute(stmt, values)
         await self.session.commit()
 
         return len(values)
@@ -385,10 +389,10 @@ class StorageHandler:
         Returns:
             Set of URL hashes.
         """
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(ScrapedPage.url_hash).where(ScrapedPage.website_id == website_id)
         )
-        return {row[0] for row in result.fetchall()}
+        return set(result)
 
     async def get_page_count(self, website_id: uuid.UUID) -> int:
         """
@@ -428,11 +432,6 @@ class StorageHandler:
 
         return result.rowcount
 
-    def _compute_url_hash(self, url: str) -> str:
-        """Compute SHA-256 hash of URL."""
-        normalized = url.lower().rstrip("/")
-        return hashlib.sha256(normalized.encode()).hexdigest()
-
     async def _store_html_to_s3(
         self,
         website_id: uuid.UUID,
@@ -16,6 +16,17 @@ from urllib.parse import urljoin, urlparse
 logger = logging.getLogger(__name__)
 
 
+def compute_url_hash(url: str) -> str:
+    """
+    Compute the SHA-256 hash identifying a page URL.
+
+    Queued URLs and stored pages share this hash, so incremental scrapes can
+    skip pages already in the database.
+    """
+    normalized = url.lower().rstrip("/")
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
 class URLPriority(str, Enum):
     """URL scraping priority levels."""
     HIGH = "high"      # Homepage, key landing pages
@@ -34,13 +45,7 @@ class QueuedURL:
 
     def __post_init__(self):
         """Compute URL hash after initialization."""
-        self.url_hash = self._compute_hash(self.url)
-
-    @staticmethod
-    def _compute_hash(url: str) -> str:
-        """Compute SHA-256 hash of URL."""
-        normalized = url.lower().rstrip("/")
-        return hashlib.sha256(normalized.encode()).hexdigest()
+        self.url_hash = compute_url_hash(self.url)
 
 
 class URLQueueManager:
@@ -226,7 +231,7 @@ class URLQueueManager:
 
     def is_scraped(self, url: str) -> bool:
         """Check if a URL has been scraped."""
-        url_hash = QueuedURL._compute_hash(url)
+        url_hash = compute_url_hash(url)
         return url_hash in self._scraped_hashes
 
     def _normalize_url(self, url: str) -> str | None:
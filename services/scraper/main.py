@@ -36,7 +36,7 @@ from services.scraper.schemas import (
     ScrapeJobData,
 )
 from services.scraper.components.rate_limiter import ScrapeRateLimiter
-from services.scraper.app.tasks import get_job, save_job
+from services.scraper.app.tasks import close_job_store, get_job, save_job
 
 # Create FastAPI app
 app = FastAPI(
@@ -138,7 +138,7 @@ async def submit_scrape(
         type=request.type,
         status=JobStatus.QUEUED,
     )
-    save_job(job)
+    await save_job(job)
 
     # Estimate pages based on previous scrapes
     page_count_result = await db.execute(
@@ -177,7 +177,7 @@ async def get_scrape_status(
 
     Returns current progress, page counts, and any errors.
     """
-    job = get_job(str(job_id))
+    job = await get_job(str(job_id))
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -309,9 +309,10 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Close database connection on shutdown."""
+    """Close database and job store connections on shutdown."""
     client = get_postgres_client()
     await client.disconnect()
+    await close_job_store()
 
 
 # ==================== Run with Uvicorn ====================
@@ -5,7 +5,7 @@ Tests for scraper components.
 import pytest
 from datetime import datetime, timedelta, timezone
 
-from services.scraper.components.url_queue import URLQueueManager, QueuedURL
+from services.scraper.components.url_queue import URLQueueManager, QueuedURL, compute_url_hash
 from services.scraper.components.content_parser import ContentParser
 from services.scraper.components.rate_limiter import ScrapeRateLimiter, RateLimitConfig
 from services.scraper.components.error_handler import (
@@ -83,6 +83,13 @@ class TestURLQueueManager:
 
         assert added == 1  # Only internal URL should be added
 
+    def test_url_hash_normalization(self):
+        """Test that queued URLs hash like stored pages, ignoring case and trailing slash."""
+        queued = QueuedURL(url="https://Example.com/Page/", depth=1)
+
+        assert queued.url_hash == compute_url_hash("https://example.com/page")
+        assert len(queued.url_hash) == 64
+
 
 class TestContentParser:
     """Tests for Content Parser."""
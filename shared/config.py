@@ -47,6 +47,10 @@ class Settings(BaseSettings):
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = "password"
+    neo4j_database: str = "neo4j"
+    neo4j_parallel_runtime: bool = False
+    neo4j_max_connection_pool_size: int = 100
+    neo4j_connection_acquisition_timeout: float = 60.0
 
     # Elasticsearch/OpenSearch
     elasticsearch_url: str = "http://localhost:9200"
@@ -66,6 +70,9 @@ class Settings(BaseSettings):
     anthropic_api_key: str | None = None
     perplexity_api_key: str | None = None
 
+    # ICP Generation
+    icp_parallel_attempts: int = 1  # LLM attempts in flight at once; each is billed
+
     # Celery
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/1"
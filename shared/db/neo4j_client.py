@@ -10,9 +10,10 @@ This module provides a robust Neo4j client with:
 """
 
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
-from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
+from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession, WRITE_ACCESS
 from neo4j.exceptions import Neo4jError
 
 from shared.config import settings
@@ -43,8 +44,9 @@ class Neo4jClient:
         uri: str | None = None,
         user: str | None = None,
         password: str | None = None,
-        max_connection_pool_size: int = 50,
-        connection_acquisition_timeout: float = 60.0,
+        database: str | None = None,
+        max_connection_pool_size: int | None = None,
+        connection_acquisition_timeout: float | None = None,
     ):
         """
         Initialize Neo4j client.
@@ -53,14 +55,21 @@ class Neo4jClient:
             uri: Neo4j connection URI. Defaults to settings.
             user: Neo4j username. Defaults to settings.
             password: Neo4j password. Defaults to settings.
-            max_connection_pool_size: Maximum connections in pool.
+            database: Target database name. Defaults to settings.
+            max_connection_pool_size: Maximum connections in pool. Defaults to settings.
             connection_acquisition_timeout: Timeout for acquiring connections.
+                Defaults to settings.
         """
         self._uri = uri or settings.neo4j_uri
         self._user = user or settings.neo4j_user
         self._password = password or settings.neo4j_password
-        self._max_connection_pool_size = max_connection_pool_size
-        self._connection_acquisition_timeout = connection_acquisition_timeout
+        self._database = database or settings.neo4j_database
+        self._max_connection_pool_size = (
+            max_connection_pool_size or settings.neo4j_max_connection_pool_size
+        )
+        self._connection_acquisition_timeout = (
+            connection_acquisition_timeout or settings.neo4j_connection_acquisition_timeout
+        )
 
         self._driver: AsyncDriver | None = None
         self._is_connected = False
@@ -124,17 +133,29 @@ class Neo4jClient:
         self._is_connected = False
         logger.info("Neo4j connection closed")
 
-    def session(self, database: str | None = None) -> AsyncSession:
+    def session(
+        self,
+        database: str | None = None,
+        access_mode: str = WRITE_ACCESS,
+    ) -> AsyncSession:
         """
         Get a Neo4j session.
 
+        Sessions are always bound to an explicit database so the driver
+        does not need a home-database resolution round-trip per session.
+
         Args:
-            database: Database name. None uses default.
+            database: Database name. None uses the configured database.
+            access_mode: neo4j.READ_ACCESS or neo4j.WRITE_ACCESS. In a
+                cluster, read sessions are routed to followers/read replicas.
 
         Returns:
             AsyncSession: Neo4j session.
         """
-        return self.driver.session(database=database)
+        return self.driver.session(
+            database=database or self._database,
+            default_access_mode=access_mode,
+        )
 
     async def health_check(self) -> dict[str, Any]:
         """
@@ -164,6 +185,7 @@ class Neo4jClient:
         query: str,
         parameters: dict[str, Any] | None = None,
         database: str | None = None,
+        access_mode: str = WRITE_ACCESS,
     ) -> list[dict[str, Any]]:
         """
         Run a Cypher query and return results.
@@ -172,14 +194,62 @@ class Neo4jClient:
             query: Cypher query string.
             parameters: Query parameters.
             database: Database name.
+            access_mode: Session access mode; pass neo4j.READ_ACCESS for reads.
 
         Returns:
             List of result records as dictionaries.
         """
-        async with self.session(database=database) as session:
+        async with self.session(database=database, access_mode=access_mode) as session:
             result = await session.run(query, parameters or {})
             return await result.data()
 
+    async def execute_query(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str | None = None,
+        access_mode: str = WRITE_ACCESS,
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a Cypher query against the configured database.
+
+        Args:
+            query: Cypher query string.
+            parameters: Query parameters.
+            database: Database name. None uses the configured database.
+            access_mode: Session access mode; pass neo4j.READ_ACCESS for reads.
+
+        Returns:
+            List of result records as dictionaries.
+        """
+        return await self.run_query(query, parameters, database, access_mode)
+
+    async def stream_query(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str | None = None,
+        access_mode: str = WRITE_ACCESS,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Run a Cypher query and yield records as they arrive.
+
+        Unlike run_query, the full result set is never held in memory.
+
+        Args:
+            query: Cypher query string.
+            parameters: Query parameters.
+            database: Database name.
+            access_mode: Session access mode; pass neo4j.READ_ACCESS for reads.
+
+        Yields:
+            Result records as dictionaries.
+        """
+        async with self.session(database=database, access_mode=access_mode) as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                yield record.data()
+
     async def run_query_single(
         self,
         query: str,
@@ -171,6 +171,20 @@ INDEXES = [
         FOR (i:Intent) ON (i.type)
         """,
     },
+    {
+        "name": "intent_id_index",
+        "query": """
+        CREATE INDEX intent_id_index IF NOT EXISTS
+        FOR (i:Intent) ON (i.id)
+        """,
+    },
+    {
+        "name": "intent_intent_type_index",
+        "query": """
+        CREATE INDEX intent_intent_type_index IF NOT EXISTS
+        FOR (i:Intent) ON (i.intent_type)
+        """,
+    },
     {
         "name": "intent_funnel_stage_index",
         "query": """
@@ -178,6 +192,13 @@ INDEXES = [
         FOR (i:Intent) ON (i.funnel_stage)
         """,
     },
+    {
+        "name": "intent_type_funnel_stage_index",
+        "query": """
+        CREATE INDEX intent_type_funnel_stage_index IF NOT EXISTS
+        FOR (i:Intent) ON (i.intent_type, i.funnel_stage)
+        """,
+    },
     # Concern indexes
     {
         "name": "concern_category_index",
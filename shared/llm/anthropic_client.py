@@ -76,7 +76,16 @@ class AnthropicClient(LLMClient):
         }
 
         if effective_system:
-            create_kwargs["system"] = effective_system
+            # Mark the system prompt as a cacheable prefix so repeated calls
+            # with the same instructions reuse it; prompts shorter than the
+            # provider's minimum cacheable length are sent uncached.
+            create_kwargs["system"] = [
+                {
+                    "type": "text",
+                    "text": effective_system,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
 
         response = await self.client.messages.create(**create_kwargs, **kwargs)
 
@@ -94,4 +103,5 @@ class AnthropicClient(LLMClient):
             tokens_used=response.usage.input_tokens + response.usage.output_tokens,
             latency_ms=latency_ms,
             raw_response=response.model_dump(),
+            finish_reason=response.stop_reason,
         )
@@ -27,17 +27,19 @@ class LLMResponse:
     latency_ms: int = 0
     raw_response: dict[str, Any] = field(default_factory=dict)
     parsed_json: dict[str, Any] | list | None = None
+    finish_reason: str | None = None
 
     @property
     def success(self) -> bool:
         return bool(self.text)
 
-    def get_json(self) -> dict[str, Any] | list:
-        """Parse and return JSON from response text."""
-        if self.parsed_json is not None:
-            return self.parsed_json
+    @property
+    def truncated(self) -> bool:
+        """Whether generation stopped because it hit max_tokens."""
+        return self.finish_reason in ("length", "max_tokens")
 
-        # Try to parse the text as JSON
+    def _json_text(self) -> str:
+        """Return the response text with any markdown code fence removed."""
         text = self.text.strip()
 
         # Handle markdown code blocks
@@ -48,13 +50,22 @@ class LLMResponse:
         if text.endswith("```"):
             text = text[:-3]
 
-        self.parsed_json = json.loads(text.strip())
+        return text.strip()
+
+    def get_json(self) -> dict[str, Any] | list:
+        """Parse and return JSON from response text."""
+        if self.parsed_json is not None:
+            return self.parsed_json
+
+        self.parsed_json = json.loads(self._json_text())
         return self.parsed_json
 
     def parse_as[T: BaseModel](self, model_class: type[T]) -> T:
         """Parse response as a Pydantic model."""
-        data = self.get_json()
-        return model_class.model_validate(data)
+        if self.parsed_json is not None:
+            return model_class.model_validate(self.parsed_json)
+        # Validate straight from the JSON text, skipping the intermediate dicts
+        return model_class.model_validate_json(self._json_text())
 
 
 class LLMClient(ABC):
@@ -74,4 +74,5 @@ class OpenAIClient(LLMClient):
             tokens_used=response.usage.total_tokens if response.usage else 0,
             latency_ms=latency_ms,
             raw_response=response.model_dump(),
+            finish_reason=response.choices[0].finish_reason,
         )
@@ -94,4 +94,11 @@ class ICP(Base, UUIDMixin, TimestampMixin):
         UniqueConstraint("website_id", "sequence_number", name="uq_icps_website_sequence"),
         # Partial index for active ICPs
         Index("idx_icps_active", "is_active", postgresql_where=(is_active == True)),
+        # Website ICP listings filter by is_active and order by sequence_number
+        Index(
+            "idx_icps_website_active_sequence",
+            "website_id",
+            "is_active",
+            "sequence_number",
+        ),
     )
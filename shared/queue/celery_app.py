@@ -2,10 +2,22 @@
 Celery application configuration.
 """
 
+import orjson
 from celery import Celery
+from kombu.serialization import register
 
 from shared.config import settings
 
+# Task payloads (e.g. batch graph nodes/edges) go through orjson instead of
+# the stdlib json module. Plain json stays accepted for older producers.
+register(
+    "orjson",
+    orjson.dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="binary",
+)
+
 celery_app = Celery(
     "llm_brand_monitor",
     broker=settings.celery_broker_url,
@@ -22,9 +34,10 @@ celery_app = Celery(
 # Celery configuration
 celery_app.conf.update(
     # Task settings
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
+    result_accept_content=["orjson", "json"],
     timezone="UTC",
     enable_utc=True,
     # Task execution
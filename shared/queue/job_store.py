@@ -0,0 +1,158 @@
+"""
+Redis-backed job progress store shared by API replicas and Celery workers.
+
+Each job is a Redis hash at "<prefix>:<job_id>" holding its scalar fields,
+and each list field is a Redis list at "<prefix>:<job_id>:<field>". Progress
+updates set, increment, or append individual fields in one pipelined
+round-trip instead of rewriting the whole job. The async client keeps job
+reads and writes from blocking the event loop.
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import redis.asyncio as redis
+
+from shared.config import settings
+
+
+class RedisJobStore:
+    """Job store keeping one Redis hash (plus lists) per job."""
+
+    DEFAULT_TTL_SECONDS = 86400
+
+    def __init__(
+        self,
+        prefix: str,
+        list_fields: Iterable[str] = (),
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        client: redis.Redis | None = None,
+    ):
+        """
+        Initialize RedisJobStore.
+
+        Args:
+            prefix: Key prefix for this kind of job (e.g. "scrape:job").
+            list_fields: Fields stored as Redis lists rather than hash fields.
+            ttl_seconds: Seconds a job is kept after its last write.
+            client: Redis client. Defaults to a pooled client for settings.redis_url.
+        """
+        self.prefix = prefix
+        self.list_fields = tuple(list_fields)
+        self.ttl_seconds = ttl_seconds
+        self._client = client
+
+    @property
+    def client(self) -> redis.Redis:
+        """Get the Redis client, creating the pooled client on first use."""
+        if self._client is None:
+            self._client = redis.Redis.from_url(
+                str(settings.redis_url),
+                max_connections=settings.redis_pool_size,
+                decode_responses=True,
+            )
+        return self._client
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.prefix}:{job_id}"
+
+    def _list_key(self, job_id: str, field: str) -> str:
+        return f"{self.prefix}:{job_id}:{field}"
+
+    def _keys(self, job_id: str) -> list[str]:
+        return [self._key(job_id)] + [
+            self._list_key(job_id, field) for field in self.list_fields
+        ]
+
+    async def close(self) -> None:
+        """Close the Redis client; a new one is created on next use."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def exists(self, job_id: str) -> bool:
+        """
+        Check whether a job exists without loading it.
+
+        Args:
+            job_id: Job ID.
+
+        Returns:
+            True if the job exists.
+        """
+        return bool(await self.client.exists(self._key(job_id)))
+
+    async def get(self, job_id: str) -> dict[str, Any] | None:
+        """
+        Get a job's fields.
+
+        Args:
+            job_id: Job ID.
+
+        Returns:
+            Scalar fields as strings and list fields as lists of strings,
+            or None if the job does not exist.
+        """
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hgetall(self._key(job_id))
+        for field in self.list_fields:
+            pipe.lrange(self._list_key(job_id, field), 0, -1)
+        fields, *lists = await pipe.execute()
+
+        if not fields:
+            return None
+        return fields | dict(zip(self.list_fields, lists))
+
+    async def save(self, job_id: str, fields: Mapping[str, Any]) -> None:
+        """
+        Write a whole job, replacing any stored fields and lists.
+
+        Args:
+            job_id: Job ID.
+            fields: Job fields. None values are stored as absent.
+        """
+        key = self._key(job_id)
+        pipe = self.client.pipeline()
+        pipe.delete(*self._keys(job_id))
+        pipe.hset(key, mapping={
+            name: value
+            for name, value in fields.items()
+            if name not in self.list_fields and value is not None
+        })
+        for field in self.list_fields:
+            if fields.get(field):
+                pipe.rpush(self._list_key(job_id, field), *fields[field])
+        for job_key in self._keys(job_id):
+            pipe.expire(job_key, self.ttl_seconds)
+        await pipe.execute()
+
+    async def update(
+        self,
+        job_id: str,
+        fields: Mapping[str, Any] | None = None,
+        increments: Mapping[str, int] | None = None,
+        appends: Mapping[str, Iterable[str]] | None = None,
+    ) -> None:
+        """
+        Update part of a job in one round-trip.
+
+        Args:
+            job_id: Job ID.
+            fields: Scalar fields to set.
+            increments: Integer fields to increment, by amount.
+            appends: Items to append to list fields.
+        """
+        key = self._key(job_id)
+        pipe = self.client.pipeline(transaction=False)
+        if fields:
+            pipe.hset(key, mapping=fields)
+        for name, amount in (increments or {}).items():
+            pipe.hincrby(key, name, amount)
+        for field, values in (appends or {}).items():
+            values = list(values)
+            if values:
+                list_key = self._list_key(job_id, field)
+                pipe.rpush(list_key, *values)
+                pipe.expire(list_key, self.ttl_seconds)
+        pipe.expire(key, self.ttl_seconds)
+        await pipe.execute()
@@ -0,0 +1,86 @@
+"""
+Persistent event loop for Celery worker processes.
+
+Celery tasks are synchronous, so async task bodies need an event loop.
+Creating one per task with asyncio.run() also throws away every pooled
+connection bound to it. Instead each worker process keeps a single loop
+for its lifetime, and connection pools opened on it (e.g. PostgreSQL) are
+reused across tasks and closed when the worker process shuts down.
+"""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import Any
+
+from celery.signals import worker_process_shutdown
+
+from shared.db.postgres_client import PostgresClient, get_postgres_client
+
+logger = logging.getLogger(__name__)
+
+# Use uvloop when available (installed with uvicorn[standard])
+try:
+    import uvloop
+
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop for this worker process, creating it on first use.
+
+    Returns:
+        The worker process event loop.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = _new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on the worker process event loop.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    return get_worker_loop().run_until_complete(coro)
+
+
+async def get_worker_postgres() -> PostgresClient:
+    """
+    Get the PostgreSQL client, connecting its pool on first use.
+
+    The pool stays open for the life of the worker process.
+
+    Returns:
+        Connected PostgreSQL client.
+    """
+    client = get_postgres_client()
+    if not client.is_connected:
+        await client.connect()
+    return client
+
+
+@worker_process_shutdown.connect
+def _close_worker_loop(**kwargs: Any) -> None:
+    """Close pooled connections and the event loop when a worker exits."""
+    if _loop is None or _loop.is_closed():
+        return
+
+    try:
+        _loop.run_until_complete(get_postgres_client().disconnect())
+    except Exception as e:
+        logger.warning("Error closing PostgreSQL pool on worker shutdown: %s", e)
+    finally:
+        _loop.close()
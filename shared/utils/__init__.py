@@ -3,6 +3,7 @@ Shared utilities.
 """
 
 from shared.utils.hashing import hash_password, verify_password, hash_url
+from shared.utils.ids import uuid7
 from shared.utils.jwt import create_access_token, create_refresh_token, decode_token
 from shared.utils.logging import get_logger, setup_logging
 
@@ -10,6 +11,7 @@ __all__ = [
     "hash_password",
     "verify_password",
     "hash_url",
+    "uuid7",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
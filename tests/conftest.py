@@ -100,3 +100,95 @@ def sample_website_data() -> dict[str, Any]:
         "name": "Example Website",
         "scrape_depth": 3,
     }
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis string, hash and list commands."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.expiry: dict[str, int] = {}
+        self.round_trips = 0
+        self.closed = False
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        self.data[key] = value
+        if ex is not None:
+            self.expiry[key] = ex
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            for store in (self.data, self.hashes, self.lists):
+                if store.pop(key, None) is not None:
+                    deleted += 1
+        return deleted
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.data or key in self.hashes or key in self.lists)
+
+    async def hget(self, key: str, field: str) -> str | None:
+        return self.hashes.get(key, {}).get(field)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def hset(self, key: str, mapping: dict[str, Any]) -> int:
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+        return len(mapping)
+
+    async def hincrby(self, key: str, field: str, amount: int) -> int:
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+        return int(fields[field])
+
+    async def rpush(self, key: str, *values: str) -> int:
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    async def lrange(self, key: str, start: int, end: int) -> list[str]:
+        return list(self.lists.get(key, []))
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        self.expiry[key] = seconds
+        return True
+
+
+class FakePipeline:
+    """Queues FakeRedis commands and runs them in one round-trip on execute()."""
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs) -> "FakePipeline":
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list:
+        self.redis.round_trips += 1
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+@pytest.fixture
+def fake_redis_client() -> FakeRedis:
+    """In-memory async Redis client."""
+    return FakeRedis()
@@ -8,6 +8,8 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock
 from typing import Any
 
+from neo4j import WRITE_ACCESS
+
 
 class MockNeo4jClient:
     """Mock Neo4j client for testing without a real database."""
@@ -18,13 +20,23 @@ class MockNeo4jClient:
             "edges": [],  # list of edge data
         }
         self._query_results = []
-
-    async def execute_query(self, query: str, params: dict[str, Any]) -> list[dict]:
+        self.executed_queries: list[tuple[str, dict[str, Any]]] = []
+        self.access_modes: list[str] = []
+
+    async def execute_query(
+        self,
+        query: str,
+        params: dict[str, Any],
+        access_mode: str = WRITE_ACCESS,
+    ) -> list[dict]:
         """
         Mock query execution.
 
         Returns pre-configured results or simulates based on query patterns.
         """
+        self.executed_queries.append((query, params))
+        self.access_modes.append(access_mode)
+
         # If we have pre-configured results, use them
         if self._query_results:
             return self._query_results.pop(0)
@@ -51,6 +63,16 @@ class MockNeo4jClient:
 
         return []
 
+    async def stream_query(
+        self,
+        query: str,
+        params: dict[str, Any],
+        access_mode: str = WRITE_ACCESS,
+    ):
+        """Mock streaming query execution over execute_query results."""
+        for row in await self.execute_query(query, params, access_mode):
+            yield row
+
     def set_query_results(self, results: list[list[dict]]) -> None:
         """Set pre-configured query results."""
         self._query_results = results
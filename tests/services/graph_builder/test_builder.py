@@ -367,6 +367,15 @@ class TestGraphBuilderResponseProcessing:
         assert stats.nodes_created > 0
         assert stats.edges_created > 0
 
+        _, co_mention_params = mock_neo4j_client.executed_queries[-1]
+        assert co_mention_params["edges"][0] == {
+            "source_brand_id": "brand1",
+            "target_brand_id": "brand2",
+            "count": 1,
+            "avg_position_delta": None,
+            "llm_provider": "openai",
+        }
+
     @pytest.mark.asyncio
     async def test_build_from_responses_handles_beliefs(self, mock_neo4j_client):
         """Test that processing responses creates belief installation edges."""
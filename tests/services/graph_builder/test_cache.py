@@ -0,0 +1,85 @@
+"""
+Tests for the query result cache.
+
+Tests TTL expiry, LRU eviction and graph-version invalidation.
+"""
+
+import pytest
+
+from services.graph_builder.components import cache as cache_module
+from services.graph_builder.components.cache import QueryCache, bump_graph_version
+from services.graph_builder.components.queries import QueryBuilder
+
+
+class TestQueryCache:
+    """Tests for QueryCache."""
+
+    def test_get_and_set(self):
+        """Test storing and retrieving a value."""
+        cache = QueryCache()
+
+        cache.set("key", {"value": 1})
+
+        assert cache.get("key") == {"value": 1}
+        assert cache.get("missing", "default") == "default"
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        """Test that entries are not served after their TTL."""
+        now = 100.0
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+        cache = QueryCache(ttl_seconds=10)
+
+        cache.set("key", "value")
+        now = 111.0
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """Test LRU eviction once maxsize is exceeded."""
+        cache = QueryCache(maxsize=2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+class TestCachedQueries:
+    """Tests for cached QueryBuilder methods."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_is_served_from_cache(self, mock_neo4j_client):
+        """Test that an identical call does not hit Neo4j again."""
+        query = QueryBuilder(mock_neo4j_client)
+
+        mock_neo4j_client.set_query_results([
+            [{"kind": "node", "name": "Brand", "count": 3}],
+        ])
+
+        first = await query.get_graph_stats()
+        second = await query.get_graph_stats()
+
+        assert first == second
+        assert len(mock_neo4j_client.executed_queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_graph_write_invalidates_cache(self, mock_neo4j_client):
+        """Test that bumping the graph version forces a fresh query."""
+        query = QueryBuilder(mock_neo4j_client)
+
+        mock_neo4j_client.set_query_results([
+            [{"kind": "node", "name": "Brand", "count": 3}],
+            [{"kind": "node", "name": "Brand", "count": 4}],
+        ])
+
+        await query.get_graph_stats()
+        bump_graph_version()
+        result = await query.get_graph_stats()
+
+        assert result["nodes"]["Brand"] == 4
+        assert len(mock_neo4j_client.executed_queries) == 2
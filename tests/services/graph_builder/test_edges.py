@@ -296,6 +296,9 @@ class TestEdgeManagerRanksFor:
         count = await manager.create_ranks_for_batch(edges)
 
         assert count == 2
+        _, params = mock_neo4j_client.executed_queries[0]
+        assert [e["presence"] for e in params["edges"]] == ["recommended", "mentioned"]
+        assert type(params["edges"][0]["presence"]) is str
 
 
 class TestEdgeManagerBeliefs:
@@ -5,8 +5,9 @@ Tests high-level graph queries for belief maps, co-mentions, ICP journeys, etc.
 """
 
 import pytest
+from neo4j import READ_ACCESS
 
-from services.graph_builder.components.queries import QueryBuilder
+from services.graph_builder.components.queries import QueryBuilder, _find_label_scans
 from services.graph_builder.schemas import (
     BeliefMapResponse,
     CoMentionResponse,
@@ -41,6 +42,23 @@ class TestQueryBuilderBeliefMaps:
         assert result.beliefs[0]["belief_type"] == "outcome"
         assert result.beliefs[0]["count"] == 10
 
+    @pytest.mark.asyncio
+    async def test_get_belief_map_query_text_is_stable(self, mock_neo4j_client):
+        """Test that the intent filter does not change the query text."""
+        query = QueryBuilder(mock_neo4j_client)
+
+        mock_neo4j_client.set_query_results([[], []])
+
+        await query.get_belief_map("TestBrand")
+        await query.get_belief_map("TestBrand", intent_type=IntentTypeEnum.EVALUATION)
+
+        (first_query, first_params), (second_query, second_params) = (
+            mock_neo4j_client.executed_queries
+        )
+        assert first_query == second_query
+        assert first_params["intent_type"] is None
+        assert second_params["intent_type"] == "evaluation"
+
     @pytest.mark.asyncio
     async def test_get_belief_map_with_provider_filter(self, mock_neo4j_client):
         """Test getting belief map filtered by LLM provider."""
@@ -79,9 +97,19 @@ class TestQueryBuilderBeliefMaps:
 
         mock_neo4j_client.set_query_results([
             [
-                {"brand_name": "Brand1", "belief_type": "outcome", "count": 10, "confidence": 0.8},
-                {"brand_name": "Brand1", "belief_type": "truth", "count": 5, "confidence": 0.7},
-                {"brand_name": "Brand2", "belief_type": "outcome", "count": 8, "confidence": 0.75},
+                {
+                    "brand_name": "Brand1",
+                    "beliefs": [
+                        {"belief_type": "outcome", "count": 10, "confidence": 0.8},
+                        {"belief_type": "truth", "count": 5, "confidence": 0.7},
+                    ],
+                },
+                {
+                    "brand_name": "Brand2",
+                    "beliefs": [
+                        {"belief_type": "outcome", "count": 8, "confidence": 0.75},
+                    ],
+                },
             ]
         ])
 
@@ -103,8 +131,8 @@ class TestQueryBuilderCoMentions:
 
         mock_neo4j_client.set_query_results([
             [
-                {"brand_name": "Competitor1", "normalized_name": "competitor1", "co_mention_count": 15, "avg_position_delta": 0.5, "llm_provider": "openai"},
-                {"brand_name": "Competitor2", "normalized_name": "competitor2", "co_mention_count": 10, "avg_position_delta": -0.3, "llm_provider": "openai"},
+                {"item": {"brand_name": "Competitor1", "normalized_name": "competitor1", "count": 15, "avg_position_delta": 0.5, "llm_provider": "openai"}},
+                {"item": {"brand_name": "Competitor2", "normalized_name": "competitor2", "count": 10, "avg_position_delta": -0.3, "llm_provider": "openai"}},
             ]
         ])
 
@@ -151,6 +179,21 @@ class TestQueryBuilderCoMentions:
         assert "nodes" in result
         assert "edges" in result
 
+    @pytest.mark.asyncio
+    async def test_get_co_mention_network_clamps_depth(self, mock_neo4j_client):
+        """Test that traversal depth is inlined and capped."""
+        query = QueryBuilder(mock_neo4j_client)
+
+        mock_neo4j_client.set_query_results([[], []])
+
+        await query.get_co_mention_network("brand1", depth=10)
+        await query.get_co_mention_network("brand1", depth=0)
+
+        (deep_query, deep_params), (shallow_query, _) = mock_neo4j_client.executed_queries
+        assert "CO_MENTIONED*1..3]" in deep_query
+        assert "CO_MENTIONED*1..1]" in shallow_query
+        assert "depth" not in deep_params
+
 
 class TestQueryBuilderICPJourneys:
     """Tests for ICP journey queries."""
@@ -217,8 +260,8 @@ class TestQueryBuilderSubstitutions:
 
         mock_neo4j_client.set_query_results([
             [
-                {"brand_name": "Substitute1", "brand_id": "s1", "substitution_count": 8, "avg_position": 1.5, "llm_providers": ["openai", "anthropic"]},
-                {"brand_name": "Substitute2", "brand_id": "s2", "substitution_count": 5, "avg_position": 2.0, "llm_providers": ["openai"]},
+                {"item": {"brand_name": "Substitute1", "brand_id": "s1", "substitution_count": 8, "avg_position": 1.5, "llm_providers": ["openai", "anthropic"]}},
+                {"item": {"brand_name": "Substitute2", "brand_id": "s2", "substitution_count": 5, "avg_position": 2.0, "llm_providers": ["openai"]}},
             ]
         ])
 
@@ -253,8 +296,8 @@ class TestQueryBuilderCompetitive:
 
         mock_neo4j_client.set_query_results([
             [
-                {"brand_name": "Brand1", "total_mentions": 50, "first_positions": 20, "recommendations": 30, "avg_position": 1.5, "first_position_rate": 40, "recommendation_rate": 60},
-                {"brand_name": "Brand2", "total_mentions": 30, "first_positions": 10, "recommendations": 15, "avg_position": 2.0, "first_position_rate": 33, "recommendation_rate": 50},
+                {"brand_name": "Brand1", "item": {"total_mentions": 50, "first_positions": 20, "recommendations": 30, "avg_position": 1.5, "first_position_rate": 40, "recommendation_rate": 60, "share_of_voice": 62.5}},
+                {"brand_name": "Brand2", "item": {"total_mentions": 30, "first_positions": 10, "recommendations": 15, "avg_position": 2.0, "first_position_rate": 33, "recommendation_rate": 50, "share_of_voice": 37.5}},
             ]
         ])
 
@@ -263,28 +306,42 @@ class TestQueryBuilderCompetitive:
         assert "Brand1" in result
         assert "Brand2" in result
         assert result["Brand1"]["total_mentions"] == 50
-        assert "share_of_voice" in result["Brand1"]
+        assert result["Brand1"]["share_of_voice"] == 62.5
+
+    @pytest.mark.asyncio
+    async def test_get_share_of_voice_parallel_runtime(self, mock_neo4j_client):
+        """Test that the parallel runtime hint is only added when enabled."""
+        mock_neo4j_client.set_query_results([[], []])
+
+        await QueryBuilder(mock_neo4j_client).get_share_of_voice(["Brand1"])
+        await QueryBuilder(
+            mock_neo4j_client, parallel_runtime=True
+        ).get_share_of_voice(["Brand1"])
+
+        (default_query, _), (parallel_query, _) = mock_neo4j_client.executed_queries
+        assert "runtime=parallel" not in default_query
+        assert parallel_query.startswith("CYPHER runtime=parallel")
+        assert parallel_query.endswith(default_query)
 
     @pytest.mark.asyncio
     async def test_get_competitive_landscape(self, mock_neo4j_client):
         """Test getting competitive landscape."""
         query = QueryBuilder(mock_neo4j_client)
 
-        # Mock competitor query, then SOV query, then co-mentions
+        # Competitors, share of voice and co-mentions come back in one row
         mock_neo4j_client.set_query_results([
-            # Competitors
-            [
-                {"competitor_name": "Competitor1", "competitor_id": "c1", "relationship_type": "direct"},
-            ],
-            # Share of voice
-            [
-                {"brand_name": "TestBrand", "total_mentions": 40, "first_positions": 15, "recommendations": 25, "avg_position": 1.8, "first_position_rate": 38, "recommendation_rate": 63},
-                {"brand_name": "Competitor1", "total_mentions": 35, "first_positions": 12, "recommendations": 20, "avg_position": 2.0, "first_position_rate": 34, "recommendation_rate": 57},
-            ],
-            # Co-mentions
-            [
-                {"brand_name": "Competitor1", "normalized_name": "competitor1", "co_mention_count": 20, "avg_position_delta": 0.2, "llm_provider": "all"},
-            ]
+            [{
+                "competitors": [
+                    {"name": "Competitor1", "id": "c1", "relationship_type": "direct"},
+                ],
+                "share_of_voice": [
+                    {"brand_name": "TestBrand", "item": {"total_mentions": 40, "first_positions": 15, "recommendations": 25, "avg_position": 1.8, "first_position_rate": 38, "recommendation_rate": 63, "share_of_voice": 53.3}},
+                    {"brand_name": "Competitor1", "item": {"total_mentions": 35, "first_positions": 12, "recommendations": 20, "avg_position": 2.0, "first_position_rate": 34, "recommendation_rate": 57, "share_of_voice": 46.7}},
+                ],
+                "co_mentions": [
+                    {"brand_name": "Competitor1", "normalized_name": "competitor1", "count": 20, "avg_position_delta": 0.2, "llm_provider": "all"},
+                ],
+            }]
         ])
 
         result = await query.get_competitive_landscape("TestBrand")
@@ -293,6 +350,23 @@ class TestQueryBuilderCompetitive:
         assert "competitors" in result
         assert "share_of_voice" in result
         assert "co_mentions" in result
+        assert result["competitors"][0]["name"] == "Competitor1"
+        assert result["share_of_voice"]["Competitor1"]["share_of_voice"] == 46.7
+        assert result["co_mentions"][0]["count"] == 20
+        assert len(mock_neo4j_client.executed_queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_competitive_landscape_unknown_brand(self, mock_neo4j_client):
+        """Test competitive landscape for a brand not in the graph."""
+        query = QueryBuilder(mock_neo4j_client)
+
+        mock_neo4j_client.set_query_results([[]])
+
+        result = await query.get_competitive_landscape("Unknown")
+
+        assert result["competitors"] == []
+        assert result["share_of_voice"] == {}
+        assert result["co_mentions"] == []
 
 
 class TestQueryBuilderIntents:
@@ -323,6 +397,10 @@ class TestQueryBuilderIntents:
 
         assert len(result) == 1
         assert result[0]["brand_count"] == 5
+        executed, _ = mock_neo4j_client.executed_queries[0]
+        assert "(i:Intent {intent_type: $intent_type})" in executed
+        assert "LIMIT 5" in executed
+        assert "brands[0..5]" not in executed
 
 
 class TestQueryBuilderBeliefAggregation:
@@ -340,14 +418,16 @@ class TestQueryBuilderBeliefAggregation:
                     "beliefs": [
                         {"belief_type": "truth", "count": 10, "confidence": 0.7, "brand_count": 5},
                         {"belief_type": "social_proof", "count": 8, "confidence": 0.8, "brand_count": 4},
-                    ]
+                    ],
+                    "stage_total": 18,
                 },
                 {
                     "funnel_stage": "consideration",
                     "beliefs": [
                         {"belief_type": "outcome", "count": 15, "confidence": 0.85, "brand_count": 6},
                         {"belief_type": "superiority", "count": 12, "confidence": 0.75, "brand_count": 5},
-                    ]
+                    ],
+                    "stage_total": 27,
                 },
             ]
         ])
@@ -370,7 +450,8 @@ class TestQueryBuilderBeliefAggregation:
                     "funnel_stage": "decision",
                     "beliefs": [
                         {"belief_type": "transaction", "count": 5, "confidence": 0.9, "brand_count": 1},
-                    ]
+                    ],
+                    "stage_total": 5,
                 }
             ]
         ])
@@ -387,10 +468,33 @@ class TestQueryBuilderBeliefAggregation:
 
         # Mock all the queries used by get_brand_belief_profile
         mock_neo4j_client.set_query_results([
-            # get_belief_map
+            # combined belief map / effectiveness / consistency query
             [
-                {"belief_type": "outcome", "total_count": 10, "avg_confidence": 0.85},
-                {"belief_type": "superiority", "total_count": 5, "avg_confidence": 0.7},
+                {
+                    "belief_type": "outcome",
+                    "by_provider": [
+                        {"provider": "openai", "count": 6, "confidence": 0.85},
+                        {"provider": "anthropic", "count": 4, "confidence": 0.9},
+                    ],
+                    "provider_count": 2,
+                    "total_count": 10,
+                    "filtered_edges": 2,
+                    "recommendations": 8,
+                    "avg_confidence": 0.87,
+                    "recommended_confidence": 0.9,
+                },
+                {
+                    "belief_type": "superiority",
+                    "by_provider": [
+                        {"provider": "openai", "count": 5, "confidence": 0.7},
+                    ],
+                    "provider_count": 1,
+                    "total_count": 5,
+                    "filtered_edges": 1,
+                    "recommendations": 0,
+                    "avg_confidence": 0.7,
+                    "recommended_confidence": 0,
+                },
             ],
             # get_belief_by_funnel_stage
             [
@@ -398,22 +502,8 @@ class TestQueryBuilderBeliefAggregation:
                     "funnel_stage": "consideration",
                     "beliefs": [
                         {"belief_type": "outcome", "count": 10, "confidence": 0.85, "brand_count": 1},
-                    ]
-                }
-            ],
-            # effectiveness query
-            [
-                {"belief_type": "outcome", "recommendation_with_belief": 8, "avg_confidence": 0.9},
-            ],
-            # consistency query
-            [
-                {
-                    "belief_type": "outcome",
-                    "provider_count": 2,
-                    "by_provider": [
-                        {"provider": "openai", "count": 6, "confidence": 0.85},
-                        {"provider": "anthropic", "count": 4, "confidence": 0.9},
-                    ]
+                    ],
+                    "stage_total": 10,
                 }
             ],
         ])
@@ -425,6 +515,13 @@ class TestQueryBuilderBeliefAggregation:
         assert "by_funnel_stage" in result
         assert "effectiveness" in result
         assert "consistency_across_providers" in result
+        assert result["total_occurrences"] == 15
+        assert len(result["overall_beliefs"]) == 2
+        assert result["effectiveness"] == [
+            {"belief_type": "outcome", "recommendations_with_belief": 8, "avg_confidence": 0.9},
+        ]
+        assert result["consistency_across_providers"][0]["provider_count"] == 2
+        assert len(mock_neo4j_client.executed_queries) == 2
 
     @pytest.mark.asyncio
     async def test_get_belief_trends(self, mock_neo4j_client):
@@ -432,24 +529,29 @@ class TestQueryBuilderBeliefAggregation:
         query = QueryBuilder(mock_neo4j_client)
 
         mock_neo4j_client.set_query_results([
-            [
-                {
-                    "belief_type": "outcome",
-                    "total_installations": 100,
-                    "avg_confidence": 0.8,
-                    "brand_count": 20,
-                    "provider_count": 3,
-                    "sample_brands": ["Brand1", "Brand2", "Brand3"],
-                },
-                {
-                    "belief_type": "superiority",
-                    "total_installations": 50,
-                    "avg_confidence": 0.75,
-                    "brand_count": 15,
-                    "provider_count": 3,
-                    "sample_brands": ["Brand1", "Brand4"],
-                },
-            ]
+            [{
+                "trends": [
+                    {
+                        "belief_type": "outcome",
+                        "total_installations": 100,
+                        "avg_confidence": 0.8,
+                        "brand_count": 20,
+                        "provider_count": 3,
+                        "sample_brands": ["Brand1", "Brand2", "Brand3"],
+                        "percentage": 66.7,
+                    },
+                    {
+                        "belief_type": "superiority",
+                        "total_installations": 50,
+                        "avg_confidence": 0.75,
+                        "brand_count": 15,
+                        "provider_count": 3,
+                        "sample_brands": ["Brand1", "Brand4"],
+                        "percentage": 33.3,
+                    },
+                ],
+                "total_installations": 150,
+            }]
         ])
 
         result = await query.get_belief_trends()
@@ -457,7 +559,7 @@ class TestQueryBuilderBeliefAggregation:
         assert "trends" in result
         assert len(result["trends"]) == 2
         assert result["total_installations"] == 150
-        # Check percentage calculation
+        # Percentages come from Cypher
         assert result["trends"][0]["percentage"] == 66.7  # 100/150 * 100
 
     @pytest.mark.asyncio
@@ -466,16 +568,20 @@ class TestQueryBuilderBeliefAggregation:
         query = QueryBuilder(mock_neo4j_client)
 
         mock_neo4j_client.set_query_results([
-            [
-                {
-                    "belief_type": "outcome",
-                    "total_installations": 25,
-                    "avg_confidence": 0.85,
-                    "brand_count": 2,
-                    "provider_count": 1,
-                    "sample_brands": ["Brand1", "Brand2"],
-                },
-            ]
+            [{
+                "trends": [
+                    {
+                        "belief_type": "outcome",
+                        "total_installations": 25,
+                        "avg_confidence": 0.85,
+                        "brand_count": 2,
+                        "provider_count": 1,
+                        "sample_brands": ["Brand1", "Brand2"],
+                        "percentage": 100.0,
+                    },
+                ],
+                "total_installations": 25,
+            }]
         ])
 
         result = await query.get_belief_trends(
@@ -494,26 +600,30 @@ class TestQueryBuilderBeliefAggregation:
         mock_neo4j_client.set_query_results([
             [
                 {
-                    "belief_type": "outcome",
-                    "brand_count": 10,
-                    "total_installations": 50,
-                    "avg_belief_confidence": 0.85,
-                    "avg_position": 1.5,
-                    "recommendations": 40,
-                    "first_positions": 20,
-                    "recommendation_rate": 80.0,
-                    "first_position_rate": 40.0,
+                    "item": {
+                        "belief_type": "outcome",
+                        "brand_count": 10,
+                        "total_installations": 50,
+                        "avg_confidence": 0.85,
+                        "avg_position": 1.5,
+                        "recommendations": 40,
+                        "first_positions": 20,
+                        "recommendation_rate": 80.0,
+                        "first_position_rate": 40.0,
+                    }
                 },
                 {
-                    "belief_type": "superiority",
-                    "brand_count": 8,
-                    "total_installations": 30,
-                    "avg_belief_confidence": 0.7,
-                    "avg_position": 2.0,
-                    "recommendations": 20,
-                    "first_positions": 10,
-                    "recommendation_rate": 66.7,
-                    "first_position_rate": 33.3,
+                    "item": {
+                        "belief_type": "superiority",
+                        "brand_count": 8,
+                        "total_installations": 30,
+                        "avg_confidence": 0.7,
+                        "avg_position": 2.0,
+                        "recommendations": 20,
+                        "first_positions": 10,
+                        "recommendation_rate": 66.7,
+                        "first_position_rate": 33.3,
+                    }
                 },
             ]
         ])
@@ -533,15 +643,17 @@ class TestQueryBuilderBeliefAggregation:
         mock_neo4j_client.set_query_results([
             [
                 {
-                    "belief_type": "outcome",
-                    "brand_count": 5,
-                    "total_installations": 20,
-                    "avg_belief_confidence": 0.9,
-                    "avg_position": 1.2,
-                    "recommendations": 18,
-                    "first_positions": 15,
-                    "recommendation_rate": 90.0,
-                    "first_position_rate": 75.0,
+                    "item": {
+                        "belief_type": "outcome",
+                        "brand_count": 5,
+                        "total_installations": 20,
+                        "avg_confidence": 0.9,
+                        "avg_position": 1.2,
+                        "recommendations": 18,
+                        "first_positions": 15,
+                        "recommendation_rate": 90.0,
+                        "first_position_rate": 75.0,
+                    }
                 },
             ]
         ])
@@ -564,28 +676,24 @@ class TestQueryBuilderStats:
         """Test getting overall graph statistics."""
         query = QueryBuilder(mock_neo4j_client)
 
-        # Mock node counts
+        # Node and edge counts come back from a single query
         mock_neo4j_client.set_query_results([
-            # Node counts
-            [
-                {"label": "Brand", "count": 100},
-                {"label": "ICP", "count": 25},
-                {"label": "Intent", "count": 500},
-                {"label": "Concern", "count": 75},
-                {"label": "BeliefType", "count": 6},
-                {"label": "LLMProvider", "count": 4},
-                {"label": "Conversation", "count": 125},
-            ],
-            # Edge counts
             [
-                {"type": "CO_MENTIONED", "count": 500},
-                {"type": "COMPETES_WITH", "count": 50},
-                {"type": "HAS_CONCERN", "count": 75},
-                {"type": "TRIGGERS", "count": 200},
-                {"type": "RANKS_FOR", "count": 1000},
-                {"type": "INSTALLS_BELIEF", "count": 800},
-                {"type": "RECOMMENDS", "count": 600},
-                {"type": "IGNORES", "count": 150},
+                {"kind": "node", "name": "Brand", "count": 100},
+                {"kind": "node", "name": "ICP", "count": 25},
+                {"kind": "node", "name": "Intent", "count": 500},
+                {"kind": "node", "name": "Concern", "count": 75},
+                {"kind": "node", "name": "BeliefType", "count": 6},
+                {"kind": "node", "name": "LLMProvider", "count": 4},
+                {"kind": "node", "name": "Conversation", "count": 125},
+                {"kind": "edge", "name": "CO_MENTIONED", "count": 500},
+                {"kind": "edge", "name": "COMPETES_WITH", "count": 50},
+                {"kind": "edge", "name": "HAS_CONCERN", "count": 75},
+                {"kind": "edge", "name": "TRIGGERS", "count": 200},
+                {"kind": "edge", "name": "RANKS_FOR", "count": 1000},
+                {"kind": "edge", "name": "INSTALLS_BELIEF", "count": 800},
+                {"kind": "edge", "name": "RECOMMENDS", "count": 600},
+                {"kind": "edge", "name": "IGNORES", "count": 150},
             ]
         ])
 
@@ -597,3 +705,88 @@ class TestQueryBuilderStats:
         assert "total_edges" in result
         assert result["nodes"]["Brand"] == 100
         assert result["edges"]["CO_MENTIONED"] == 500
+        assert result["total_edges"] == 3375
+        assert len(mock_neo4j_client.executed_queries) == 1
+        assert mock_neo4j_client.access_modes == [READ_ACCESS]
+
+    @pytest.mark.asyncio
+    async def test_get_graph_stats_with_apoc(self, mock_neo4j_client):
+        """Test that graph stats come from apoc.meta.stats() when installed."""
+        query = QueryBuilder(mock_neo4j_client)
+
+        mock_neo4j_client.set_query_results([
+            [{"name": "apoc.meta.stats"}],
+            [{
+                "labels": {"Brand": 100, "ICP": 25, "Website": 3},
+                "relTypesCount": {"CO_MENTIONED": 500, "RANKS_FOR": 1000},
+            }],
+        ])
+
+        assert await query.detect_apoc() is True
+        result = await query.get_graph_stats()
+
+        assert result["nodes"]["Brand"] == 100
+        assert result["nodes"]["Intent"] == 0
+        assert "Website" not in result["nodes"]
+        assert result["total_nodes"] == 125
+        assert result["total_edges"] == 1500
+        assert "apoc.meta.stats()" in mock_neo4j_client.executed_queries[1][0]
+
+    @pytest.mark.asyncio
+    async def test_detect_apoc_missing(self, mock_neo4j_client):
+        """Test that graph stats fall back to count-store queries without APOC."""
+        query = QueryBuilder(mock_neo4j_client)
+
+        mock_neo4j_client.set_query_results([
+            [],
+            [{"kind": "node", "name": "Brand", "count": 7}],
+        ])
+
+        assert await query.detect_apoc() is False
+        result = await query.get_graph_stats()
+
+        assert result["nodes"] == {"Brand": 7}
+        assert "UNION ALL" in mock_neo4j_client.executed_queries[1][0]
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_creates_only_missing(self, mock_neo4j_client):
+        """Test that indexes already covered by SHOW INDEXES are skipped."""
+        query = QueryBuilder(mock_neo4j_client)
+
+        mock_neo4j_client.set_query_results([
+            [
+                {"labelsOrTypes": ["Brand"], "properties": ["normalized_name"]},
+                {"labelsOrTypes": ["Intent"], "properties": ["id"]},
+                {"labelsOrTypes": ["Intent"], "properties": ["intent_type"]},
+                {"labelsOrTypes": ["Intent"], "properties": ["funnel_stage"]},
+                {"labelsOrTypes": None, "properties": None},
+            ],
+        ])
+
+        created = await query.ensure_indexes()
+
+        assert created == [
+            "intent_type_funnel_stage_index",
+            "belieftype_type_index",
+            "icp_id_index",
+        ]
+        executed = [q for q, _ in mock_neo4j_client.executed_queries]
+        assert any("db.awaitIndexes" in q for q in executed)
+        assert not any("brand_normalized_name_index" in q for q in executed)
+        assert any("ON (n.intent_type, n.funnel_stage)" in q for q in executed)
+
+    def test_find_label_scans(self):
+        """Test detection of label scans in a nested plan."""
+        plan = {
+            "operatorType": "ProduceResults@neo4j",
+            "children": [
+                {"operatorType": "NodeIndexSeek@neo4j", "children": []},
+                {
+                    "operatorType": "Expand(All)@neo4j",
+                    "children": [{"operatorType": "NodeByLabelScan@neo4j", "children": []}],
+                },
+            ],
+        }
+
+        assert _find_label_scans(plan) == ["NodeByLabelScan@neo4j"]
+        assert _find_label_scans(None) == []
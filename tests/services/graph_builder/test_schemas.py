@@ -108,7 +108,17 @@ class TestBrandNode:
     def test_brand_node_missing_required(self):
         """Test BrandNode fails without required fields."""
         with pytest.raises(ValidationError):
-            BrandNode(id="123", name="Test")  # missing normalized_name
+            BrandNode(id="123")  # missing name
+
+    def test_brand_node_derives_normalized_name(self):
+        """Test normalized_name is derived from name when omitted."""
+        brand = BrandNode(id="123", name="  Test Brand ")
+        assert brand.normalized_name == "test brand"
+
+    def test_brand_node_normalizes_given_name(self):
+        """Test a supplied normalized_name is normalized at write time."""
+        brand = BrandNode(id="123", name="Test", normalized_name=" TEST ")
+        assert brand.normalized_name == "test"
 
 
 class TestICPNode:
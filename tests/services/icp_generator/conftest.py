@@ -0,0 +1,27 @@
+"""
+Pytest fixtures for ICP Generator tests.
+"""
+
+import pytest
+
+
+class FakeRedisCache:
+    """In-memory stand-in for the Redis response cache tier."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> bool:
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+
+@pytest.fixture
+def fake_redis_cache():
+    """Create an in-memory Redis response cache tier."""
+    return FakeRedisCache()
@@ -0,0 +1,149 @@
+"""
+Tests for the ICP Generator caches.
+"""
+
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.icp_generator import cache as cache_module
+from services.icp_generator import main
+from services.icp_generator.cache import ICPResponseCache
+from services.icp_generator.schemas import ICPListResponse
+
+
+class BrokenRedisCache:
+    """Redis tier that fails every call."""
+
+    async def get(self, key: str) -> str | None:
+        raise ConnectionError("redis down")
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> bool:
+        raise ConnectionError("redis down")
+
+
+class TestICPResponseCache:
+    """Tests for ICPResponseCache."""
+
+    def test_cache_key_depends_on_request(self):
+        """Test that any change to the LLM request changes the key."""
+        key = ICPResponseCache.cache_key("system", "prompt", 0.4, 8000)
+
+        assert key == ICPResponseCache.cache_key("system", "prompt", 0.4, 8000)
+        assert key != ICPResponseCache.cache_key("system", "prompt!", 0.4, 8000)
+        assert key != ICPResponseCache.cache_key("system", "prompt", 0.7, 8000)
+
+    @pytest.mark.asyncio
+    async def test_set_writes_both_tiers(self, fake_redis_cache):
+        """Test that responses are kept in memory and in Redis with a TTL."""
+        redis_cache = fake_redis_cache
+        cache = ICPResponseCache(redis_cache=redis_cache, ttl_seconds=60)
+
+        await cache.set("key", '{"icps": []}')
+
+        assert redis_cache.data["key"] == '{"icps": []}'
+        assert redis_cache.ttls["key"] == 60
+        redis_cache.data.clear()
+        assert await cache.get("key") == '{"icps": []}'
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_populates_memory(self, fake_redis_cache):
+        """Test that a Redis hit is served from memory afterwards."""
+        redis_cache = fake_redis_cache
+        redis_cache.data["key"] = "value"
+        cache = ICPResponseCache(redis_cache=redis_cache)
+
+        assert await cache.get("key") == "value"
+        redis_cache.data.clear()
+        assert await cache.get("key") == "value"
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_is_bounded(self, fake_redis_cache):
+        """Test that the least recently used response is evicted."""
+        cache = ICPResponseCache(redis_cache=fake_redis_cache, maxsize=2)
+
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")
+        await cache.set("c", "3")
+
+        assert list(cache._local) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self):
+        """Test that Redis failures never break generation."""
+        cache = ICPResponseCache(redis_cache=BrokenRedisCache())
+
+        assert await cache.get("key") is None
+        await cache.set("key", "value")
+        assert await cache.get("key") == "value"
+
+
+@pytest.fixture
+def fake_redis_hashes(monkeypatch, fake_redis_client):
+    """Route the ICP list cache to an in-memory Redis."""
+
+    @asynccontextmanager
+    async def redis_context():
+        yield fake_redis_client
+
+    monkeypatch.setattr(cache_module, "get_redis_context", redis_context)
+    return fake_redis_client
+
+
+class TestICPListCache:
+    """Tests for the per-website ICP list cache."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_per_variant(self, fake_redis_hashes):
+        """Test that active-only and full lists are cached separately."""
+        website_id = uuid.uuid4()
+        response = ICPListResponse(website_id=website_id, icps=[], total=0)
+
+        await cache_module.cache_icp_lists(website_id, {True: response})
+
+        assert await cache_module.get_cached_icp_list(website_id, True) == response
+        assert await cache_module.get_cached_icp_list(website_id, False) is None
+        assert fake_redis_hashes.expiry[f"icps:{website_id}"] == 3600
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_all_variants(self, fake_redis_hashes):
+        """Test that invalidation removes every cached list for the website."""
+        website_id = uuid.uuid4()
+        response = ICPListResponse(website_id=website_id, icps=[], total=0)
+        await cache_module.cache_icp_lists(website_id, {True: response, False: response})
+
+        await cache_module.invalidate_icp_lists(website_id)
+
+        assert await cache_module.get_cached_icp_list(website_id, True) is None
+        assert await cache_module.get_cached_icp_list(website_id, False) is None
+
+    @pytest.mark.asyncio
+    async def test_list_endpoint_miss_does_not_fill_cache(self, fake_redis_hashes, monkeypatch):
+        """Test that a database read on a miss never writes a possibly stale list."""
+        website_id = uuid.uuid4()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = website_id
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        monkeypatch.setattr(main, "get_icps_for_website", AsyncMock(return_value=[]))
+
+        response = await main.get_website_icps(website_id, active_only=True, db=db)
+
+        assert response.total == 0
+        assert fake_redis_hashes.hashes == {}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_swallows_redis_errors(self, monkeypatch):
+        """Test that a Redis failure after a committed update is only logged."""
+
+        @asynccontextmanager
+        async def failing_context():
+            raise ConnectionError("redis down")
+            yield
+
+        monkeypatch.setattr(cache_module, "get_redis_context", failing_context)
+
+        await cache_module.invalidate_icp_lists(uuid.uuid4())
@@ -2,15 +2,24 @@
 Tests for ICP Generator with mocked LLM responses.
 """
 
+import asyncio
 import json
 import uuid
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
-from services.icp_generator.generator import ICPGenerator, ICPGenerationError
+from services.icp_generator.cache import ICPResponseCache
+from services.icp_generator.generator import (
+    ICPGenerator,
+    ICPGenerationError,
+    count_icps_for_website,
+)
 from services.icp_generator.schemas import (
+    ICP_RESPONSE_LIST,
     GeneratedICP,
     ICPGenerationResponse,
     WebsiteContext,
@@ -20,8 +29,12 @@ from services.icp_generator.schemas import (
     BuyingJourneyStage,
 )
 from services.icp_generator.prompts import (
+    ICP_GENERATION_SYSTEM_PROMPT,
+    ICP_OUTPUT_SCHEMA,
     ICP_SYSTEM_PROMPT,
+    ICP_USER_PROMPT_TEMPLATE,
     build_icp_generation_prompt,
+    build_minimal_context_prompt,
 )
 from shared.llm.base import LLMResponse, ResponseFormat
 
@@ -459,6 +472,37 @@ class TestICPSchemas:
 
         assert "unique" in str(exc_info.value).lower()
 
+    def test_icp_response_list_reads_orm_attributes(self):
+        """Test that a list of ORM rows validates in one adapter call."""
+        now = datetime.now(timezone.utc)
+        rows = [
+            SimpleNamespace(
+                id=uuid.uuid4(),
+                website_id=uuid.uuid4(),
+                name=f"ICP {i}",
+                description=None,
+                sequence_number=i,
+                demographics={"age_range": "25-45"},
+                professional_profile={"seniority_level": "mid"},
+                pain_points=["P1", "P2", "P3"],
+                goals=["G1", "G2", "G3"],
+                motivations={"primary": ["M1"]},
+                objections=None,
+                decision_factors=["D1", "D2", "D3"],
+                information_sources=None,
+                buying_journey_stage="awareness",
+                is_active=True,
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(1, 3)
+        ]
+
+        icps = ICP_RESPONSE_LIST.validate_python(rows, from_attributes=True)
+
+        assert [icp.name for icp in icps] == ["ICP 1", "ICP 2"]
+        assert icps[0].id == rows[0].id
+
 
 class TestWebsiteContext:
     """Test WebsiteContext functionality."""
@@ -493,6 +537,40 @@ class TestWebsiteContext:
         context_text = context.to_prompt_context()
         assert "example.com" in context_text
 
+    def test_detailed_items_truncate_long_descriptions(self):
+        """Test that detailed products are listed with descriptions cut at 100 chars."""
+        context = WebsiteContext(
+            domain="example.com",
+            name=None,
+            description=None,
+            industry=None,
+            business_model=None,
+            primary_offerings=None,
+            value_propositions=None,
+            target_markets=None,
+            company_profile=None,
+            products_detailed=[
+                {"name": "Long", "description": "x" * 150},
+                {"name": "Short", "description": "fits"},
+                {"description": "unnamed items are skipped"},
+            ],
+            services_detailed=None,
+            target_audience=None,
+        )
+
+        context_text = context.to_prompt_context()
+
+        assert f"Detailed Products:\n- Long: {'x' * 100}...\n- Short: fits" in context_text
+        assert "unnamed" not in context_text
+
+    def test_prompt_context_is_cached(self, sample_website_context):
+        """Test that the prompt context is rendered once and the model is frozen."""
+        first = sample_website_context.to_prompt_context()
+
+        assert sample_website_context.to_prompt_context() is first
+        with pytest.raises(ValidationError):
+            sample_website_context.domain = "other.com"
+
 
 # ==================== Generator Tests ====================
 
@@ -567,6 +645,305 @@ class TestICPGenerator:
             generator._validate_diversity(icps)
 
 
+class TestBuildContext:
+    """Test loading website context for generation."""
+
+    @staticmethod
+    def _session_returning(rows):
+        result = MagicMock()
+        result.all.return_value = rows
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        return session
+
+    @pytest.mark.asyncio
+    async def test_build_context_single_query(self, mock_llm_client):
+        """Test that website, analysis and top pages come from one query."""
+        generator = ICPGenerator(llm_client=mock_llm_client)
+        website = SimpleNamespace(domain="acme.com", name="Acme", description="Data tools")
+        analysis = SimpleNamespace(**{
+            field: None
+            for field in (
+                "business_model", "primary_offerings", "value_propositions",
+                "target_markets", "company_profile", "products_detailed",
+                "services_detailed", "target_audience",
+            )
+        }, industry="technology")
+        session = self._session_returning([
+            (website, analysis, "Home", "Welcome to Acme"),
+            (website, analysis, None, "Pricing details"),
+            (website, analysis, "Empty", None),
+        ])
+
+        context = await generator._build_context(uuid.uuid4(), session)
+
+        session.execute.assert_awaited_once()
+        assert context.domain == "acme.com"
+        assert context.industry == "technology"
+        assert context.scraped_content_summary == "[Home] Welcome to Acme\n\nPricing details"
+
+    @pytest.mark.asyncio
+    async def test_build_context_without_analysis_or_pages(self, mock_llm_client):
+        """Test that outer-joined NULLs produce an empty context."""
+        generator = ICPGenerator(llm_client=mock_llm_client)
+        website = SimpleNamespace(domain="acme.com", name="Acme", description=None)
+        session = self._session_returning([(website, None, None, None)])
+
+        context = await generator._build_context(uuid.uuid4(), session)
+
+        assert context.industry is None
+        assert context.scraped_content_summary is None
+
+    @pytest.mark.asyncio
+    async def test_build_context_missing_website(self, mock_llm_client):
+        """Test that an unknown website yields no context."""
+        generator = ICPGenerator(llm_client=mock_llm_client)
+
+        assert await generator._build_context(uuid.uuid4(), self._session_returning([])) is None
+
+
+class TestICPStorage:
+    """Test persisting generated ICPs."""
+
+    @pytest.mark.asyncio
+    async def test_store_icps_uses_single_upsert(self, mock_llm_client, mock_llm_response):
+        """Test that ICPs are written with one INSERT ... ON CONFLICT ... RETURNING."""
+        generator = ICPGenerator(llm_client=mock_llm_client)
+        icps = ICPGenerationResponse.model_validate_json(mock_llm_response.text).icps
+        website_id = uuid.uuid4()
+        stored_rows = [MagicMock() for _ in icps]
+
+        session = MagicMock()
+        session.scalars = AsyncMock(return_value=iter(stored_rows))
+        session.execute = AsyncMock()
+        session.commit = AsyncMock()
+        session.refresh = AsyncMock()
+
+        stored = await generator._store_icps(website_id, icps, session)
+
+        assert stored == stored_rows
+        session.scalars.assert_awaited_once()
+        stmt, values = session.scalars.await_args.args
+        sql = str(stmt)
+        assert "ON CONFLICT ON CONSTRAINT uq_icps_website_sequence DO UPDATE" in sql
+        assert "RETURNING" in sql
+        assert [v["sequence_number"] for v in values] == [1, 2, 3, 4, 5]
+        assert values[0]["website_id"] == website_id
+        assert values[0]["buying_journey_stage"] == icps[0].buying_journey_stage.value
+        assert values[0]["demographics"] == icps[0].demographics.model_dump()
+        assert values[0]["motivations"]["primary"] == icps[0].motivations.primary
+        session.execute.assert_not_awaited()
+        session.commit.assert_awaited_once()
+        session.refresh.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_store_icps_replaces_existing_in_one_transaction(
+        self, mock_llm_client, mock_llm_response
+    ):
+        """Test that regeneration clears stale rows before the upsert and commits once."""
+        generator = ICPGenerator(llm_client=mock_llm_client)
+        icps = ICPGenerationResponse.model_validate_json(mock_llm_response.text).icps
+
+        session = MagicMock()
+        session.scalars = AsyncMock(return_value=iter([]))
+        session.execute = AsyncMock()
+        session.commit = AsyncMock()
+
+        await generator._store_icps(uuid.uuid4(), icps, session, replace_existing=True)
+
+        deletes = [str(call.args[0]) for call in session.execute.await_args_list]
+        assert len(deletes) == 2
+        assert deletes[0].startswith("DELETE FROM conversation_sequences")
+        assert deletes[1].startswith("DELETE FROM icps")
+        assert "icps.sequence_number >" in deletes[1]
+        session.commit.assert_awaited_once()
+
+
+class TestCountICPs:
+    """Test the existing-ICP count query."""
+
+    @pytest.mark.asyncio
+    async def test_counts_without_loading_rows(self):
+        """Test that only a COUNT of active ICPs is selected."""
+        result = MagicMock()
+        result.scalar_one.return_value = 5
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+
+        assert await count_icps_for_website(uuid.uuid4(), session) == 5
+
+        sql = str(session.execute.await_args.args[0])
+        assert sql.startswith("SELECT count(*)")
+        assert "icps.is_active" in sql
+        assert "icps.pain_points" not in sql
+
+
+class TestICPGeneratorParallelAttempts:
+    """Test concurrent generation attempts."""
+
+    @pytest.mark.asyncio
+    async def test_first_success_cancels_other_attempts(
+        self, mock_llm_client, mock_llm_response, sample_website_context
+    ):
+        """Test that a fast valid attempt wins and slower attempts are cancelled."""
+        cancelled = []
+        calls = 0
+
+        async def complete_json(**kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return mock_llm_response
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(calls)
+                raise
+
+        mock_llm_client.complete_json = AsyncMock(side_effect=complete_json)
+        generator = ICPGenerator(
+            llm_client=mock_llm_client, parallel_attempts=ICPGenerator.MAX_RETRIES
+        )
+
+        icps = await generator._generate_with_retries(sample_website_context)
+
+        assert len(icps) == 5
+        # One attempt is held back for a retry with a larger token budget
+        assert calls == ICPGenerator.MAX_RETRIES - 1
+        assert len(cancelled) == ICPGenerator.MAX_RETRIES - 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_attempts_fall_through_to_valid_one(
+        self, mock_llm_client, mock_llm_response, sample_website_context
+    ):
+        """Test that failed attempts do not stop a later valid one."""
+        invalid = LLMResponse(
+            text='{"icps": []}',
+            model="gpt-4o",
+            provider="openai",
+            tokens_used=10,
+            latency_ms=10,
+            raw_response={},
+        )
+        mock_llm_client.complete_json = AsyncMock(
+            side_effect=[invalid, invalid, mock_llm_response]
+        )
+        generator = ICPGenerator(llm_client=mock_llm_client)
+
+        icps = await generator._generate_with_retries(sample_website_context)
+
+        assert len(icps) == 5
+
+    @pytest.mark.asyncio
+    async def test_all_attempts_failing_raises(self, mock_llm_client, sample_website_context):
+        """Test that exhausting every attempt raises ICPGenerationError."""
+        mock_llm_client.complete_json = AsyncMock(side_effect=RuntimeError("provider down"))
+        generator = ICPGenerator(llm_client=mock_llm_client)
+
+        with pytest.raises(ICPGenerationError, match="provider down"):
+            await generator._generate_with_retries(sample_website_context)
+
+        assert mock_llm_client.complete_json.await_count == ICPGenerator.MAX_RETRIES
+
+    @pytest.mark.asyncio
+    async def test_attempts_are_sequential_by_default(
+        self, mock_llm_client, sample_website_context
+    ):
+        """Test that by default only one billed attempt is made on success."""
+        generator = ICPGenerator(llm_client=mock_llm_client)
+
+        assert generator.parallel_attempts == 1
+
+        await generator._generate_with_retries(sample_website_context)
+
+        mock_llm_client.complete_json.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_truncated_response_raises_token_budget(
+        self, mock_llm_client, mock_llm_response, sample_website_context
+    ):
+        """Test that attempts after a truncated response get the larger budget."""
+        truncated = LLMResponse(
+            text='{"icps": [{"name": "Cut',
+            model="gpt-4o",
+            provider="openai",
+            finish_reason="length",
+        )
+        mock_llm_client.complete_json = AsyncMock(side_effect=[truncated, mock_llm_response])
+        generator = ICPGenerator(llm_client=mock_llm_client)
+
+        icps = await generator._generate_with_retries(sample_website_context)
+
+        assert len(icps) == 5
+        budgets = [
+            call.kwargs["max_tokens"] for call in mock_llm_client.complete_json.await_args_list
+        ]
+        assert budgets == [ICPGenerator.MAX_TOKENS, ICPGenerator.MAX_TOKENS_LIMIT]
+
+    @pytest.mark.asyncio
+    async def test_full_fan_out_keeps_attempt_for_larger_budget(
+        self, mock_llm_client, mock_llm_response, sample_website_context
+    ):
+        """Test that racing every attempt still leaves one for MAX_TOKENS_LIMIT."""
+        truncated = LLMResponse(
+            text='{"icps": [{"name": "Cut',
+            model="gpt-4o",
+            provider="openai",
+            finish_reason="length",
+        )
+
+        async def complete_json(**kwargs):
+            if kwargs["max_tokens"] == ICPGenerator.MAX_TOKENS:
+                return truncated
+            return mock_llm_response
+
+        mock_llm_client.complete_json = AsyncMock(side_effect=complete_json)
+        generator = ICPGenerator(
+            llm_client=mock_llm_client, parallel_attempts=ICPGenerator.MAX_RETRIES
+        )
+
+        icps = await generator._generate_with_retries(sample_website_context)
+
+        assert len(icps) == 5
+        budgets = [
+            call.kwargs["max_tokens"] for call in mock_llm_client.complete_json.await_args_list
+        ]
+        assert budgets[-1] == ICPGenerator.MAX_TOKENS_LIMIT
+
+
+class TestICPGeneratorResponseCache:
+    """Test reuse of cached ICP generation responses."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_llm(
+        self, mock_llm_client, sample_website_context, fake_redis_cache
+    ):
+        """Test that a repeated context is served from the response cache."""
+        cache = ICPResponseCache(redis_cache=fake_redis_cache)
+        generator = ICPGenerator(llm_client=mock_llm_client, response_cache=cache)
+
+        first = await generator._generate_with_retries(sample_website_context)
+        calls = mock_llm_client.complete_json.await_count
+        second = await generator._generate_with_retries(sample_website_context)
+
+        assert second == first
+        assert mock_llm_client.complete_json.await_count == calls
+
+    @pytest.mark.asyncio
+    async def test_regeneration_bypasses_cache(
+        self, mock_llm_client, sample_website_context, fake_redis_cache
+    ):
+        """Test that use_cache=False always calls the LLM."""
+        cache = ICPResponseCache(redis_cache=fake_redis_cache)
+        generator = ICPGenerator(llm_client=mock_llm_client, response_cache=cache)
+
+        await generator._generate_with_retries(sample_website_context)
+        calls = mock_llm_client.complete_json.await_count
+        await generator._generate_with_retries(sample_website_context, use_cache=False)
+
+        assert mock_llm_client.complete_json.await_count > calls
+
+
 # ==================== Prompt Tests ====================
 
 
@@ -582,6 +959,33 @@ class TestPrompts:
         assert "5 ICPs" in prompt
         assert "JSON" in prompt
 
+    def test_build_icp_generation_prompt_matches_template(self, sample_website_context):
+        """Test that the pre-split template renders like str.format."""
+        prompt = build_icp_generation_prompt(sample_website_context)
+
+        assert prompt == ICP_USER_PROMPT_TEMPLATE.format(
+            context=sample_website_context.to_prompt_context()
+        )
+
+    def test_build_minimal_context_prompt(self):
+        """Test minimal context prompt building."""
+        prompt = build_minimal_context_prompt("acme.com", None, None)
+
+        assert "Domain: acme.com" in prompt
+        assert "Name: acme.com" in prompt
+        assert "general technology/services" in prompt
+        assert "5 ICPs" in prompt
+
+    def test_generation_system_prompt_holds_static_schema(self, sample_website_context):
+        """Test that the schema is a static system prefix, not part of the user prompt."""
+        prompt = build_icp_generation_prompt(sample_website_context)
+
+        assert ICP_GENERATION_SYSTEM_PROMPT.startswith(ICP_SYSTEM_PROMPT)
+        assert ICP_GENERATION_SYSTEM_PROMPT.endswith(ICP_OUTPUT_SCHEMA)
+        assert '"icps": [' in ICP_OUTPUT_SCHEMA
+        assert "{{" not in ICP_OUTPUT_SCHEMA
+        assert '"icps": [' not in prompt
+
     def test_system_prompt_content(self):
         """Test system prompt contains key instructions."""
         assert "5 distinct ICPs" in ICP_SYSTEM_PROMPT
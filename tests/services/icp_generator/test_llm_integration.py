@@ -8,11 +8,19 @@ import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from pydantic import BaseModel, ValidationError
+
 from shared.llm.base import LLMClient, LLMResponse, ResponseFormat
 from shared.llm.openai_client import OpenAIClient
 from shared.llm.anthropic_client import AnthropicClient
 
 
+class KeyModel(BaseModel):
+    """Minimal model for parse_as tests."""
+
+    key: str
+
+
 class TestLLMResponseParsing:
     """Test LLM response parsing capabilities."""
 
@@ -77,6 +85,37 @@ class TestLLMResponseParsing:
         with pytest.raises(json.JSONDecodeError):
             response.get_json()
 
+    def test_parse_as_validates_markdown_block(self):
+        """Test that parse_as validates fenced JSON straight into the model."""
+        response = LLMResponse(
+            text='```json\n{"key": "value"}\n```',
+            model="gpt-4o",
+            provider="openai",
+        )
+
+        parsed = response.parse_as(KeyModel)
+
+        assert parsed == KeyModel(key="value")
+        assert response.parsed_json is None
+
+    def test_parse_as_reuses_parsed_json(self):
+        """Test that parse_as validates already-parsed JSON."""
+        response = LLMResponse(
+            text='{"key": "value"}',
+            model="gpt-4o",
+            provider="openai",
+        )
+        response.get_json()["key"] = "edited"
+
+        assert response.parse_as(KeyModel).key == "edited"
+
+    def test_parse_as_invalid_json_raises(self):
+        """Test that invalid JSON fails model validation."""
+        response = LLMResponse(text="not valid json", model="gpt-4o", provider="openai")
+
+        with pytest.raises(ValidationError):
+            response.parse_as(KeyModel)
+
 
 class TestOpenAIClientMocked:
     """Test OpenAI client with mocked API."""
@@ -184,7 +223,24 @@ class TestAnthropicClientMocked:
 
             # Check system prompt contains JSON instruction
             if "system" in call_kwargs.kwargs:
-                assert "JSON" in call_kwargs.kwargs["system"]
+                assert "JSON" in call_kwargs.kwargs["system"][0]["text"]
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_marked_for_caching(self, mock_anthropic_response):
+        """Test that the system prompt is sent as a cache-controlled prefix block."""
+        with patch("shared.llm.anthropic_client.AsyncAnthropic") as mock_class:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(return_value=mock_anthropic_response)
+            mock_class.return_value = mock_client
+
+            client = AnthropicClient()
+            client.client = mock_client
+
+            await client.complete(prompt="Hello", system_prompt="You are helpful")
+
+            [system_block] = mock_client.messages.create.call_args.kwargs["system"]
+            assert system_block["text"] == "You are helpful"
+            assert system_block["cache_control"] == {"type": "ephemeral"}
 
     @pytest.mark.asyncio
     async def test_complete_returns_llm_response(self, mock_anthropic_response):
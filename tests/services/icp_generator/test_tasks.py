@@ -0,0 +1,123 @@
+"""
+Tests for ICP generation job tracking.
+"""
+
+import uuid
+
+import pytest
+
+from services.icp_generator import main
+from services.icp_generator.app import tasks
+from services.icp_generator.app.tasks import ICPJobData, ICPJobStatus, get_job, save_job
+from shared.queue.worker_loop import run_async
+
+
+@pytest.fixture
+def fake_redis(monkeypatch, fake_redis_client):
+    """Replace the job-store Redis client."""
+    monkeypatch.setattr(tasks, "_redis", fake_redis_client)
+    return fake_redis_client
+
+
+class TestJobStore:
+    """Tests for Redis-backed job tracking."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_get_job(self, fake_redis):
+        """Test that a saved job round-trips through Redis."""
+        job = ICPJobData(
+            job_id=uuid.uuid4(),
+            website_id=uuid.uuid4(),
+            status=ICPJobStatus.RUNNING,
+            progress=30.0,
+        )
+
+        await save_job(job)
+        loaded = await get_job(str(job.job_id))
+
+        assert loaded == job
+        key = f"icp:job:{job.job_id}"
+        assert key in fake_redis.data
+        assert fake_redis.expiry[key] == 86400
+
+    @pytest.mark.asyncio
+    async def test_get_missing_job(self, fake_redis):
+        """Test that unknown job IDs return None."""
+        assert await get_job(str(uuid.uuid4())) is None
+
+
+class TestEnqueueGeneration:
+    """Tests for publishing generation jobs after the 202 response."""
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_marks_job_failed(self, fake_redis, monkeypatch):
+        """Test that a broker error ends the job instead of leaving it queued."""
+
+        def send_task(*args, **kwargs):
+            raise ConnectionError("broker unavailable")
+
+        monkeypatch.setattr(main.celery_app, "send_task", send_task)
+        job = ICPJobData(
+            job_id=uuid.uuid4(),
+            website_id=uuid.uuid4(),
+            status=ICPJobStatus.QUEUED,
+        )
+
+        await main._enqueue_generation(job, force_regenerate=False)
+
+        stored = await get_job(str(job.job_id))
+        assert stored.status == ICPJobStatus.FAILED
+        assert stored.error == "broker unavailable"
+        assert stored.completed_at is not None
+
+
+class TestBackgroundProgress:
+    """Tests for off-the-hot-path progress writes."""
+
+    @pytest.mark.asyncio
+    async def test_progress_writes_flush_in_order(self, fake_redis):
+        """Test that queued progress snapshots land in order before flush returns."""
+        job = ICPJobData(
+            job_id=uuid.uuid4(),
+            website_id=uuid.uuid4(),
+            status=ICPJobStatus.RUNNING,
+        )
+        pending = []
+
+        job.progress = 10.0
+        tasks._save_job_in_background(job, pending)
+        job.progress = 30.0
+        tasks._save_job_in_background(job, pending)
+        await tasks._flush_job_writes(pending)
+
+        assert pending == []
+        assert (await get_job(str(job.job_id))).progress == 30.0
+
+
+class TestRegenerateAll:
+    """Tests for bulk ICP regeneration dispatch."""
+
+    def test_dispatches_one_group(self, fake_redis, monkeypatch):
+        """Test that all websites are queued through a single group."""
+        dispatched = []
+
+        class FakeGroup:
+            def __init__(self, signatures):
+                self.signatures = list(signatures)
+
+            def apply_async(self, queue=None):
+                dispatched.append((self.signatures, queue))
+                return type("GroupResult", (), {"id": "group-1"})()
+
+        monkeypatch.setattr(tasks, "group", FakeGroup)
+        website_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+
+        result = tasks.regenerate_all_icps_task(website_ids, "openai")
+
+        assert result["group_id"] == "group-1"
+        assert result["queued"] == 2
+        [(signatures, queue)] = dispatched
+        assert queue == "classification"
+        assert [sig.args[0] for sig in signatures] == website_ids
+        for job in result["jobs"]:
+            assert run_async(get_job(job["job_id"])).status == ICPJobStatus.QUEUED
@@ -352,6 +352,98 @@ class TestBusinessIntelligenceExtractor:
         assert isinstance(result, BusinessIntelligence)
         assert result.company_profile.name == "Example"  # From domain
 
+    def test_html_prefilters(self, extractor):
+        """Test that tagline and product card scans only match their class names."""
+        html = (
+            '<h1 class="Hero-Title">Ship faster</h1>'
+            '<div class="Product-Card"><h3>Acme Rocket</h3></div>'
+        )
+
+        result = extractor.extract(
+            content_text="",
+            html=html,
+            headings=[],
+            structured_data=[],
+            meta_description=None,
+            title=None,
+            domain="acme.com",
+        )
+        plain = extractor.extract(
+            content_text="",
+            html="<div><h3>Acme Rocket</h3></div>",
+            headings=[],
+            structured_data=[],
+            meta_description=None,
+            title=None,
+            domain="acme.com",
+        )
+
+        assert result.company_profile.tagline == "Ship faster"
+        assert [p.name for p in result.products] == ["Acme Rocket"]
+        assert plain.company_profile.tagline is None
+        assert plain.products == []
+
+    def test_keyword_lists_keep_first_mention_order(self, extractor):
+        """Test that technology and certification lists are deduplicated in text order."""
+        technologies = extractor._extract_technologies(
+            "built with python and react, deployed on aws. python again."
+        )
+        certifications = extractor._extract_certifications(
+            "We are GDPR compliant and SOC 2 audited. GDPR compliant everywhere."
+        )
+
+        assert technologies == ["Python", "React", "AWS"]
+        assert certifications == ["GDPR compliant", "SOC 2"]
+
+    def test_target_audience_stops_at_limit(self, extractor):
+        """Test that audience extraction keeps the first 15 pattern signals."""
+        content = " ".join(f"Built for team{i} companies." for i in range(20))
+
+        signals = extractor._extract_target_audience(
+            content, [{"level": "h2", "text": "Analytics for agencies"}]
+        )
+
+        assert len(signals) == 15
+        assert signals[0].segment == "Built for team0 companies"
+        assert all(signal.source != "heading" for signal in signals)
+
+    def test_detect_industry_counts_repeated_keywords(self, extractor):
+        """Test that repeated keyword mentions outweigh single passing ones."""
+        text = "software " * 5 + "hotel travel booking"
+
+        assert extractor._detect_industry(text) == "technology"
+        assert extractor._detect_industry("nothing relevant here") is None
+
+    def test_value_proposition_benefit_types(self, extractor):
+        """Test that each value proposition keeps its pattern's benefit type."""
+        value_props = extractor._extract_value_propositions(
+            "Save up to 10 hours a week. Start a free trial. No code required. "
+            "99.9% uptime. SOC 2 audited.",
+            [],
+        )
+
+        assert [(vp.statement, vp.benefit_type) for vp in value_props] == [
+            ("Save up to 10 hours", "time"),
+            ("Save up to 10", "cost"),
+            ("free trial", "cost"),
+            ("99.9% uptime", "quality"),
+            ("SOC 2", "risk"),
+            ("No code", "convenience"),
+        ]
+
+    def test_overlapping_value_propositions(self, extractor):
+        """Test that matches overlapping another pattern's match are kept."""
+        value_props = extractor._extract_value_propositions(
+            "Automate secure workflows. Save 10 hours. Streamline compliant reporting.",
+            [],
+        )
+
+        found = {(vp.statement, vp.benefit_type) for vp in value_props}
+        assert ("Automate secure", "time") in found
+        assert ("secure", "risk") in found
+        assert ("compliant", "risk") in found
+        assert ("Save 10", "cost") in found
+
 
 class TestBusinessIntelligenceDataClasses:
     """Test data classes for business intelligence."""
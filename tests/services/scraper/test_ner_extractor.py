@@ -298,3 +298,50 @@ class TestNERExtractorWithSpaCy:
         # If spaCy is working, should find organizations
         orgs = result.get_all_organizations()
         assert len(orgs) >= 0  # May find orgs if spaCy is available
+
+
+class TestSpacyModelCache:
+    """Test that the spaCy model is loaded once per process."""
+
+    def test_extractors_share_loaded_model(self, monkeypatch):
+        """Test that new extractors reuse the already loaded pipeline."""
+        from services.scraper.components import ner_extractor
+
+        loads = []
+
+        class FakeSpacy:
+            @staticmethod
+            def load(name):
+                loads.append(name)
+                return object()
+
+        monkeypatch.setattr(ner_extractor, "spacy", FakeSpacy, raising=False)
+        monkeypatch.setattr(ner_extractor, "SPACY_AVAILABLE", True)
+        ner_extractor.load_spacy_model.cache_clear()
+
+        try:
+            first = NERExtractor()
+            second = NERExtractor()
+        finally:
+            ner_extractor.load_spacy_model.cache_clear()
+
+        assert loads == [NERExtractor.SPACY_MODEL]
+        assert first._nlp is second._nlp
+
+    def test_warm_up_never_downloads(self, monkeypatch):
+        """Test that a missing model is skipped at warm-up instead of downloaded."""
+        from services.scraper.components import ner_extractor
+
+        class FakeSpacy:
+            @staticmethod
+            def load(name):
+                raise OSError(f"Can't find model '{name}'")
+
+        monkeypatch.setattr(ner_extractor, "spacy", FakeSpacy, raising=False)
+        monkeypatch.setattr(ner_extractor, "SPACY_AVAILABLE", True)
+        ner_extractor.load_spacy_model.cache_clear()
+
+        try:
+            assert ner_extractor.warm_spacy_model(NERExtractor.SPACY_MODEL) is False
+        finally:
+            ner_extractor.load_spacy_model.cache_clear()
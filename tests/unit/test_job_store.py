@@ -0,0 +1,75 @@
+"""Tests for the Redis-backed job store."""
+
+import pytest
+
+from shared.queue.job_store import RedisJobStore
+
+
+@pytest.fixture
+def store(fake_redis_client) -> RedisJobStore:
+    """Job store backed by the in-memory Redis client."""
+    return RedisJobStore(
+        "test:job", list_fields=("urls",), ttl_seconds=60, client=fake_redis_client
+    )
+
+
+class TestRedisJobStore:
+    """Test job storage and partial updates."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_get(self, store, fake_redis_client):
+        """Test that a saved job round-trips with its list fields."""
+        await store.save("1", {"status": "queued", "done": 0, "error": None, "urls": ["a", "b"]})
+
+        assert await store.get("1") == {"status": "queued", "done": "0", "urls": ["a", "b"]}
+        assert fake_redis_client.expiry == {"test:job:1": 60, "test:job:1:urls": 60}
+
+    @pytest.mark.asyncio
+    async def test_get_missing_job(self, store):
+        """Test that unknown jobs return None."""
+        assert await store.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_exists(self, store):
+        """Test the existence check used by workers instead of loading the job."""
+        await store.save("1", {"status": "queued"})
+
+        assert await store.exists("1") is True
+        assert await store.exists("2") is False
+
+    @pytest.mark.asyncio
+    async def test_save_replaces_previous_lists(self, store):
+        """Test that saving a job again does not duplicate list items."""
+        await store.save("1", {"status": "queued", "urls": ["a"]})
+        await store.save("1", {"status": "running", "urls": ["a"]})
+
+        assert (await store.get("1"))["urls"] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_update_in_one_round_trip(self, store, fake_redis_client):
+        """Test that a progress update sets, increments, and appends together."""
+        await store.save("1", {"status": "running", "done": 0, "failed": 0})
+        round_trips = fake_redis_client.round_trips
+
+        await store.update(
+            "1",
+            fields={"done": 3},
+            increments={"failed": 1},
+            appends={"urls": ["c"]},
+        )
+
+        assert fake_redis_client.round_trips == round_trips + 1
+        assert await store.get("1") == {
+            "status": "running",
+            "done": "3",
+            "failed": "1",
+            "urls": ["c"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_close_releases_client(self, store, fake_redis_client):
+        """Test that closing the store closes its Redis client."""
+        await store.close()
+
+        assert fake_redis_client.closed
+        assert store._client is None
@@ -0,0 +1,97 @@
+"""Tests for Neo4j client module."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from neo4j import READ_ACCESS, WRITE_ACCESS
+
+from shared.db.neo4j_client import Neo4jClient
+
+
+class TestNeo4jClientSessions:
+    """Test Neo4j session database binding."""
+
+    def test_session_uses_configured_database(self):
+        """Test that sessions default to the configured database."""
+        client = Neo4jClient(database="graph")
+        client._driver = MagicMock()
+
+        client.session()
+
+        client._driver.session.assert_called_once_with(
+            database="graph", default_access_mode=WRITE_ACCESS
+        )
+
+    def test_session_database_override(self):
+        """Test that an explicit database overrides the configured one."""
+        client = Neo4jClient(database="graph")
+        client._driver = MagicMock()
+
+        client.session(database="other")
+
+        client._driver.session.assert_called_once_with(
+            database="other", default_access_mode=WRITE_ACCESS
+        )
+
+    def test_session_read_access_mode(self):
+        """Test that read sessions are opened in READ access mode."""
+        client = Neo4jClient(database="graph")
+        client._driver = MagicMock()
+
+        client.session(access_mode=READ_ACCESS)
+
+        client._driver.session.assert_called_once_with(
+            database="graph", default_access_mode=READ_ACCESS
+        )
+
+    def test_pool_settings_default_to_config(self):
+        """Test that pool sizing falls back to settings."""
+        client = Neo4jClient()
+
+        assert client._max_connection_pool_size == 100
+        assert client._connection_acquisition_timeout == 60.0
+
+
+class TestNeo4jClientStreaming:
+    """Test streamed query results."""
+
+    @pytest.mark.asyncio
+    async def test_stream_query_yields_record_dicts(self):
+        """Test that stream_query yields each record as a dict."""
+
+        class FakeRecord:
+            def __init__(self, data):
+                self._data = data
+
+            def data(self):
+                return self._data
+
+        class FakeResult:
+            def __aiter__(self):
+                async def records():
+                    for value in (1, 2):
+                        yield FakeRecord({"value": value})
+
+                return records()
+
+        session = MagicMock()
+        session.run = AsyncMock(return_value=FakeResult())
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+
+        client = Neo4jClient(database="graph")
+        client._driver = MagicMock()
+        client._driver.session.return_value = session
+
+        rows = [
+            row async for row in client.stream_query(
+                "MATCH (n) RETURN n", {}, access_mode=READ_ACCESS
+            )
+        ]
+
+        assert rows == [{"value": 1}, {"value": 2}]
+        client._driver.session.assert_called_once_with(
+            database="graph", default_access_mode=READ_ACCESS
+        )
+        session.run.assert_awaited_once_with("MATCH (n) RETURN n", {})
@@ -1,8 +1,12 @@
 """Tests for utility modules."""
 
+import time
+import uuid
+
 import pytest
 
 from shared.utils.hashing import hash_password, hash_url, verify_password
+from shared.utils.ids import uuid7
 from shared.utils.jwt import create_access_token, create_refresh_token, decode_token
 
 
@@ -40,6 +44,33 @@ class TestHashing:
         assert hashed == hash_url(url)  # Deterministic
 
 
+class TestIds:
+    """Test identifier utilities."""
+
+    def test_uuid7_version_and_variant(self):
+        """Test that uuid7 produces RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_uuid7_embeds_timestamp(self):
+        """Test that the leading 48 bits hold the current Unix time in ms."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_uuid7_sorts_by_time(self):
+        """Test that UUIDs from later milliseconds sort later."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
+
+
 class TestJWT:
     """Test JWT utilities."""
 
@@ -0,0 +1,38 @@
+"""Tests for the Celery worker event loop helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from shared.queue import worker_loop
+
+
+class TestWorkerLoop:
+    """Test the persistent worker event loop."""
+
+    def test_run_async_reuses_loop(self):
+        """Test that consecutive tasks run on the same event loop."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = worker_loop.run_async(current_loop())
+        second = worker_loop.run_async(current_loop())
+
+        assert first is second
+        assert not first.is_closed()
+
+    def test_get_worker_postgres_connects_once(self, monkeypatch):
+        """Test that the PostgreSQL pool is opened only on first use."""
+        client = MagicMock()
+        client.is_connected = False
+
+        async def connect():
+            client.is_connected = True
+
+        client.connect = AsyncMock(side_effect=connect)
+        monkeypatch.setattr(worker_loop, "get_postgres_client", lambda: client)
+
+        worker_loop.run_async(worker_loop.get_worker_postgres())
+        worker_loop.run_async(worker_loop.get_worker_postgres())
+
+        client.connect.assert_awaited_once()